@@ -11,47 +11,72 @@ Quick status check for the running bot including:
 
 import os
 import sys
-import subprocess
+import time
 from pathlib import Path
 from datetime import datetime
 import csv
+import io
+import re
 
 PROJECT_ROOT = Path(__file__).parent
 BOT_PID_FILE = PROJECT_ROOT / "bot.pid"
 LOG_DIR = PROJECT_ROOT / "logs"
 TRADES_FILE = PROJECT_ROOT / "data" / "live_trades.csv"
+USDC_ADDRESS = '0x2791Bca1f2de4661ED88A30C99A7a9449Aa84174'
+BALANCE_OF_SELECTOR = "0x70a08231"  # balanceOf(address)
+ADDRESS_RE = re.compile(r"0x[0-9a-fA-F]{40}")
+
+def _balance_of_calldata(owner):
+    """Build balanceOf(owner) calldata: selector + address left-padded to 32 bytes"""
+    if not ADDRESS_RE.fullmatch(owner):
+        raise ValueError(f"Invalid address: {owner!r}")
+    return BALANCE_OF_SELECTOR + owner.lower().removeprefix("0x").rjust(64, "0")
+
+def _parse_etime(etime_str):
+    """Parse ps etime ([[DD-]hh:]mm:ss, or plain ss) into total seconds"""
+    etime_str = etime_str.strip()
+    days = 0
+    if '-' in etime_str:
+        day_part, etime_str = etime_str.split('-', 1)
+        days = int(day_part)
+    parts = [int(p) for p in etime_str.split(':')]
+    while len(parts) < 3:
+        parts.insert(0, 0)
+    hours, minutes, seconds = parts
+    return days * 86400 + hours * 3600 + minutes * 60 + seconds
+
+def _format_duration(total_seconds):
+    """Format a duration in seconds as 'Xh Ym'"""
+    return f"{total_seconds // 3600}h {total_seconds % 3600 // 60}m"
 
 def format_uptime(etime_str):
     """Format ps etime output to simple hours and minutes only"""
     if etime_str == 'N/A' or not etime_str:
         return 'N/A'
     
-    # ps etime format: [[DD-]hh:]mm:ss or mm:ss
-    parts = etime_str.split(':')
+    try:
+        return _format_duration(_parse_etime(etime_str))
+    except ValueError:
+        return etime_str
+
+def _process_uptime_seconds(pid):
+    """Return process uptime in seconds without forking ps (None if unknown)"""
+    proc_stat = Path(f"/proc/{pid}/stat")
+    if proc_stat.exists():
+        # Fields after the ")" that closes the command name start at field 3 (state);
+        # starttime is field 22, in clock ticks since boot
+        fields = proc_stat.read_text().rsplit(')', 1)[1].split()
+        start_ticks = int(fields[19])
+        with open("/proc/stat") as f:
+            btime = next(int(line.split()[1]) for line in f if line.startswith("btime"))
+        return time.time() - (btime + start_ticks / os.sysconf('SC_CLK_TCK'))
     
-    if len(parts) == 2:
-        # mm:ss format - convert to hours and minutes
-        minutes = int(parts[0])
-        hours = minutes // 60
-        mins = minutes % 60
-        if hours > 0:
-            return f"{hours}h {mins}m"
-        else:
-            return f"{mins}m"
-    elif len(parts) == 3:
-        # hh:mm:ss format - just use hours and minutes
-        hours, minutes, seconds = parts
-        return f"{int(hours)}h {int(minutes)}m"
-    elif '-' in etime_str:
-        # DD-hh:mm:ss format
-        day_part, time_part = etime_str.split('-', 1)
-        days = int(day_part)
-        time_parts = time_part.split(':')
-        if len(time_parts) == 3:
-            hours, minutes, seconds = time_parts
-            total_hours = (days * 24) + int(hours)
-            return f"{total_hours}h {int(minutes)}m"
-    return etime_str
+    # Non-Linux: fall back to psutil if it is installed
+    try:
+        import psutil
+        return time.time() - psutil.Process(pid).create_time()
+    except ImportError:
+        return None
 
 def check_process():
     """Check if bot process is running and calculate session uptime"""
@@ -60,23 +85,36 @@ def check_process():
     
     try:
         pid = int(BOT_PID_FILE.read_text().strip())
-        # Check if process exists and get elapsed time
-        result = subprocess.run(
-            ["ps", "-p", str(pid), "-o", "etime="],
-            capture_output=True,
-            text=True
-        )
-        
-        if result.returncode == 0:
-            etime = result.stdout.strip()
-            if etime:
-                uptime_formatted = format_uptime(etime)
-                return pid, f"Running (PID: {pid}, Uptime: {uptime_formatted})"
+        # Signal 0 only checks that the process exists
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return pid, "Process not found (may have crashed)"
+        except PermissionError:
+            pass  # Exists but owned by another user
         
-        return pid, "Process not found (may have crashed)"
+        uptime = _process_uptime_seconds(pid)
+        uptime_formatted = _format_duration(int(uptime)) if uptime is not None else 'N/A'
+        return pid, f"Running (PID: {pid}, Uptime: {uptime_formatted})"
     except Exception as e:
         return None, f"Error: {e}"
 
+def _read_tail(path, lines, chunk_size=8192):
+    """Read the last `lines` lines of a file as bytes by seeking backwards from EOF"""
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        end = f.tell()
+        data = b''
+        # Need one extra newline to know the first kept line is complete
+        while end > 0 and data.count(b'\n') <= lines:
+            read_size = min(chunk_size, end)
+            end -= read_size
+            f.seek(end)
+            data = f.read(read_size) + data
+    
+    tail = data.splitlines(keepends=True)
+    return b''.join(tail[-lines:])
+
 def get_recent_logs(lines=20):
     """Get recent log entries"""
     log_files = sorted(LOG_DIR.glob("overnight*.log"), reverse=True)
@@ -84,55 +122,67 @@ def get_recent_logs(lines=20):
         return "No log files found"
     
     try:
-        with open(log_files[0], 'r') as f:
-            all_lines = f.readlines()
-            recent = all_lines[-lines:] if len(all_lines) > lines else all_lines
-            return ''.join(recent)
+        return _read_tail(log_files[0], lines).decode('utf-8', errors='replace')
     except Exception as e:
         return f"Error reading log: {e}"
 
+# Header and last result of get_recent_trades, reused while the file is unchanged
+_trades_cache = {"header": None, "stat": None, "count": None, "trades": None}
+
 def get_recent_trades(count=5):
-    """Get recent trades from CSV"""
+    """Get recent trades from CSV (reads only the header and the last rows)"""
     if not TRADES_FILE.exists():
         return []
     
     try:
-        trades = []
-        with open(TRADES_FILE, 'r') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                trades.append(row)
+        stat = TRADES_FILE.stat()
+        file_key = (stat.st_size, stat.st_mtime_ns)
+        if _trades_cache["stat"] == file_key and _trades_cache["count"] == count:
+            return list(_trades_cache["trades"])
         
-        return trades[-count:] if len(trades) > count else trades
+        if _trades_cache["header"] is None:
+            with open(TRADES_FILE, 'rb') as f:
+                _trades_cache["header"] = f.readline().decode('utf-8')
+        header = _trades_cache["header"]
+        
+        tail = _read_tail(TRADES_FILE, count).decode('utf-8')
+        if not tail.endswith('\n'):
+            tail += '\n'
+        # Small files: the tail may include the header line itself
+        if tail.startswith(header):
+            tail = tail[len(header):]
+        
+        trades = list(csv.DictReader(io.StringIO(header + tail)))
+        _trades_cache.update(stat=file_key, count=count, trades=trades)
+        return list(trades)
     except Exception as e:
         return [{"error": str(e)}]
 
-def get_balance():
-    """Get current balance from blockchain"""
-    try:
+# (web3 client, checksummed USDC address, balanceOf calldata) - built on first balance check
+_balance_ctx = None
+
+def _get_balance_context():
+    """Import web3/decouple and build balance-query inputs once per process"""
+    global _balance_ctx
+    if _balance_ctx is None:
         sys.path.insert(0, str(PROJECT_ROOT))
         from decouple import config
         from web3 import Web3
         
-        w3 = Web3(Web3.HTTPProvider('https://polygon-rpc.com'))
-        USDC_ADDRESS = '0x2791Bca1f2de4661ED88A30C99A7a9449Aa84174'
         funder = config("POLYMARKET_FUNDER_ADDRESS")
-        
-        usdc_abi = [{
-            "constant": True,
-            "inputs": [{"name": "_owner", "type": "address"}],
-            "name": "balanceOf",
-            "outputs": [{"name": "balance", "type": "uint256"}],
-            "type": "function"
-        }]
-        
-        contract = w3.eth.contract(
-            address=Web3.to_checksum_address(USDC_ADDRESS),
-            abi=usdc_abi
+        _balance_ctx = (
+            Web3(Web3.HTTPProvider('https://polygon-rpc.com')),
+            Web3.to_checksum_address(USDC_ADDRESS),
+            _balance_of_calldata(funder)
         )
-        balance_wei = contract.functions.balanceOf(
-            Web3.to_checksum_address(funder)
-        ).call()
+    return _balance_ctx
+
+def get_balance():
+    """Get current balance from blockchain"""
+    try:
+        w3, usdc_address, calldata = _get_balance_context()
+        reply = w3.eth.call({"to": usdc_address, "data": calldata})
+        balance_wei = int.from_bytes(reply, "big")
         balance_usdc = balance_wei / 1e6
         
         return balance_usdc
@@ -1,3 +1,4 @@
+import os
 import time
 import signal
 import sys
@@ -5,13 +6,23 @@ sys.path.insert(0, 'src/core')
 sys.path.insert(0, 'src/trading')
 
 from fetcher import get_btc_price
-from logger import ensure_headers, fetch_with_retry, log_price, get_stats, Colors
+from logger import ensure_headers, fetch_with_retry, log_price, get_stats, flush_console, Colors
 
-INTERVAL = 5
+INTERVAL = float(os.environ.get("LOGGER_INTERVAL", 5))  # Base polling interval (seconds)
+MAX_INTERVAL = float(os.environ.get("LOGGER_MAX_INTERVAL", 30))  # Back-off ceiling when price is flat
+QUIET_EPS = float(os.environ.get("LOGGER_QUIET_EPS", 1e-4))  # Relative move treated as "no change"
+BACKOFF_FACTOR = 1.5
 running = True
+late_ticks = 0  # Ticks where the fetch took longer than the interval
 
 def handle_signal(signum, frame):
+    # Only flip the flag here - the handler can interrupt a console queue put that holds
+    # the queue mutex, so flushing and the summary happen in main() once the loop exits
     global running
+    running = False
+
+def print_summary():
+    flush_console()  # let queued price lines print before the summary
     print(f"\n{Colors.CYAN}{'='*60}{Colors.RESET}")
     print(f"{Colors.YELLOW}Shutting down gracefully...{Colors.RESET}")
     
@@ -21,35 +32,52 @@ def handle_signal(signum, frame):
         print(f"  {Colors.WHITE}•{Colors.RESET} Prices logged: {Colors.BOLD}{stats['count']}{Colors.RESET}")
         print(f"  {Colors.WHITE}•{Colors.RESET} Price range: {Colors.GREEN}${stats['min']:,.2f}{Colors.RESET} - {Colors.RED}${stats['max']:,.2f}{Colors.RESET}")
         print(f"  {Colors.WHITE}•{Colors.RESET} Range span: {Colors.CYAN}${stats['range']:,.2f}{Colors.RESET}")
+    print(f"  {Colors.WHITE}•{Colors.RESET} Late ticks: {Colors.BOLD}{late_ticks}{Colors.RESET}")
     
     print(f"{Colors.CYAN}{'='*60}{Colors.RESET}")
-    running = False
 
 signal.signal(signal.SIGINT, handle_signal)
 signal.signal(signal.SIGTERM, handle_signal)
 
 def main():
+    global late_ticks
     ensure_headers()
     print(f"\n{Colors.CYAN}{'='*60}{Colors.RESET}")
     print(f"{Colors.BOLD}{Colors.WHITE}🚀 BTC Price Logger{Colors.RESET} {Colors.YELLOW}(Production){Colors.RESET}")
     print(f"{Colors.CYAN}{'='*60}{Colors.RESET}")
-    print(f"{Colors.WHITE}•{Colors.RESET} Logging interval: {Colors.BOLD}{INTERVAL}{Colors.RESET} seconds")
+    print(f"{Colors.WHITE}•{Colors.RESET} Logging interval: {Colors.BOLD}{INTERVAL:g}{Colors.RESET} seconds (backs off to {MAX_INTERVAL:g}s when flat)")
     print(f"{Colors.WHITE}•{Colors.RESET} Press {Colors.YELLOW}Ctrl+C{Colors.RESET} to stop")
     print(f"{Colors.CYAN}{'='*60}{Colors.RESET}\n")
     
+    interval = INTERVAL
+    last_price = None
+    # Ticks are scheduled on absolute monotonic deadlines so slow fetches don't accumulate drift
+    next_tick = time.monotonic()
+    
     while running:
-        iteration_start = time.time()
-        
         # Fetch with retry logic
         data = fetch_with_retry(get_btc_price)
         log_price(data)
         
-        # Precise timing - ensure exactly INTERVAL seconds between iterations
-        # This minimizes jitter in timestamp spacing
-        elapsed = time.time() - iteration_start
-        sleep_time = max(0, INTERVAL - elapsed)
-        if sleep_time > 0:
-            time.sleep(sleep_time)
+        # Adaptive polling - back off while the price is flat, reset on movement
+        if data:
+            if last_price and abs(data["price"] - last_price) / last_price < QUIET_EPS:
+                interval = min(interval * BACKOFF_FACTOR, MAX_INTERVAL)
+            else:
+                interval = INTERVAL
+            last_price = data["price"]
+        
+        next_tick += interval
+        now = time.monotonic()
+        if now < next_tick:
+            time.sleep(next_tick - now)
+        else:
+            # Fetch overran the tick - re-anchor instead of rapid-firing to catch up
+            late_ticks += 1
+            print(f"{Colors.YELLOW}[SCHED] Tick overran by {now - next_tick:.1f}s, skipping ahead{Colors.RESET}", flush=True)
+            next_tick = now
+    
+    print_summary()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -40,6 +40,39 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
+def _last_row_timestamp(path, tail_bytes=1024):
+    """
+    Get the timestamp of the last row in a price CSV without parsing the
+    whole file: read the header, then seek near EOF and parse the final line.
+    
+    Returns:
+        datetime of the last row, or None if the file has no data rows
+    """
+    import csv
+    from datetime import datetime, timezone
+    
+    with open(path, 'rb') as f:
+        header = next(csv.reader([f.readline().decode()]), [])
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        f.seek(max(0, size - tail_bytes))
+        lines = f.read().decode(errors='replace').splitlines()
+    
+    if "timestamp" not in header or len(lines) < 2:
+        return None
+    
+    row = next(csv.reader([lines[-1]]), [])
+    col = header.index("timestamp")
+    if len(row) <= col:
+        return None
+    ts = row[col]
+    # Logger timestamps end in "Z": drop it and attach UTC rather than
+    # rewriting the whole string to "+00:00"
+    if ts.endswith('Z'):
+        return datetime.fromisoformat(ts[:-1]).replace(tzinfo=timezone.utc)
+    return datetime.fromisoformat(ts)
+
+
 def check_prerequisites():
     """Check that everything is set up correctly"""
     errors = []
@@ -69,14 +102,13 @@ def check_prerequisites():
         errors.append("❌ No price data found - run main.py first to collect data")
         errors.append("   python main.py  (let it run for a few minutes)")
     else:
-        # Check if data is recent
-        import pandas as pd
+        # Check if data is recent - only the header and last row are read
         from datetime import datetime, timezone, timedelta
         
         try:
-            df = pd.read_csv(data_file)
-            df['timestamp'] = pd.to_datetime(df['timestamp'])
-            latest = df['timestamp'].max()
+            latest = _last_row_timestamp(data_file)
+            if latest is None:
+                raise ValueError("no rows with a timestamp")
             
             # Make latest timezone-aware if it isn't
             if latest.tzinfo is None:
@@ -87,7 +119,7 @@ def check_prerequisites():
                 warnings.append(f"⚠️ Price data is {age.total_seconds()/60:.0f} minutes old")
                 warnings.append("   Run main.py in another terminal to keep data fresh")
             else:
-                print(f"✅ Price data is current ({len(df)} rows, {age.total_seconds():.0f}s old)")
+                print(f"✅ Price data is current ({age.total_seconds():.0f}s old)")
         except Exception as e:
             warnings.append(f"⚠️ Could not check data freshness: {e}")
     
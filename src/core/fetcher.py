@@ -1,177 +1,256 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import sys
 import time
-from datetime import datetime
+from datetime import datetime, timezone
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 try:
     from web3 import Web3
+    from eth_abi import encode as abi_encode, decode as abi_decode
     WEB3_AVAILABLE = True
 except ImportError:
     WEB3_AVAILABLE = False
+# src/utils is imported through the project root, which isn't on sys.path when
+# this module is loaded via a bare `src/core` path entry
+try:
+    from src.utils.fast_json import json_loads
+    from src.utils.ttl_cache import ttl_cache
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+    from src.utils.fast_json import json_loads
+    from src.utils.ttl_cache import ttl_cache
+
+HTTP_TIMEOUT = (2, 5)  # (connect, read) seconds
+
+# Shared session - keeps TCP/TLS connections alive across polls. 429s are not
+# retried (and Retry-After is not slept on): re-sending rate-limited requests
+# gets Binance to escalate to 418 bans, so _get_json penalizes the source instead
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=16,
+    max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504],
+                      respect_retry_after_header=False)
+))
+_SESSION.headers.update({
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+    "Accept-Encoding": "gzip, deflate"
+})
+
+def _iso_utc(t):
+    """Format Unix time `t` as ISO-8601 UTC with a 'Z' suffix (microseconds only if non-zero)."""
+    return datetime.fromtimestamp(t, timezone.utc).isoformat().replace('+00:00', 'Z')
+
+def _utc_now_iso():
+    return _iso_utc(time.time())
+
+RESPONSE_CACHE_TTL = 2.0  # seconds a successful API response is reused
+PENALTY_BASE = 30  # seconds a source is skipped after a rate limit/timeout
+PENALTY_MAX = 300  # cap for the exponential penalty
+
+_penalty_until = {}  # source -> monotonic time until which it is skipped
+_penalty_strikes = {}  # source -> consecutive rate limit/timeout failures
+
+def _is_penalized(source):
+    return time.monotonic() < _penalty_until.get(source, 0)
+
+def _penalize(source):
+    """Skip a source for PENALTY_BASE seconds, doubling per consecutive strike (capped)."""
+    strikes = _penalty_strikes.get(source, 0) + 1
+    _penalty_strikes[source] = strikes
+    delay = min(PENALTY_BASE * 2 ** (strikes - 1), PENALTY_MAX)
+    _penalty_until[source] = time.monotonic() + delay
+    print(f"[BACKOFF] {source} rate limited/timed out, skipping for {delay}s")
+
+def _get_json(source, url):
+    """GET a JSON API through the shared session, tracking rate-limit penalties per source."""
+    if _is_penalized(source):
+        raise RuntimeError(f"{source} is backing off")
+    try:
+        response = _SESSION.get(url, timeout=HTTP_TIMEOUT)
+        response.raise_for_status()
+    except requests.exceptions.HTTPError as e:
+        if e.response is not None and e.response.status_code in (418, 429):
+            _penalize(source)
+        raise
+    except (requests.exceptions.Timeout, requests.exceptions.RetryError):
+        # RetryError: the adapter exhausted its retries on 5xx
+        _penalize(source)
+        raise
+    _penalty_strikes.pop(source, None)
+    return json_loads(response.content)
 
+@ttl_cache(RESPONSE_CACHE_TTL)
 def get_btc_price_binance():
     """Fetch current BTC price from Binance public API."""
     try:
-        response = requests.get(
-            "https://api.binance.com/api/v3/ticker/24hr?symbol=BTCUSDT",
-            timeout=5,
-            headers={"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"}
-        )
-        response.raise_for_status()
-        data = response.json()
+        data = _get_json("Binance", "https://api.binance.com/api/v3/ticker/24hr?symbol=BTCUSDT")
         return {
             "price": float(data["lastPrice"]),
             "volume": float(data["volume"]),
             "source": "Binance",
-            "timestamp": datetime.utcnow().isoformat() + "Z"
+            "timestamp": _utc_now_iso()
         }
     except Exception as e:
         return None
 
 
 
+@ttl_cache(RESPONSE_CACHE_TTL)
 def get_btc_price_coingecko():
     """Fetch current BTC price from CoinGecko API (free, no API key needed)."""
     try:
-        response = requests.get(
-            "https://api.coingecko.com/api/v3/simple/price?ids=bitcoin&vs_currencies=usd&include_24hr_vol=true",
-            timeout=10,
-            headers={"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"}
-        )
-        response.raise_for_status()
-        data = response.json()
+        data = _get_json("CoinGecko", "https://api.coingecko.com/api/v3/simple/price?ids=bitcoin&vs_currencies=usd&include_24hr_vol=true")
         btc_data = data["bitcoin"]
         return {
             "price": float(btc_data["usd"]),
             "volume": float(btc_data.get("usd_24h_vol", 0)),
             "source": "CoinGecko",
-            "timestamp": datetime.utcnow().isoformat() + "Z"
+            "timestamp": _utc_now_iso()
         }
     except Exception as e:
         return None
 
+# Chainlink BTC/USD Price Feed contract address on Polygon
+# This is the official Chainlink aggregator for BTC/USD on Polygon.
+# Stored EIP-55 checksummed - web3 rejects mixed-case addresses with a bad checksum
+CHAINLINK_BTC_USD_FEED = "0xC907E116054ad103354f0D35050B556F00A8d2aD"
+# Using public RPC - you can also use Alchemy, Infura, or QuickNode for better reliability
+POLYGON_RPC = "https://polygon-rpc.com"
+
+# Precomputed 4-byte function selectors (first 4 bytes of keccak256 of the signature)
+LATEST_ROUND_DATA_SELECTOR = "0xfeaf968c"  # latestRoundData()
+DECIMALS_SELECTOR = "0x313ce567"  # decimals()
+
+# Seconds an on-chain Chainlink read is reused before querying the RPC again
+CHAINLINK_CACHE_TTL = 2.0
+
+_chainlink_cache = {"ts": 0.0, "data": None, "updated_at": None}
+_chainlink_decimals = None
+
+# Multicall3 is deployed at the same address on every major chain, including Polygon
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+AGGREGATE3_SELECTOR = bytes.fromhex("82ad56cb")  # aggregate3((address,bool,bytes)[])
+
+# Shared Polygon client, built once at import - constructing it does not touch the network
+POLYGON_W3 = Web3(Web3.HTTPProvider(POLYGON_RPC, request_kwargs={'timeout': 10})) if WEB3_AVAILABLE else None
+
+def _eth_call(w3, to, data):
+    """Raw eth_call against `to` with prebuilt calldata, returning the reply bytes."""
+    return bytes(w3.eth.call({"to": to, "data": data}))
+
+def _multicall(w3, calls):
+    """Run several (target, calldata) eth_calls in a single Multicall3 aggregate3 round trip.
+    
+    Sub-calls do not allow failure, so any revert fails the whole batch.
+    Returns the reply bytes of each call, in order.
+    """
+    batch = [(target, False, bytes.fromhex(data[2:])) for target, data in calls]
+    payload = AGGREGATE3_SELECTOR + abi_encode(["(address,bool,bytes)[]"], [batch])
+    reply = _eth_call(w3, MULTICALL3_ADDRESS, "0x" + payload.hex())
+    (results,) = abi_decode(["(bool,bytes)[]"], reply)
+    return [return_data for _, return_data in results]
+
+def _decode_latest_round_data(reply):
+    """Decode latestRoundData() return: five 32-byte words, `answer` is signed."""
+    words = [reply[i:i + 32] for i in range(0, 160, 32)]
+    round_id = int.from_bytes(words[0], "big")
+    answer = int.from_bytes(words[1], "big", signed=True)
+    started_at = int.from_bytes(words[2], "big")
+    updated_at = int.from_bytes(words[3], "big")
+    answered_in_round = int.from_bytes(words[4], "big")
+    return round_id, answer, started_at, updated_at, answered_in_round
+
 def get_btc_price_chainlink():
     """Fetch current BTC price from Chainlink Data Streams on Polygon - same as Polymarket uses.
     
     Polymarket uses Chainlink Data Streams for low-latency, timestamped BTC/USD pricing on Polygon
     for resolving 15-minute "Up or Down" markets. This function queries the on-chain Chainlink
-    aggregator contract directly.
+    aggregator contract directly. On-chain reads are cached for CHAINLINK_CACHE_TTL seconds.
     """
+    global _chainlink_decimals
+    
     if not WEB3_AVAILABLE:
         # Fallback to Redstone API if web3 is not available
         try:
-            response = requests.get(
-                "https://api.redstone.finance/prices?symbols=BTC",
-                timeout=10,
-                headers={"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"}
-            )
-            response.raise_for_status()
-            data = response.json()
+            data = _get_json("Redstone", "https://api.redstone.finance/prices?symbols=BTC")
             btc_data = data.get("BTC", {})
             price = float(btc_data.get("value", 0))
             return {
                 "price": price,
                 "volume": 0,
                 "source": "Chainlink",
-                "timestamp": datetime.utcnow().isoformat() + "Z"
+                "timestamp": _utc_now_iso()
             }
         except:
             return None
     
+    # Serve from cache while fresh - the feed only updates on heartbeat/deviation
+    now = time.monotonic()
+    cached = _chainlink_cache["data"]
+    if cached and now - _chainlink_cache["ts"] < CHAINLINK_CACHE_TTL:
+        return dict(cached)
+    
     try:
-        # Connect to Polygon RPC endpoint
-        # Using public RPC - you can also use Alchemy, Infura, or QuickNode for better reliability
-        polygon_rpc = "https://polygon-rpc.com"
-        w3 = Web3(Web3.HTTPProvider(polygon_rpc, request_kwargs={'timeout': 10}))
-        
-        if not w3.is_connected():
-            return None
+        w3 = POLYGON_W3
         
-        # Chainlink BTC/USD Price Feed contract address on Polygon
-        # This is the official Chainlink aggregator for BTC/USD on Polygon
-        btc_usd_feed_address = "0xc907E116054Ad103354f0D35050b556f00A8d2aD"
-        
-        # Simplified Chainlink Aggregator ABI (only the function we need)
-        aggregator_abi = [
-            {
-                "inputs": [],
-                "name": "latestRoundData",
-                "outputs": [
-                    {"name": "roundId", "type": "uint80"},
-                    {"name": "answer", "type": "int256"},
-                    {"name": "startedAt", "type": "uint256"},
-                    {"name": "updatedAt", "type": "uint256"},
-                    {"name": "answeredInRound", "type": "uint80"}
-                ],
-                "stateMutability": "view",
-                "type": "function"
-            },
-            {
-                "inputs": [],
-                "name": "decimals",
-                "outputs": [{"name": "", "type": "uint8"}],
-                "stateMutability": "view",
-                "type": "function"
-            }
-        ]
-        
-        # Get contract instance
-        contract = w3.eth.contract(
-            address=Web3.to_checksum_address(btc_usd_feed_address),
-            abi=aggregator_abi
-        )
-        
-        # Fetch latest price data
-        latest_data = contract.functions.latestRoundData().call()
+        # Fetch latest price data. Decimals (usually 8 for BTC/USD) are immutable, so
+        # they ride along in one Multicall3 batch on the first call only.
+        if _chainlink_decimals is None:
+            round_reply, decimals_reply = _multicall(w3, [
+                (CHAINLINK_BTC_USD_FEED, LATEST_ROUND_DATA_SELECTOR),
+                (CHAINLINK_BTC_USD_FEED, DECIMALS_SELECTOR)
+            ])
+            _chainlink_decimals = int.from_bytes(decimals_reply, "big")
+        else:
+            round_reply = _eth_call(w3, CHAINLINK_BTC_USD_FEED, LATEST_ROUND_DATA_SELECTOR)
+        latest_data = _decode_latest_round_data(round_reply)
         
         # Extract data: (roundId, answer, startedAt, updatedAt, answeredInRound)
         round_id, answer, started_at, updated_at, answered_in_round = latest_data
         
-        # Get decimals (usually 8 for BTC/USD)
-        decimals = contract.functions.decimals().call()
+        # Same round as the cached one - just extend its freshness
+        if cached and updated_at == _chainlink_cache["updated_at"]:
+            _chainlink_cache["ts"] = now
+            return dict(cached)
         
         # Convert answer to price (Chainlink returns price with decimals)
-        price = float(answer) / (10 ** decimals)
+        price = float(answer) / (10 ** _chainlink_decimals)
         
         # Convert timestamp from Unix to ISO format
-        timestamp = datetime.utcfromtimestamp(updated_at).isoformat() + "Z"
+        timestamp = _iso_utc(updated_at)
         
-        return {
+        result = {
             "price": price,
             "volume": 0,  # Chainlink feeds don't include volume
             "source": "Chainlink",
             "timestamp": timestamp
         }
+        _chainlink_cache.update(ts=now, data=result, updated_at=updated_at)
+        return dict(result)
     except Exception as e:
         # If on-chain query fails, fallback to Redstone API
         try:
-            response = requests.get(
-                "https://api.redstone.finance/prices?symbols=BTC",
-                timeout=10,
-                headers={"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"}
-            )
-            response.raise_for_status()
-            data = response.json()
+            data = _get_json("Redstone", "https://api.redstone.finance/prices?symbols=BTC")
             btc_data = data.get("BTC", {})
             price = float(btc_data.get("value", 0))
             return {
                 "price": price,
                 "volume": 0,
                 "source": "Chainlink",
-                "timestamp": datetime.utcnow().isoformat() + "Z"
+                "timestamp": _utc_now_iso()
             }
         except:
             return None
 
+@ttl_cache(RESPONSE_CACHE_TTL)
 def get_btc_price_cryptocompare():
     """Fetch current BTC price from CryptoCompare API."""
     try:
         # Use pricemultifull endpoint which includes volume data
-        response = requests.get(
-            "https://min-api.cryptocompare.com/data/pricemultifull?fsyms=BTC&tsyms=USD",
-            timeout=10,
-            headers={"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"}
-        )
-        response.raise_for_status()
-        data = response.json()
+        data = _get_json("CryptoCompare", "https://min-api.cryptocompare.com/data/pricemultifull?fsyms=BTC&tsyms=USD")
         
         # Extract price and volume from RAW data
         btc_data = data["RAW"]["BTC"]["USD"]
@@ -182,60 +261,105 @@ def get_btc_price_cryptocompare():
             "price": price,
             "volume": volume,
             "source": "CryptoCompare",
-            "timestamp": datetime.utcnow().isoformat() + "Z"
+            "timestamp": _utc_now_iso()
         }
     except Exception as e:
         return None
 
+@ttl_cache(RESPONSE_CACHE_TTL)
 def get_btc_price_coincap():
     """Fetch current BTC price from CoinCap API."""
     try:
-        response = requests.get(
-            "https://api.coincap.io/v2/assets/bitcoin",
-            timeout=10,
-            headers={"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"}
-        )
-        response.raise_for_status()
-        data = response.json()
+        data = _get_json("CoinCap", "https://api.coincap.io/v2/assets/bitcoin")
         btc_data = data["data"]
         return {
             "price": float(btc_data["priceUsd"]),
             "volume": float(btc_data.get("volumeUsd24Hr", 0)),
             "source": "CoinCap",
-            "timestamp": datetime.utcnow().isoformat() + "Z"
+            "timestamp": _utc_now_iso()
         }
     except Exception as e:
         return None
 
+# APIs in order of preference (CryptoCompare first - provides real-time updates with volume)
+PRICE_SOURCES = [
+    ("CryptoCompare", get_btc_price_cryptocompare),
+    ("Chainlink", get_btc_price_chainlink),
+    ("Binance", get_btc_price_binance),
+    ("CoinCap", get_btc_price_coincap),
+    ("CoinGecko", get_btc_price_coingecko)
+]
+
+FETCH_TIMEOUT = 6  # seconds to wait for any source to answer
+PREFERENCE_GRACE = 0.2  # seconds to wait for a preferred source after the first answer
+
+# Shared pool - sized so a slow source from the previous tick can't starve the next one
+_executor = ThreadPoolExecutor(max_workers=len(PRICE_SOURCES) * 2, thread_name_prefix="btc-fetch")
+
 def get_btc_price():
-    """Fetch current BTC price with fallback to multiple APIs."""
-    # Try APIs in order of preference (CryptoCompare first - provides real-time updates with volume)
-    apis = [
-        ("CryptoCompare", get_btc_price_cryptocompare),
-        ("Chainlink", get_btc_price_chainlink),
-        ("Binance", get_btc_price_binance),
-        ("CoinCap", get_btc_price_coincap),
-        ("CoinGecko", get_btc_price_coingecko)
-    ]
+    """Fetch current BTC price from all APIs concurrently.
     
+    Returns the first valid result, unless a more preferred source also answers
+    within PREFERENCE_GRACE seconds of it, in which case that one is used.
+    Sources that recently hit a rate limit or timeout are skipped until their
+    penalty expires.
+    """
+    # Sources backing off after a rate limit/timeout are skipped entirely
+    futures = {
+        _executor.submit(api_func): (rank, api_name)
+        for rank, (api_name, api_func) in enumerate(PRICE_SOURCES)
+        if not _is_penalized(api_name)
+    }
+    pending = set(futures)
+    deadline = time.monotonic() + FETCH_TIMEOUT
+    best_rank, best_result = None, None
     last_error = None
-    for api_name, api_func in apis:
-        try:
-            result = api_func()
-            if result:
-                return result
-            else:
-                print(f"[FAIL] {api_name} failed, trying next...")
-        except requests.exceptions.Timeout:
-            print(f"[FAIL] {api_name} timed out, trying next...")
-            last_error = "Timeout"
-        except requests.exceptions.ConnectionError as e:
-            print(f"[FAIL] {api_name} connection error, trying next...")
-            last_error = "Connection error"
-        except Exception as e:
-            last_error = str(e)
-            print(f"[FAIL] {api_name} error: {last_error}, trying next...")
     
+    while pending:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+        
+        for fut in done:
+            rank, api_name = futures[fut]
+            try:
+                result = fut.result()
+            except requests.exceptions.Timeout:
+                print(f"[FAIL] {api_name} timed out")
+                last_error = "Timeout"
+                continue
+            except requests.exceptions.ConnectionError:
+                print(f"[FAIL] {api_name} connection error")
+                last_error = "Connection error"
+                continue
+            except Exception as e:
+                last_error = str(e)
+                print(f"[FAIL] {api_name} error: {last_error}")
+                continue
+            
+            if not result:
+                print(f"[FAIL] {api_name} failed")
+                continue
+            
+            if best_rank is None:
+                # First valid answer - give preferred sources a short grace window
+                deadline = min(deadline, time.monotonic() + PREFERENCE_GRACE)
+            if best_rank is None or rank < best_rank:
+                best_rank, best_result = rank, result
+        
+        if best_rank == 0:
+            break
+    
+    # Sources still in flight are abandoned; queued ones are cancelled
+    for fut in pending:
+        fut.cancel()
+    
+    if best_result:
+        return best_result
+    
+    if last_error is None and pending:
+        last_error = "Timeout"
     print(f"Error: All APIs failed to fetch BTC price. Last error: {last_error}")
     return None
 
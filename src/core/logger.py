@@ -1,5 +1,10 @@
+import atexit
 import csv
 import os
+import queue
+import sys
+import tempfile
+import threading
 import time
 from datetime import datetime, timedelta
 from collections import deque
@@ -29,239 +34,411 @@ class Colors:
     DOWN_ARROW = 'v'
     NEUTRAL = '-'
 
+# Console line templates, built once from the color codes
+_LINE_PREFIX = (f"{Colors.CYAN}[{{interval}}]{Colors.RESET} "
+                f"{Colors.CYAN}[{{time}}]{Colors.RESET} "
+                f"{Colors.BOLD}{Colors.WHITE}{{price}}{Colors.RESET} ")
+_LINE_SUFFIX = (f"| {Colors.BLUE}Vol: {{volume}}{Colors.RESET} | "
+                f"{Colors.YELLOW}{{source}}{Colors.RESET}")
+_TEMPLATE_TREND = (_LINE_PREFIX
+                   + f"{{tc}}{{sym}}{Colors.RESET} {{tc}}{{change}}{Colors.RESET} "
+                   + _LINE_SUFFIX)
+_TEMPLATE_NO_TREND = _LINE_PREFIX + _LINE_SUFFIX
+_TEMPLATE_LATENCY = f" {Colors.WHITE}({{latency}}){Colors.RESET}"
+_TEMPLATE_FAILED = f"{Colors.RED}[{{interval}}] [{{time}}] {Colors.BOLD}FETCH FAILED{Colors.RESET}"
+
 LOG_FILE = "data/btc_prices.csv"
 MAX_RETRIES = 3
 RETRY_DELAY = 2  # seconds between retries
+FLUSH_EVERY_N = 1  # rows between flushes - 1 keeps readers like indicators.py current
+LOG_BUFFER_SIZE = 1 << 16
+CONSOLE_FLUSH_EVERY_N = 32  # console lines between stdout flushes...
+CONSOLE_FLUSH_SECONDS = 0.2  # ...or the longest a line may sit unflushed
+
+EXPECTED_HEADERS = ["id", "interval", "timestamp", "price", "volume_24h", "fetch_latency_ms"]
+_EXPECTED_HEADER_BYTES = ",".join(EXPECTED_HEADERS).encode()
+_headers_checked = False
+
+# Persistent append handle for LOG_FILE (opened lazily by _get_writer)
+_log_fh = None
+_log_writer = None
+_rows_since_flush = 0
+
+# Console lines are written by a background thread so log_price never blocks on stdout
+_console_q = queue.Queue()
+_console_thread = None
 
 # Keep last N prices in memory for quick checks
 price_history = deque(maxlen=100)
 
 # Session ID - same for all entries in a session, increments on new session
 _session_id = None
-_last_entry_timestamp = None
+_last_entry_time = None
+
+# _get_interval results keyed by (UTC hour, quarter-hour)
+_interval_cache = {}
 
-def _get_session_id(timestamp_str):
+# fromisoformat accepts a trailing "Z" from Python 3.11 on
+_FROMISO_HANDLES_Z = sys.version_info >= (3, 11)
+
+# Naive UTC epoch, for building timestamps from time.time_ns()
+_EPOCH = datetime(1970, 1, 1)
+
+# One-entry cache for _parse_ts: (timestamp string, parsed datetime)
+_last_parsed = (None, None)
+
+def _parse_iso(s):
+    """datetime.fromisoformat that accepts a "Z" suffix on every Python version."""
+    return datetime.fromisoformat(s if _FROMISO_HANDLES_Z else s.replace('Z', '+00:00'))
+
+def _parse_ts(timestamp_str):
+    """Parse a logger timestamp ("YYYY-MM-DDTHH:MM:SS[.ffffff]Z") to a naive UTC datetime.
+    
+    Timestamps are always written by fetch_with_retry in that fixed format, so
+    the fields are sliced directly; anything else falls back to fromisoformat.
+    Raises ValueError if the string can't be parsed.
+    """
+    global _last_parsed
+    if timestamp_str == _last_parsed[0]:
+        return _last_parsed[1]
+    
+    s = timestamp_str
+    try:
+        if len(s) not in (20, 27) or s[-1] != 'Z':
+            raise ValueError(s)
+        dt = datetime(int(s[0:4]), int(s[5:7]), int(s[8:10]),
+                      int(s[11:13]), int(s[14:16]), int(s[17:19]),
+                      int(s[20:26]) if len(s) == 27 else 0)
+    except ValueError:
+        dt = _parse_iso(s).replace(tzinfo=None)
+    
+    _last_parsed = (timestamp_str, dt)
+    return dt
+
+def _read_last_entry(path, tail_bytes=4096):
+    """Return (session_id, timestamp_str) of the last row in the price log.
+    
+    Only the header line and the last `tail_bytes` of the file are read, so
+    startup cost doesn't grow with the size of the log.
+    """
+    with open(path, "rb") as f:
+        header = next(csv.reader([f.readline().decode()]), None)
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        start = max(0, size - tail_bytes)
+        f.seek(start)
+        lines = f.read().decode(errors="replace").splitlines()
+    
+    # A partial first line (when we seeked mid-file) or the header isn't a data row
+    lines = lines[1:]
+    
+    # Check if header has 'id' column
+    has_id_column = bool(header) and header[0].lower() == 'id'
+    if header and 'timestamp' in header:
+        ts_col = header.index('timestamp')
+    else:
+        ts_col = 1 if has_id_column else 0  # Old formats
+    
+    last_session_id = 0
+    for row in csv.reader(reversed(lines)):
+        if not row:
+            continue
+        if has_id_column:
+            try:
+                last_session_id = int(row[0])
+            except ValueError:
+                continue
+        return last_session_id, (row[ts_col] if len(row) > ts_col else None)
+    
+    return last_session_id, None
+
+def _get_session_id(timestamp):
     """Get the current session ID, starting a new session if there's a gap.
     
     Session ID is the same for all entries in a single session.
     A new session starts if there's a gap of more than 5 minutes between entries.
+    
+    Args:
+        timestamp: Parsed UTC datetime of the entry being logged, or None if
+            its timestamp couldn't be parsed
     """
-    global _session_id, _last_entry_timestamp
+    global _session_id, _last_entry_time
     
     if _session_id is None:
-        # Initialize from CSV - get the last session ID
+        # Initialize from CSV - get the last session ID from the tail of the file
         if os.path.exists(LOG_FILE):
             try:
-                with open(LOG_FILE, "r", newline="") as f:
-                    reader = csv.reader(f)
-                    header = next(reader, None)
-                    
-                    # Check if header has 'id' column
-                    has_id_column = header and len(header) > 0 and header[0].lower() == 'id'
-                    
-                    last_session_id = 0
-                    last_timestamp_str = None
-                    
-                    for row in reader:
-                        if row and len(row) > 0:
-                            if has_id_column and len(row) > 1:
-                                # New format with ID column
-                                try:
-                                    row_session_id = int(row[0])
-                                    if row_session_id > last_session_id:
-                                        last_session_id = row_session_id
-                                    if len(row) > 1:
-                                        last_timestamp_str = row[1]
-                                except (ValueError, IndexError):
-                                    pass
-                            elif not has_id_column and len(row) > 0:
-                                # Old format - use first column as timestamp
-                                last_timestamp_str = row[0]
-                    
-                    _session_id = last_session_id
-                    _last_entry_timestamp = last_timestamp_str
+                last_session_id, last_timestamp_str = _read_last_entry(LOG_FILE)
+                _session_id = last_session_id
+                try:
+                    _last_entry_time = _parse_ts(last_timestamp_str) if last_timestamp_str else None
+                except ValueError:
+                    _last_entry_time = None
             except:
                 _session_id = 1
-                _last_entry_timestamp = None
+                _last_entry_time = None
         else:
             _session_id = 1
-            _last_entry_timestamp = None
+            _last_entry_time = None
     
     # Check if we need to start a new session (gap > 5 minutes)
-    if _last_entry_timestamp:
-        try:
-            # Parse ISO format timestamps (remove 'Z' if present, handle microseconds)
-            last_time_str = _last_entry_timestamp.replace('Z', '+00:00')
-            current_time_str = timestamp_str.replace('Z', '+00:00')
-            
-            last_time = datetime.fromisoformat(last_time_str)
-            current_time = datetime.fromisoformat(current_time_str)
-            
-            # Calculate gap in seconds
-            gap_seconds = (current_time - last_time).total_seconds()
-            
-            # If gap is more than 5 minutes, start a new session
-            if gap_seconds > 300:  # 5 minutes
-                _session_id += 1
-        except:
-            # If parsing fails, assume same session
-            pass
+    # If either time is unknown, assume same session
+    if _last_entry_time is not None and timestamp is not None:
+        gap_seconds = (timestamp - _last_entry_time).total_seconds()
+        if gap_seconds > 300:  # 5 minutes
+            _session_id += 1
     
-    # Update last entry timestamp
-    _last_entry_timestamp = timestamp_str
+    # Update last entry time
+    _last_entry_time = timestamp
     
     return _session_id
 
-def _get_interval(timestamp_str):
+def _get_interval(timestamp):
     """Calculate 15-minute interval end time in UTC-5 timezone.
     
     Converts UTC timestamp to UTC-5 and returns the interval end time.
     Example: 3:15 AM UTC-5 → "03:30" (end of 3:00-3:15 interval)
     Example: 3:30 AM UTC-5 → "03:45" (end of 3:15-3:30 interval)
     Example: 3:00 AM UTC-5 → "03:15" (end of 3:00-3:15 interval)
+    
+    Args:
+        timestamp: Parsed UTC datetime, or None if it couldn't be parsed
     """
-    try:
-        # Parse UTC timestamp
-        time_str = timestamp_str.replace('Z', '+00:00')
-        utc_time = datetime.fromisoformat(time_str)
-        
-        # Convert to UTC-5 (subtract 5 hours)
-        utc_minus_5 = utc_time - timedelta(hours=5)
-        
-        # Calculate 15-minute interval start, then add 15 minutes for end time
-        # For 3:15 AM, it should be in 3:00-3:15 interval (returns 03:30 as end)
-        minute = utc_minus_5.minute
-        # Floor to nearest 15-minute mark to get interval start
-        interval_start_minute = (minute // 15) * 15
+    if timestamp is None:
+        return "00:15"
+    
+    # The result only depends on the hour and quarter-hour (UTC-5 is a whole-hour
+    # shift), so there are at most 96 distinct answers
+    key = (timestamp.hour, timestamp.minute // 15)
+    cached = _interval_cache.get(key)
+    if cached is not None:
+        return cached
+    
+    # Shift to UTC-5 in minutes-of-day, floor to the quarter-hour, then step
+    # to the interval end - all integer math, wrapping past midnight
+    minutes = (timestamp.hour * 60 + timestamp.minute - 5 * 60) % 1440
+    end = ((minutes // 15) * 15 + 15) % 1440
+    hour, minute = divmod(end, 60)
+    result = _interval_cache[key] = f"{hour:02d}:{minute:02d}"
+    return result
+
+def _get_writer():
+    """Get the persistent csv.writer for LOG_FILE, opening it on first use."""
+    global _log_fh, _log_writer
+    if _log_writer is None:
+        _log_fh = open(LOG_FILE, "a", newline="", buffering=LOG_BUFFER_SIZE)
+        _log_writer = csv.writer(_log_fh)
+    return _log_writer
+
+def _write_row(row):
+    """Append a row to LOG_FILE, flushing every FLUSH_EVERY_N rows."""
+    global _rows_since_flush
+    _get_writer().writerow(row)
+    _rows_since_flush += 1
+    if _rows_since_flush >= FLUSH_EVERY_N:
+        _log_fh.flush()
+        _rows_since_flush = 0
+
+def _close_log():
+    """Flush and close the persistent LOG_FILE handle, if open."""
+    global _log_fh, _log_writer, _rows_since_flush
+    if _log_fh is not None:
+        _log_fh.close()
+    _log_fh = None
+    _log_writer = None
+    _rows_since_flush = 0
+
+atexit.register(_close_log)
+
+def _console_drainer():
+    """Write queued console lines to stdout, flushing in batches."""
+    pending = 0
+    last_flush = time.monotonic()
+    while True:
+        try:
+            line = _console_q.get(timeout=CONSOLE_FLUSH_SECONDS)
+        except queue.Empty:
+            # Idle - push out whatever is still buffered
+            if pending:
+                sys.stdout.flush()
+                pending = 0
+                last_flush = time.monotonic()
+            continue
         
-        # Calculate interval end (start + 15 minutes)
-        interval_end_minute = interval_start_minute + 15
-        if interval_end_minute >= 60:
-            # Handle hour rollover
-            interval_end_minute = interval_end_minute - 60
-            interval_hour = (utc_minus_5.hour + 1) % 24
-        else:
-            interval_hour = utc_minus_5.hour
+        if line is None:
+            sys.stdout.flush()
+            _console_q.task_done()
+            return
         
-        # Format as HH:MM (interval end time)
-        interval_str = utc_minus_5.replace(hour=interval_hour, minute=interval_end_minute, second=0, microsecond=0)
-        return interval_str.strftime("%H:%M")
-    except:
-        # Fallback if parsing fails
-        return "00:15"
+        sys.stdout.write(line + "\n")
+        pending += 1
+        now = time.monotonic()
+        if pending >= CONSOLE_FLUSH_EVERY_N or now - last_flush >= CONSOLE_FLUSH_SECONDS:
+            sys.stdout.flush()
+            pending = 0
+            last_flush = now
+        _console_q.task_done()
+
+def _console(line):
+    """Queue a line for the console, starting the drainer thread on first use."""
+    global _console_thread
+    if _console_thread is None:
+        _console_thread = threading.Thread(target=_console_drainer, name="logger-console", daemon=True)
+        _console_thread.start()
+    _console_q.put_nowait(line)
+
+def flush_console():
+    """Block until every queued console line has been written, then flush stdout."""
+    if _console_thread is not None:
+        _console_q.join()
+    sys.stdout.flush()
+
+def _stop_console():
+    """Drain any queued console lines and stop the drainer thread."""
+    global _console_thread
+    if _console_thread is not None:
+        _console_q.put(None)
+        _console_thread.join(timeout=1.0)
+        _console_thread = None
+
+atexit.register(_stop_console)
+
+def _header_line_ok():
+    """Cheap check of LOG_FILE's first line against EXPECTED_HEADERS, without the csv module."""
+    with open(LOG_FILE, "rb") as f:
+        return f.readline().rstrip(b"\r\n") == _EXPECTED_HEADER_BYTES
 
 def ensure_headers():
-    """Ensure CSV file exists with correct headers."""
-    expected_headers = ["id", "interval", "timestamp", "price", "volume_24h", "fetch_latency_ms"]
+    """Ensure CSV file exists with correct headers (checked once per process)."""
+    global _headers_checked
+    if _headers_checked:
+        return
+    
+    # May rewrite the file below, so drop any handle opened on the old one
+    _close_log()
     
     if not os.path.exists(LOG_FILE):
         # Create new file with headers
         with open(LOG_FILE, "w", newline="") as f:
             writer = csv.writer(f)
-            writer.writerow(expected_headers)
-    else:
-        # Check if header is correct, fix if needed
+            writer.writerow(EXPECTED_HEADERS)
+    elif not _header_line_ok():
+        # Header is wrong - fix it
         with open(LOG_FILE, "r", newline="") as f:
             reader = csv.reader(f)
             first_line = next(reader, None)
-            if first_line != expected_headers:
-                # Read all data
-                f.seek(0)
-                lines = list(csv.reader(f))
-                # Fix header
-                lines[0] = expected_headers
-                
-                # Fix old data rows that don't have interval column
-                # Old format: [id, timestamp, price, volume, latency] or [timestamp, price, volume, latency]
-                # New format: [id, interval, timestamp, price, volume, latency]
-                for i in range(1, len(lines)):
-                    if len(lines[i]) > 0:
-                        # Check if row is missing interval column
-                        if len(lines[i]) == 5 and lines[i][1].startswith('202'):  # Old format without interval
-                            # Insert empty interval after id
-                            lines[i].insert(1, '')
-                        elif len(lines[i]) == 4 and lines[i][0].startswith('202'):  # Very old format without id or interval
-                            # Insert empty id and interval
-                            lines[i].insert(0, '')
-                            lines[i].insert(1, '')
-                
-                # Write back with fixed headers and data
-                with open(LOG_FILE, "w", newline="") as fw:
-                    writer = csv.writer(fw)
-                    writer.writerows(lines)
+            if first_line != EXPECTED_HEADERS:
+                # Stream rows into a temp file beside the log, then swap it in
+                # atomically - memory use stays constant however long the log is
+                tmp = tempfile.NamedTemporaryFile(
+                    mode="w", newline="", delete=False,
+                    dir=os.path.dirname(LOG_FILE) or ".", suffix=".tmp"
+                )
+                try:
+                    with tmp:
+                        writer = csv.writer(tmp)
+                        # Fix header (replaces whatever the first line was)
+                        writer.writerow(EXPECTED_HEADERS)
+                        
+                        # Fix old data rows that don't have interval column
+                        # Old format: [id, timestamp, price, volume, latency] or [timestamp, price, volume, latency]
+                        # New format: [id, interval, timestamp, price, volume, latency]
+                        for row in reader:
+                            if len(row) == 5 and row[1].startswith('202'):  # Old format without interval
+                                # Insert empty interval after id
+                                row.insert(1, '')
+                            elif len(row) == 4 and row[0].startswith('202'):  # Very old format without id or interval
+                                # Insert empty id and interval
+                                row[0:0] = ['', '']
+                            writer.writerow(row)
+                except BaseException:
+                    os.unlink(tmp.name)
+                    raise
+            else:
+                tmp = None
+        
+        # Swap after the source is closed (Windows can't replace an open file)
+        if tmp is not None:
+            os.replace(tmp.name, LOG_FILE)
+    
+    _headers_checked = True
 
 def fetch_with_retry(fetch_func):
     """Try multiple times before giving up."""
     # Capture precise timestamp at start of fetch
-    fetch_start_time = time.time()
+    fetch_start_ns = time.time_ns()
     
     for attempt in range(MAX_RETRIES):
         try:
-            start = time.time()
+            # perf_counter is monotonic, so wall-clock adjustments can't skew latency
+            start = time.perf_counter_ns()
             result = fetch_func()
-            latency = (time.time() - start) * 1000  # ms
+            latency = (time.perf_counter_ns() - start) / 1e6  # ms
             
             if result:
                 result["latency_ms"] = round(latency, 2)
                 # Use precise timestamp from fetch start to ensure uniqueness
                 # This ensures timestamps are unique even for rapid successive calls
-                result["timestamp"] = datetime.utcfromtimestamp(fetch_start_time).isoformat() + "Z"
+                # Keep the datetime too, so log_price never has to parse the string back
+                # Integer microseconds from the epoch - no float rounding
+                result["_ts_dt"] = _EPOCH + timedelta(microseconds=fetch_start_ns // 1000)
+                result["timestamp"] = result["_ts_dt"].isoformat() + "Z"
                 return result
                 
         except Exception as e:
-            print(f"Attempt {attempt + 1} failed: {e}")
+            _console(f"Attempt {attempt + 1} failed: {e}")
             if attempt < MAX_RETRIES - 1:
                 time.sleep(RETRY_DELAY)
     
     return None
 
 def log_price(price_data):
-    timestamp_str = datetime.utcnow().isoformat() + "Z" if price_data is None else price_data["timestamp"]
-    session_id = _get_session_id(timestamp_str)
-    interval = _get_interval(timestamp_str)
+    if price_data is None:
+        timestamp = datetime.utcnow()
+        timestamp_str = timestamp.isoformat() + "Z"
+    else:
+        timestamp_str = price_data["timestamp"]
+        # fetch_with_retry attaches the parsed datetime; parse only for other callers
+        timestamp = price_data.get("_ts_dt")
+        if timestamp is None:
+            try:
+                timestamp = price_data["_ts_dt"] = _parse_ts(timestamp_str)
+            except ValueError:
+                timestamp = None
+    session_id = _get_session_id(timestamp)
+    interval = _get_interval(timestamp)
+    
+    # Extract time-only for display (HH:MM:SS)
+    if timestamp is not None:
+        time_display = timestamp.strftime("%H:%M:%S")
+    else:
+        time_display = timestamp_str[11:19] if len(timestamp_str) > 19 else timestamp_str
     
     if price_data is None:
         # Log failure so you know gaps exist
-        with open(LOG_FILE, "a", newline="") as f:
-            writer = csv.writer(f)
-            writer.writerow([
-                session_id,
-                interval,
-                timestamp_str,
-                "ERROR", "ERROR", "ERROR"
-            ])
-        # Extract time-only for display (HH:MM:SS)
-        try:
-            time_obj = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-            time_display = time_obj.strftime("%H:%M:%S")
-        except:
-            time_display = timestamp_str[11:19] if len(timestamp_str) > 19 else timestamp_str
-        print(f"{Colors.RED}[{interval}] [{time_display}] {Colors.BOLD}FETCH FAILED{Colors.RESET}", flush=True)
+        _write_row([
+            session_id,
+            interval,
+            timestamp_str,
+            "ERROR", "ERROR", "ERROR"
+        ])
+        _console(_TEMPLATE_FAILED.format(interval=interval, time=time_display))
         return
     
     # Store in memory
     price_history.append(price_data)
     
     # Write to disk
-    with open(LOG_FILE, "a", newline="") as f:
-        writer = csv.writer(f)
-        writer.writerow([
-            session_id,
-            interval,
-            price_data["timestamp"],
-            price_data["price"],
-            price_data["volume"],
-            price_data.get("latency_ms", "")
-        ])
+    _write_row([
+        session_id,
+        interval,
+        price_data["timestamp"],
+        price_data["price"],
+        price_data["volume"],
+        price_data.get("latency_ms", "")
+    ])
     
     # Console output with colored trend indicator
-    # Extract time-only for display (HH:MM:SS) - no date
-    try:
-        time_obj = datetime.fromisoformat(price_data['timestamp'].replace('Z', '+00:00'))
-        time_display = time_obj.strftime("%H:%M:%S")
-    except:
-        time_display = price_data['timestamp'][11:19] if len(price_data['timestamp']) > 19 else price_data['timestamp']
-    
     price_str = f"${price_data['price']:,.2f}"
     volume_str = f"${price_data['volume']:,.0f}" if price_data.get('volume', 0) > 0 else "N/A"
     source_str = price_data.get('source', 'Unknown')
@@ -273,21 +450,16 @@ def log_price(price_data):
     price_change = ""
     
     if len(price_history) >= 2:
-        prev_data = list(price_history)[-2]
+        prev_data = price_history[-2]
         prev_price = prev_data["price"]
-        prev_timestamp = prev_data["timestamp"]
         curr_price = price_data["price"]
-        curr_timestamp = price_data["timestamp"]
         
         # Calculate actual time difference in seconds
-        try:
-            prev_time_str = prev_timestamp.replace('Z', '+00:00')
-            curr_time_str = curr_timestamp.replace('Z', '+00:00')
-            prev_time = datetime.fromisoformat(prev_time_str)
-            curr_time = datetime.fromisoformat(curr_time_str)
-            time_diff_seconds = (curr_time - prev_time).total_seconds()
-        except:
-            # Fallback to assuming 1 second if parsing fails
+        prev_time = prev_data.get("_ts_dt")
+        if prev_time is not None and timestamp is not None:
+            time_diff_seconds = (timestamp - prev_time).total_seconds()
+        else:
+            # Fallback to assuming 1 second if parsing failed
             time_diff_seconds = 1.0
         
         # Calculate price change using actual time difference (not assumed intervals)
@@ -318,36 +490,40 @@ def log_price(price_data):
     
     # Format output with colors - show interval and time at beginning (no session ID)
     if trend_symbol:
-        output = (f"{Colors.CYAN}[{interval}]{Colors.RESET} "
-                  f"{Colors.CYAN}[{time_display}]{Colors.RESET} "
-                  f"{Colors.BOLD}{Colors.WHITE}{price_str}{Colors.RESET} "
-                  f"{trend_color}{trend_symbol}{Colors.RESET} "
-                  f"{trend_color}{price_change}{Colors.RESET} | "
-                  f"{Colors.BLUE}Vol: {volume_str}{Colors.RESET} | "
-                  f"{Colors.YELLOW}{source_str}{Colors.RESET}")
+        output = _TEMPLATE_TREND.format(
+            interval=interval, time=time_display, price=price_str,
+            tc=trend_color, sym=trend_symbol, change=price_change,
+            volume=volume_str, source=source_str)
     else:
         # First entry - no trend yet
-        output = (f"{Colors.CYAN}[{interval}]{Colors.RESET} "
-                  f"{Colors.CYAN}[{time_display}]{Colors.RESET} "
-                  f"{Colors.BOLD}{Colors.WHITE}{price_str}{Colors.RESET} | "
-                  f"{Colors.BLUE}Vol: {volume_str}{Colors.RESET} | "
-                  f"{Colors.YELLOW}{source_str}{Colors.RESET}")
+        output = _TEMPLATE_NO_TREND.format(
+            interval=interval, time=time_display, price=price_str,
+            volume=volume_str, source=source_str)
     
     if latency_str:
-        output += f" {Colors.WHITE}({latency_str}){Colors.RESET}"
+        output += _TEMPLATE_LATENCY.format(latency=latency_str)
     
-    print(output, flush=True)
+    _console(output)
 
 def get_stats():
     """Return basic stats from memory."""
     if len(price_history) < 2:
         return None
     
-    prices = [p["price"] for p in price_history]
+    # One pass over the deque for min and max - no intermediate list
+    it = iter(price_history)
+    lo = hi = next(it)["price"]
+    for p in it:
+        v = p["price"]
+        if v < lo:
+            lo = v
+        elif v > hi:
+            hi = v
+    
     return {
-        "count": len(prices),
-        "min": min(prices),
-        "max": max(prices),
-        "range": max(prices) - min(prices),
-        "latest": prices[-1]
+        "count": len(price_history),
+        "min": lo,
+        "max": hi,
+        "range": hi - lo,
+        "latest": price_history[-1]["price"]
     }
\ No newline at end of file
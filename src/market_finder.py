@@ -5,10 +5,23 @@ Uses the Gamma API to find active BTC Up/Down markets.
 Reference: https://docs.polymarket.com/quickstart/fetching-data
 """
 
+import math
+import sys
+import time
 import requests
-import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
+from pathlib import Path
 from typing import Optional, Dict, List, Tuple
+try:
+    from src.utils.fast_json import json_loads
+    from src.utils.ttl_cache import ttl_cache
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+    from src.utils.fast_json import json_loads
+    from src.utils.ttl_cache import ttl_cache
 
 # Polymarket APIs
 GAMMA_API = "https://gamma-api.polymarket.com"
@@ -17,47 +30,88 @@ CLOB_API = "https://clob.polymarket.com"
 # Series ID for BTC Up or Down 15m markets (found via /series endpoint)
 BTC_UP_DOWN_15M_SERIES_ID = 10192
 
+# Max concurrent CLOB price lookups in get_active_btc_markets
+PRICE_FETCH_WORKERS = 16
 
-def get_active_btc_markets(limit: int = 50, interval_type: str = "15m") -> List[Dict]:
+# How long a get_active_btc_markets result is reused (seconds)
+MARKETS_CACHE_TTL = 5
+# How long the Gamma event listing (token IDs, end dates) is reused - it only
+# changes when a new interval's market is listed, unlike the live prices
+EVENTS_CACHE_TTL = 30
+
+# Default trading window (minutes until market end) for get_current_tradeable_market
+TRADE_WINDOW_MIN = 5
+TRADE_WINDOW_MAX = 45
+
+# fromisoformat accepts a trailing "Z" from Python 3.11 on
+_FROMISO_HANDLES_Z = sys.version_info >= (3, 11)
+
+# Shared session - keeps TCP/TLS connections to both APIs alive across calls.
+# 429s fail fast instead of being re-sent after an uncapped Retry-After sleep
+_SESSION = requests.Session()
+for _api in (GAMMA_API, CLOB_API):
+    _SESSION.mount(_api, HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504],
+                          respect_retry_after_header=False)
+    ))
+
+
+def _parse_iso(s: str) -> datetime:
+    """datetime.fromisoformat that accepts a "Z" suffix on every Python version."""
+    return datetime.fromisoformat(s if _FROMISO_HANDLES_Z else s.replace('Z', '+00:00'))
+
+
+@ttl_cache(EVENTS_CACHE_TTL)
+def _get_btc_events(limit: int) -> List[Dict]:
+    """Fetch active BTC Up/Down 15m events (with their token IDs) from Gamma."""
+    # Query events by series_id for BTC Up or Down 15m
+    # This is the correct way per Polymarket API docs
+    resp = _SESSION.get(
+        f"{GAMMA_API}/events",
+        params={
+            "series_id": BTC_UP_DOWN_15M_SERIES_ID,
+            "active": "true",
+            "closed": "false",
+            "limit": limit,
+        },
+        timeout=30
+    )
+    resp.raise_for_status()
+    return json_loads(resp.content)
+
+
+@ttl_cache(MARKETS_CACHE_TTL)
+def get_active_btc_markets(limit: int = 50, interval_type: str = "15m",
+                           min_time_min: float = 0, max_time_min: float = math.inf) -> List[Dict]:
     """
     Get all active BTC Up/Down markets.
     
     Args:
         limit: Max events to fetch
         interval_type: "15m" for 15-minute markets (uses series_id)
+        min_time_min: Skip markets ending sooner than this many minutes
+        max_time_min: Skip markets ending later than this many minutes
     
     Returns:
         List of market dicts with token IDs, sorted by end time
     """
     try:
-        # Query events by series_id for BTC Up or Down 15m
-        # This is the correct way per Polymarket API docs
-        resp = requests.get(
-            f"{GAMMA_API}/events",
-            params={
-                "series_id": BTC_UP_DOWN_15M_SERIES_ID,
-                "active": "true",
-                "closed": "false",
-                "limit": limit,
-            },
-            timeout=30
-        )
-        resp.raise_for_status()
-        events = resp.json()
+        events = _get_btc_events(limit)
         
-        btc_markets = []
-        now = datetime.now(timezone.utc)
+        candidates = []
+        # Plain float seconds - no timedelta per event
+        now_ts = time.time()
         
         for event in events:
-            title = event.get('title', '')
-            
             end_date_str = event.get('endDate', '')
             try:
-                end_date = datetime.fromisoformat(end_date_str.replace('Z', '+00:00'))
-                time_until_end = (end_date - now).total_seconds() / 60  # minutes
+                time_until_end = (_parse_iso(end_date_str).timestamp() - now_ts) / 60.0  # minutes
                 
-                # Skip markets that have already ended
-                if time_until_end <= 0:
+                # Skip markets that have already ended or fall outside the
+                # requested window - before paying for their CLOB prices
+                if time_until_end <= 0 or not (min_time_min <= time_until_end <= max_time_min):
                     continue
                     
             except:
@@ -72,36 +126,46 @@ def get_active_btc_markets(limit: int = 50, interval_type: str = "15m") -> List[
             prices = m.get('outcomePrices')
             
             if clob_tokens:
-                tokens = json.loads(clob_tokens) if isinstance(clob_tokens, str) else clob_tokens
-                price_list = json.loads(prices) if prices and isinstance(prices, str) else prices
+                tokens = json_loads(clob_tokens) if isinstance(clob_tokens, str) else clob_tokens
+                price_list = json_loads(prices) if prices and isinstance(prices, str) else prices
                 
                 if len(tokens) >= 2:
-                    # Get REAL-TIME prices from CLOB API (Gamma prices are cached/stale!)
-                    up_token = tokens[0]
-                    down_token = tokens[1]
-                    
-                    # Fetch live prices
-                    up_price = get_market_price(up_token)
-                    down_price = get_market_price(down_token)
-                    
-                    # Fallback to Gamma prices if CLOB fails
-                    if up_price is None:
-                        up_price = float(price_list[0]) if price_list else 0.5
-                    if down_price is None:
-                        down_price = float(price_list[1]) if price_list and len(price_list) > 1 else 0.5
-                    
-                    btc_markets.append({
-                        'title': title,
-                        'slug': event.get('slug'),
-                        'end_date': end_date_str,
-                        'time_until_end_min': time_until_end,
-                        'up_token': up_token,
-                        'down_token': down_token,
-                        'up_price': up_price,
-                        'down_price': down_price,
-                        'condition_id': m.get('conditionId'),
-                        'outcomes': m.get('outcomes'),
-                    })
+                    candidates.append((event, m, end_date_str, time_until_end, tokens[0], tokens[1], price_list))
+        
+        # Get REAL-TIME prices from CLOB API (Gamma prices are cached/stale!)
+        # One bulk request when possible; otherwise issue the per-token
+        # lookups concurrently since each is an independent round trip
+        token_ids = list({tok for c in candidates for tok in (c[4], c[5])})
+        live_prices = {}
+        if token_ids:
+            live_prices = get_market_prices_bulk(token_ids)
+            if live_prices is None:
+                with ThreadPoolExecutor(max_workers=min(PRICE_FETCH_WORKERS, len(token_ids))) as pool:
+                    live_prices = dict(zip(token_ids, pool.map(get_market_price, token_ids)))
+        
+        btc_markets = []
+        for event, m, end_date_str, time_until_end, up_token, down_token, price_list in candidates:
+            up_price = live_prices.get(up_token)
+            down_price = live_prices.get(down_token)
+            
+            # Fallback to Gamma prices if CLOB fails
+            if up_price is None:
+                up_price = float(price_list[0]) if price_list else 0.5
+            if down_price is None:
+                down_price = float(price_list[1]) if price_list and len(price_list) > 1 else 0.5
+            
+            btc_markets.append({
+                'title': event.get('title', ''),
+                'slug': event.get('slug'),
+                'end_date': end_date_str,
+                'time_until_end_min': time_until_end,
+                'up_token': up_token,
+                'down_token': down_token,
+                'up_price': up_price,
+                'down_price': down_price,
+                'condition_id': m.get('conditionId'),
+                'outcomes': m.get('outcomes'),
+            })
         
         # Sort by end time (soonest first)
         btc_markets.sort(key=lambda x: x['time_until_end_min'])
@@ -115,27 +179,23 @@ def get_active_btc_markets(limit: int = 50, interval_type: str = "15m") -> List[
         return []
 
 
-def get_current_tradeable_market(min_time_remaining: int = 5, max_time_remaining: int = 45) -> Optional[Dict]:
+def get_current_tradeable_market(min_time_remaining: int = TRADE_WINDOW_MIN, max_time_remaining: int = TRADE_WINDOW_MAX,
+                                 limit: int = 50) -> Optional[Dict]:
     """
     Get the current BTC market that's optimal for trading.
     
     Args:
         min_time_remaining: Minimum minutes until market ends (avoid last-minute trades)
         max_time_remaining: Maximum minutes until market ends (trade current interval)
+        limit: Max events to fetch (passed to get_active_btc_markets)
     
     Returns:
         Market dict with token IDs, or None
     """
-    markets = get_active_btc_markets()
-    
-    for market in markets:
-        time_left = market.get('time_until_end_min', 0)
-        
-        # Find market in the optimal trading window
-        if min_time_remaining <= time_left <= max_time_remaining:
-            return market
-    
-    return None
+    # Only markets in the optimal trading window get priced; first to end wins
+    markets = get_active_btc_markets(limit=limit, min_time_min=min_time_remaining,
+                                     max_time_min=max_time_remaining)
+    return markets[0] if markets else None
 
 
 def get_market_price(token_id: str, side: str = "buy") -> Optional[float]:
@@ -150,18 +210,53 @@ def get_market_price(token_id: str, side: str = "buy") -> Optional[float]:
         Price as float, or None
     """
     try:
-        resp = requests.get(
+        resp = _SESSION.get(
             f"{CLOB_API}/price",
             params={"token_id": token_id, "side": side},
             timeout=5
         )
         if resp.status_code == 200:
-            return float(resp.json().get('price', 0))
+            return float(json_loads(resp.content).get('price', 0))
     except:
         pass
     return None
 
 
+def get_market_prices_bulk(token_ids: List[str], side: str = "buy") -> Optional[Dict[str, float]]:
+    """
+    Get current prices for many tokens in one request (CLOB POST /prices).
+    
+    Args:
+        token_ids: CLOB token IDs
+        side: "buy" or "sell"
+    
+    Returns:
+        Dict of token_id -> price (tokens the API didn't price are omitted),
+        or None if the bulk endpoint failed and callers should fall back to
+        get_market_price
+    """
+    try:
+        resp = _SESSION.post(
+            f"{CLOB_API}/prices",
+            json=[{"token_id": t, "side": side.upper()} for t in token_ids],
+            timeout=5
+        )
+        if resp.status_code != 200:
+            return None
+        data = json_loads(resp.content)
+        
+        prices = {}
+        for token_id, value in data.items():
+            # Response maps token_id -> {"BUY": "0.45"} (or a bare price)
+            if isinstance(value, dict):
+                value = value.get(side.upper(), value.get(side))
+            if value is not None:
+                prices[token_id] = float(value)
+        return prices
+    except:
+        return None
+
+
 def get_orderbook(token_id: str) -> Optional[Dict]:
     """
     Get orderbook for a token.
@@ -170,13 +265,13 @@ def get_orderbook(token_id: str) -> Optional[Dict]:
         Dict with bids and asks
     """
     try:
-        resp = requests.get(
+        resp = _SESSION.get(
             f"{CLOB_API}/book",
             params={"token_id": token_id},
             timeout=5
         )
         if resp.status_code == 200:
-            return resp.json()
+            return json_loads(resp.content)
     except:
         pass
     return None
@@ -189,7 +284,7 @@ def print_market_status():
     print(f"{'='*60}")
     print(f"Time: {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')} UTC\n")
     
-    markets = get_active_btc_markets(limit=500, interval_type="15m")
+    markets = get_active_btc_markets(limit=500)
     
     if not markets:
         print("❌ No active BTC markets found")
@@ -224,8 +319,10 @@ def print_market_status():
         
         print()
     
-    # Highlight best market for trading
-    tradeable = get_current_tradeable_market()
+    # Highlight best market for trading - picked from the list above (same
+    # window and order as get_current_tradeable_market) so prices aren't fetched twice
+    tradeable = next((m for m in markets
+                      if TRADE_WINDOW_MIN <= m['time_until_end_min'] <= TRADE_WINDOW_MAX), None)
     if tradeable:
         print(f"{'='*60}")
         print(f"✅ RECOMMENDED MARKET FOR TRADING:")
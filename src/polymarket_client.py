@@ -9,8 +9,12 @@ POLYMARKET_FUNDER_ADDRESS=your_funder_address
 """
 
 import os
-from typing import Optional, Tuple, Dict, List
+import json
+import threading
+from pathlib import Path
+from typing import Optional
 from py_clob_client.client import ClobClient
+from py_clob_client.clob_types import ApiCreds
 from decouple import config # Use decouple to load .env variables
 
 # --- Configuration ---
@@ -29,73 +33,83 @@ SIGNATURE_TYPE = 1  # User signed up with email/Magic wallet
 CHAIN_ID = 137      # Polygon chain ID
 HOST = "https://clob.polymarket.com" # CLOB API endpoint
 
-# --- Initialize ClobClient ---
-client: Optional[ClobClient] = None
+# Derived L2 API credentials, keyed by funder address (delete to force a re-derive)
+CREDS_CACHE_FILE = Path.home() / ".cache" / "polymarket_bot" / "api_creds.json"
 
-if PRIVATE_KEY and FUNDER_ADDRESS:
+# --- Lazily initialized ClobClient (see get_polymarket_client) ---
+_client: Optional[ClobClient] = None
+_client_initialized = False
+_client_lock = threading.Lock()
+
+def _load_api_creds(py_client: ClobClient) -> ApiCreds:
+    """create_or_derive_api_creds, cached on disk so later processes skip the round trip."""
+    try:
+        cached = json.loads(CREDS_CACHE_FILE.read_text())
+        entry = cached.get(FUNDER_ADDRESS)
+        if entry:
+            return ApiCreds(**entry)
+    except (OSError, ValueError, TypeError, AttributeError):
+        cached = {}
+    
+    creds = py_client.create_or_derive_api_creds()
+    try:
+        CREDS_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        cached[FUNDER_ADDRESS] = {
+            "api_key": creds.api_key,
+            "api_secret": creds.api_secret,
+            "api_passphrase": creds.api_passphrase,
+        }
+        # Owner-only: these are live trading credentials
+        fd = os.open(CREDS_CACHE_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            json.dump(cached, f)
+    except OSError as e:
+        print(f"Could not cache API credentials: {e}")
+    return creds
+
+def _create_client() -> ClobClient:
+    """Build the authenticated py-clob-client CLOB client."""
+    py_client = ClobClient(
+        HOST,
+        key=PRIVATE_KEY,
+        chain_id=CHAIN_ID,
+        signature_type=SIGNATURE_TYPE,
+        funder=FUNDER_ADDRESS
+    )
+    # Set API credentials for authenticated requests
+    # This step is crucial for enabling trading actions
+    py_client.set_api_creds(_load_api_creds(py_client))
+    return py_client
+
+def _init_client() -> Optional[ClobClient]:
+    """Create the client if credentials are configured, reporting the outcome."""
+    if not (PRIVATE_KEY and FUNDER_ADDRESS):
+        print("Credentials not found in .env. Polymarket client not initialized.")
+        return None
     try:
-        client = ClobClient(
-            HOST,
-            key=PRIVATE_KEY,
-            chain_id=CHAIN_ID,
-            signature_type=SIGNATURE_TYPE,
-            funder=FUNDER_ADDRESS
-        )
-        # Set API credentials for authenticated requests
-        # This step is crucial for enabling trading actions
-        client.set_api_creds(client.create_or_derive_api_creds())
+        new_client = _create_client()
         print("Polymarket CLOB client initialized successfully.")
+        return new_client
     except Exception as e:
         print(f"Error initializing Polymarket CLOB client: {e}")
-        client = None
-else:
-    print("Credentials not found in .env. Polymarket client not initialized.")
+        return None
 
 
 def get_polymarket_client() -> Optional[ClobClient]:
     """
-    Return the initialized CLOB client instance.
-    Returns None if initialization failed.
+    Return the CLOB client instance, creating it on first call (thread-safe).
+    Returns None if credentials are missing or initialization failed.
     """
-    return client
+    global _client, _client_initialized
+    if not _client_initialized:
+        with _client_lock:
+            if not _client_initialized:
+                _client = _init_client()
+                _client_initialized = True
+    return _client
 
-# --- Helper functions (can be expanded) ---
-
-def get_market_token_id(market_slug: str) -> Optional[str]:
-    """
-    Find a market's token ID using the Gamma API.
-    Needed for placing orders.
-    
-    Args:
-        market_slug: The unique identifier for the market (e.g., 'btc-updown-15m-...')
-    
-    Returns:
-        The token ID string or None if not found.
-    """
-    # This would typically involve fetching from the Gamma API
-    # Example: Gamma API endpoint for markets
-    # gamma_api_url = f"https://gamma-api.polymarket.com/markets?slug={market_slug}"
-    # ... fetch and parse JSON ...
-    print(f"Placeholder: Fetching token ID for slug: {market_slug}")
-    # For now, return a dummy value or implement fetching logic
-    return None # Replace with actual API call
-
-def get_current_btc_15m_market_token_ids() -> Optional[Tuple[str, str]]:
-    """
-    Find the token IDs for CURRENT 15-minute BTC markets (YES/NO).
-    This is tricky as these markets are ephemeral. Might need to poll Gamma API
-    with a search for recurring patterns or recent active markets.
-    
-    Returns: Tuple of (yes_token_id, no_token_id) or None.
-    """
-    print("Placeholder: Searching for current BTC 15m market token IDs...")
-    # Implementation would involve:
-    # 1. Querying Gamma API for active markets with 'BTC' and '15m' in title/slug.
-    # 2. Filtering for the most recent active one.
-    # 3. Extracting token IDs for YES and NO outcomes.
-    # Example search query: https://gamma-api.polymarket.com/markets?limit=5&active=true&tag=crypto&search=BTC
-    # Or more specifically, looking for a series identifier if available.
-    return None # Replace with actual API call and logic
+# Market discovery (token IDs for the current BTC 15m market) lives in
+# market_finder.get_current_tradeable_market
 
 # --- Client Management ---
 def close_polymarket_client():
@@ -18,12 +18,25 @@ The goal: Give Opus the fullest possible picture to make genuinely
 informed decisions, not just react to indicators.
 """
 
+import asyncio
+import atexit
+import functools
+import hashlib
 import os
-import json
+import sys
+import threading
+import time
+import weakref
 import requests
-from datetime import datetime, timezone
+from collections import deque
+from pathlib import Path
 from typing import Dict, Optional, List
 from decouple import config
+try:
+    from src.utils.fast_json import json_loads, json_dumps
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+    from src.utils.fast_json import json_loads, json_dumps
 
 # Import context builder (try both relative and absolute)
 try:
@@ -47,7 +60,73 @@ except ImportError:
     except ImportError:
         CHART_GENERATOR_AVAILABLE = False
 
+# Streamed-reply JSON extraction is shared with the single-model generator
+try:
+    from .ai_signal_generator import StreamedJson
+except ImportError:
+    from ai_signal_generator import StreamedJson
+
+# httpx is optional - with it OpenRouter calls run natively async over a
+# shared keep-alive pool; without it they fall back to requests in a thread
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+# HTTP/2 needs httpx's optional h2 extra
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 OPENROUTER_API_KEY = config("OPENROUTER_API_KEY", default=None)
+OPENROUTER_URL = "https://openrouter.ai/api/v1/chat/completions"
+
+# Shared session for the sync path - keeps the TLS connection to OpenRouter
+# alive between the Sonnet and Opus calls instead of reconnecting per request
+_SESSION = requests.Session()
+
+# Lazily created by get_client(); an AsyncClient is bound to the event loop it
+# was first used on, so there is one per loop: loop -> (client, lifetime agen).
+# See _client_lifetime for how each is closed along with its loop
+_async_clients: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+# get_consensus_signal drives the async path on one long-lived private loop, so
+# the httpx pool survives from one decision to the next
+_sync_loop = None
+_sync_lock = threading.Lock()
+
+# Seconds a model response is reused for an equivalent prompt - short, since
+# a stale trading call is worse than a paid one
+LLM_CACHE_TTL = {"sonnet": 60, "opus": 30}
+# Cache key -> (expires_at, parsed response)
+_llm_cache: Dict[str, tuple] = {}
+# Speculative context/chart builds (started before Sonnet answers) allowed per
+# rolling hour - caps the work wasted when the pre-filter then rejects
+SPECULATION_BUDGET_PER_HOUR = 20
+_speculation_times: deque = deque()
+
+# Models whose stream is dropped as soon as the decision JSON closes. Closing
+# an unfinished HTTP/1.1 response discards its connection, so this only pays
+# off where the skipped reasoning is long (Opus); Sonnet is read to the end to
+# keep the pooled connection warm for the Opus call that follows
+EARLY_CUT_MODELS = frozenset({"opus"})
+
+# Max consensus pipelines in flight at once when signalling several markets
+MARKET_FANOUT_CONCURRENCY = 10
+
+# (epoch second, ISO string) for _now_iso
+_iso_cache = (0, "")
+
+# Telegram message lookups for actionable signals
+SIGNAL_EMOJI = {"BUY": "🟢", "SELL": "🔴"}
+SIGNAL_DIRECTION = {"BUY": "UP", "SELL": "DOWN"}
+
+# Values Opus may return; anything else is treated as HOLD / LOW
+VALID_SIGNALS = frozenset({"BUY", "SELL", "HOLD"})
+VALID_CONFIDENCE = frozenset({"HIGH", "MEDIUM", "LOW"})
 
 # Models via OpenRouter
 MODELS = {
@@ -56,18 +135,19 @@ MODELS = {
 }
 
 
-def build_prefilter_prompt(indicators: Dict, market_info: Dict) -> str:
-    """Sonnet pre-filter: Is this worth deeper analysis?"""
-    return f"""You are a trading signal PRE-FILTER. Quickly decide if conditions warrant calling our expensive AI (Opus 4.5).
+# Prompt text is built once at import; the builders only fill in the live values.
+# _PREFILTER_TEMPLATE goes through format_map (doubled braces are literal JSON);
+# the Opus pieces are joined around the context as-is.
+_PREFILTER_TEMPLATE = """You are a trading signal PRE-FILTER. Quickly decide if conditions warrant calling our expensive AI (Opus 4.5).
 
 ## Current Data
-- BTC Price: ${indicators.get('current_price', 0):,.2f}
-- RSI (14): {indicators.get('rsi_14', 'N/A')}
-- VWAP Deviation: {indicators.get('vwap_deviation_pct', 'N/A')}%
-- 60s Momentum: {indicators.get('momentum_60s', 'N/A')}%
-- Time Remaining: {market_info.get('time_until_end_min', 'N/A')} minutes
-- Market UP Price: {market_info.get('up_price', 'N/A')}
-- Market DOWN Price: {market_info.get('down_price', 'N/A')}
+- BTC Price: ${current_price:,.2f}
+- RSI (14): {rsi_14}
+- VWAP Deviation: {vwap_deviation_pct}%
+- 60s Momentum: {momentum_60s}%
+- Time Remaining: {time_until_end_min} minutes
+- Market UP Price: {up_price}
+- Market DOWN Price: {down_price}
 
 ## REJECT (save money) if ANY:
 - RSI between 45-55 (no direction)
@@ -88,40 +168,19 @@ Respond with ONLY:
 }}
 ```"""
 
-
-def build_opus_prompt(indicators: Dict, market_info: Dict, prefilter_hint: str, full_context: Optional[Dict] = None) -> str:
-    """
-    Opus 4.5 final decision prompt with FULL CONTEXT and chain-of-thought reasoning.
-    
-    Based on prompt engineering research:
-    - Chain-of-thought prompting improves complex reasoning
-    - Least-to-most decomposition helps with multi-factor analysis
-    - Self-consistency through structured reasoning
-    """
-    
-    # Build context section - this is the comprehensive view
-    if full_context and CONTEXT_BUILDER_AVAILABLE:
-        context_str = format_context_for_prompt(full_context)
-    else:
-        # Fallback to basic context
-        context_str = f"""
-BASIC CONTEXT (full context unavailable):
-- BTC Price: ${indicators.get('current_price', 0):,.2f}
-- RSI (14): {indicators.get('rsi_14', 'N/A')}
-- VWAP Deviation: {indicators.get('vwap_deviation_pct', 'N/A')}%
-- 60s Momentum: {indicators.get('momentum_60s', 'N/A')}%
-- Trend: {indicators.get('trend', 'N/A')}
-"""
-    
-    return f"""You are Claude Opus 4.5, the FINAL DECISION MAKER for a BTC trading bot on Polymarket.
+_OPUS_HEADER = """You are Claude Opus 4.5, the FINAL DECISION MAKER for a BTC trading bot on Polymarket.
 
 You're trading 15-minute BTC prediction markets. Your job is to analyze ALL available data
 and make the best possible decision. This is a $100 account - every dollar matters.
 
-{context_str}
+"""
+
+_OPUS_PREFILTER_LABEL = """
 
 ## Pre-filter Assessment
-Sonnet 3.5 thinks: {prefilter_hint}
+Sonnet 3.5 thinks: """
+
+_OPUS_FOOTER = """
 
 ---
 
@@ -182,14 +241,14 @@ After considering all factors above, make your call.
 
 Respond with ONLY this JSON:
 ```json
-{{
+{
   "signal": "BUY" | "SELL" | "HOLD",
   "confidence": "HIGH" | "MEDIUM" | "LOW",
   "reasoning": "Your complete analysis (3-4 sentences covering key factors)",
   "key_factors": ["factor1", "factor2", "factor3"],
   "concerns": ["any risks or uncertainties"],
   "edge_explanation": "Why this trade has positive expected value, or why HOLD"
-}}
+}
 ```
 
 ## Trading Rules
@@ -213,80 +272,360 @@ Make your decision. Be thorough. Be honest about uncertainty.
 """
 
 
+# Prompt builders below are memoized on just the values they read (typed, so
+# 50 and 50.0 - which format differently - don't collide). Unhashable values
+# skip the cache via __wrapped__.
+
+@functools.lru_cache(maxsize=8, typed=True)
+def _format_prefilter_prompt(current_price, rsi_14, vwap_deviation_pct, momentum_60s,
+                             time_until_end_min, up_price, down_price) -> str:
+    return _PREFILTER_TEMPLATE.format_map({
+        "current_price": current_price,
+        "rsi_14": rsi_14,
+        "vwap_deviation_pct": vwap_deviation_pct,
+        "momentum_60s": momentum_60s,
+        "time_until_end_min": time_until_end_min,
+        "up_price": up_price,
+        "down_price": down_price,
+    })
+
+
+@functools.lru_cache(maxsize=8, typed=True)
+def _format_basic_context(current_price, rsi_14, vwap_deviation_pct, momentum_60s, trend) -> str:
+    return f"""
+BASIC CONTEXT (full context unavailable):
+- BTC Price: ${current_price:,.2f}
+- RSI (14): {rsi_14}
+- VWAP Deviation: {vwap_deviation_pct}%
+- 60s Momentum: {momentum_60s}%
+- Trend: {trend}
+"""
+
+
+def _memoized(func, *args) -> str:
+    """Call an lru_cache'd formatter, bypassing the cache for unhashable args."""
+    try:
+        return func(*args)
+    except TypeError:
+        return func.__wrapped__(*args)
+
+
+def _round_to(value, step: float):
+    """Round a numeric value to the nearest multiple of step; pass anything else through."""
+    if isinstance(value, (int, float)):
+        return round(value / step) * step
+    return value
+
+
+def _quantize(indicators: Dict, market_info: Dict) -> tuple:
+    """
+    Coarsen prompt inputs to the precision the models actually use.
+    
+    Near-identical ticks then render the same prompt, which keeps it short
+    and lets the LLM response cache and the formatter memo hit.
+    
+    Returns:
+        (indicators, market_info) copies with price to $10, RSI to 1,
+        VWAP deviation and momentum to 0.01%, time remaining to 0.5 min
+    """
+    indicators = dict(indicators)
+    market_info = dict(market_info)
+    
+    if 'current_price' in indicators:
+        indicators['current_price'] = _round_to(indicators['current_price'], 10)
+    if 'rsi_14' in indicators:
+        indicators['rsi_14'] = _round_to(indicators['rsi_14'], 1)
+    for key in ('vwap_deviation_pct', 'momentum_60s'):
+        value = indicators.get(key)
+        if isinstance(value, (int, float)):
+            indicators[key] = round(value, 2)
+    if 'time_until_end_min' in market_info:
+        market_info['time_until_end_min'] = _round_to(market_info['time_until_end_min'], 0.5)
+    
+    return indicators, market_info
+
+
+def build_prefilter_prompt(indicators: Dict, market_info: Dict) -> str:
+    """Sonnet pre-filter: Is this worth deeper analysis?"""
+    indicators, market_info = _quantize(indicators, market_info)
+    return _memoized(
+        _format_prefilter_prompt,
+        indicators.get('current_price', 0),
+        indicators.get('rsi_14', 'N/A'),
+        indicators.get('vwap_deviation_pct', 'N/A'),
+        indicators.get('momentum_60s', 'N/A'),
+        market_info.get('time_until_end_min', 'N/A'),
+        market_info.get('up_price', 'N/A'),
+        market_info.get('down_price', 'N/A'),
+    )
+
+
+def build_opus_prompt(indicators: Dict, market_info: Dict, prefilter_hint: str, full_context: Optional[Dict] = None) -> str:
+    """
+    Opus 4.5 final decision prompt with FULL CONTEXT and chain-of-thought reasoning.
+    
+    Based on prompt engineering research:
+    - Chain-of-thought prompting improves complex reasoning
+    - Least-to-most decomposition helps with multi-factor analysis
+    - Self-consistency through structured reasoning
+    """
+    
+    # Build context section - this is the comprehensive view
+    if full_context and CONTEXT_BUILDER_AVAILABLE:
+        context_str = format_context_for_prompt(full_context)
+    else:
+        # Fallback to basic context
+        indicators, market_info = _quantize(indicators, market_info)
+        context_str = _memoized(
+            _format_basic_context,
+            indicators.get('current_price', 0),
+            indicators.get('rsi_14', 'N/A'),
+            indicators.get('vwap_deviation_pct', 'N/A'),
+            indicators.get('momentum_60s', 'N/A'),
+            indicators.get('trend', 'N/A'),
+        )
+    
+    # Only the context and pre-filter hint vary per call
+    return "".join((_OPUS_HEADER, context_str, _OPUS_PREFILTER_LABEL, prefilter_hint, _OPUS_FOOTER))
+
+
+def _image_mime(img_base64: str) -> str:
+    """Media type of a base64 chart image (chart_to_base64 sends WebP or PNG)."""
+    # "RIFF" (WebP container) encodes to "UklGR"
+    return "image/webp" if img_base64.startswith("UklGR") else "image/png"
+
+
+def _build_openrouter_request(prompt: str, model_key: str, images: Optional[List[str]] = None) -> Optional[Dict]:
+    """
+    Build the headers and JSON body for an OpenRouter chat completion.
+    
+    Returns:
+        Dict with "headers" and the encoded JSON "body", or None if the key/model is missing
+    """
+    if not OPENROUTER_API_KEY:
+        print("❌ OPENROUTER_API_KEY not set")
+        return None
+    
+    model_id = MODELS.get(model_key)
+    if not model_id:
+        print(f"❌ Unknown model: {model_key}")
+        return None
+    
+    # Opus needs more tokens for chain-of-thought analysis
+    max_tokens = 1200 if model_key == "opus" else 400
+    
+    # Build message content (text only or text + images)
+    if images:
+        # Multi-modal message with images
+        content = [{"type": "text", "text": prompt}]
+        for img_base64 in images:
+            content.append({
+                "type": "image_url",
+                "image_url": {
+                    "url": f"data:{_image_mime(img_base64)};base64,{img_base64}"
+                }
+            })
+        messages = [{"role": "user", "content": content}]
+    else:
+        # Text-only message
+        messages = [{"role": "user", "content": prompt}]
+    
+    return {
+        "headers": {
+            "Authorization": f"Bearer {OPENROUTER_API_KEY}",
+            "Content-Type": "application/json",
+            "HTTP-Referer": "https://polymarket-bot.local",
+        },
+        # Encoded here rather than by requests/httpx - with chart images the
+        # body is hundreds of KB
+        "body": json_dumps({
+            "model": model_id,
+            "messages": messages,
+            "max_tokens": max_tokens,
+            "temperature": 0.3,  # Slightly higher for more nuanced reasoning
+            # Streamed so Opus can stop reading once the decision JSON closes
+            "stream": True
+        }),
+    }
+
+
+def _stream_result(stream: StreamedJson, model_key: str) -> Optional[Dict]:
+    """The decision JSON from a finished stream, logging the reply when there isn't one."""
+    parsed = stream.result()
+    if parsed is None:
+        print(f"JSON parse error from {model_key}")
+        print(f"Content: {stream.content[:200]}")
+    return parsed
+
+
+def _llm_cache_key(prompt: str, model_key: str, images: Optional[List[str]]) -> str:
+    """
+    Hash a request for the response cache.
+    
+    The prompt is hashed as built - its inputs were already bucketed by
+    _quantize, so near-identical ticks produce the same text and key.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    h.update(model_key.encode())
+    h.update(prompt.encode())
+    for img in images or ():
+        h.update(img.encode())
+    return h.hexdigest()
+
+
+def _llm_cache_get(key: str) -> Optional[Dict]:
+    """Return a fresh cached response for key, or None."""
+    hit = _llm_cache.get(key)
+    if hit is not None and time.monotonic() < hit[0]:
+        return dict(hit[1])
+    return None
+
+
+def _llm_cache_put(key: str, model_key: str, response: Optional[Dict]):
+    """Remember a successful response, dropping expired entries."""
+    if not response:
+        return
+    now = time.monotonic()
+    for stale in [k for k, (expires, _) in _llm_cache.items() if expires <= now]:
+        del _llm_cache[stale]
+    _llm_cache[key] = (now + LLM_CACHE_TTL.get(model_key, 30), dict(response))
+
+
 def call_openrouter(prompt: str, model_key: str, timeout: int = 60, images: Optional[List[str]] = None) -> Optional[Dict]:
     """
     Call OpenRouter API, optionally with images for vision analysis.
     
+    Responses are reused for LLM_CACHE_TTL seconds when an equivalent prompt
+    is sent again.
+    
     Args:
         prompt: Text prompt
         model_key: "sonnet" or "opus"
         timeout: Request timeout
         images: Optional list of base64-encoded images
     """
-    if not OPENROUTER_API_KEY:
-        print("❌ OPENROUTER_API_KEY not set")
-        return None
+    key = _llm_cache_key(prompt, model_key, images)
+    cached = _llm_cache_get(key)
+    if cached is not None:
+        print(f"   (cached {model_key} response)")
+        return cached
     
-    model_id = MODELS.get(model_key)
-    if not model_id:
-        print(f"❌ Unknown model: {model_key}")
+    response = _call_openrouter_uncached(prompt, model_key, timeout, images)
+    _llm_cache_put(key, model_key, response)
+    return response
+
+
+def _call_openrouter_uncached(prompt: str, model_key: str, timeout: int = 60, images: Optional[List[str]] = None) -> Optional[Dict]:
+    """Send one request to OpenRouter over the shared requests session."""
+    request = _build_openrouter_request(prompt, model_key, images)
+    if request is None:
         return None
     
     try:
-        # Opus needs more tokens for chain-of-thought analysis
-        max_tokens = 1200 if model_key == "opus" else 400
-        
-        # Build message content (text only or text + images)
-        if images:
-            # Multi-modal message with images
-            content = [{"type": "text", "text": prompt}]
-            for img_base64 in images:
-                content.append({
-                    "type": "image_url",
-                    "image_url": {
-                        "url": f"data:image/png;base64,{img_base64}"
-                    }
-                })
-            messages = [{"role": "user", "content": content}]
-        else:
-            # Text-only message
-            messages = [{"role": "user", "content": prompt}]
-        
-        response = requests.post(
-            "https://openrouter.ai/api/v1/chat/completions",
-            headers={
-                "Authorization": f"Bearer {OPENROUTER_API_KEY}",
-                "Content-Type": "application/json",
-                "HTTP-Referer": "https://polymarket-bot.local",
-            },
-            json={
-                "model": model_id,
-                "messages": messages,
-                "max_tokens": max_tokens,
-                "temperature": 0.3  # Slightly higher for more nuanced reasoning
-            },
-            timeout=timeout
-        )
-        
-        if response.status_code == 200:
-            data = response.json()
-            content = data.get("choices", [{}])[0].get("message", {}).get("content", "")
+        with _SESSION.post(OPENROUTER_URL, headers=request["headers"], data=request["body"],
+                           timeout=timeout, stream=True) as response:
+            if response.status_code != 200:
+                print(f"API error {response.status_code} from {model_key}: {response.text[:100]}")
+                return None
             
-            # Parse JSON
-            try:
-                start = content.find("{")
-                end = content.rfind("}") + 1
-                if start >= 0 and end > start:
-                    return json.loads(content[start:end])
-            except json.JSONDecodeError:
-                print(f"JSON parse error from {model_key}")
-                print(f"Content: {content[:200]}")
-        else:
-            print(f"API error {response.status_code} from {model_key}: {response.text[:100]}")
+            # SSE is UTF-8, but the content type rarely says so
+            response.encoding = "utf-8"
+            stream = StreamedJson()
+            early_cut = model_key in EARLY_CUT_MODELS
+            for line in response.iter_lines(decode_unicode=True):
+                if stream.feed(line) and early_cut:
+                    break
+            return _stream_result(stream, model_key)
         
+    except requests.exceptions.Timeout:
+        print(f"Timeout calling {model_key}")
+        return None
+    except Exception as e:
+        print(f"Error calling {model_key}: {e}")
         return None
+
+
+async def _client_lifetime(client: "httpx.AsyncClient"):
+    """
+    Suspended async generator that closes client when finalized.
+    
+    Its loop finalizes pending async generators before closing (asyncio.run
+    calls shutdown_asyncgens), so the client's pool is closed on its own loop
+    even when the caller never calls close_client.
+    """
+    try:
+        yield
+    finally:
+        await client.aclose()
+
+
+async def get_client() -> "httpx.AsyncClient":
+    """Get the shared httpx client for the running event loop, creating it on first use."""
+    loop = asyncio.get_running_loop()
+    entry = _async_clients.get(loop)
+    if entry is None:
+        client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_keepalive_connections=8, max_connections=16),
+        )
+        lifetime = _client_lifetime(client)
+        await lifetime.__anext__()
+        entry = _async_clients[loop] = (client, lifetime)
+    return entry[0]
+
+
+async def close_client():
+    """Close the running loop's httpx client, if one is open."""
+    entry = _async_clients.pop(asyncio.get_running_loop(), None)
+    if entry is not None:
+        await entry[1].aclose()
+
+
+async def call_openrouter_async(prompt: str, model_key: str, timeout: int = 60, images: Optional[List[str]] = None) -> Optional[Dict]:
+    """
+    Async version of call_openrouter, reusing pooled connections via httpx.
+    
+    Shares call_openrouter's response cache. Falls back to the requests-based
+    call in a thread when httpx isn't installed.
+    """
+    key = _llm_cache_key(prompt, model_key, images)
+    cached = _llm_cache_get(key)
+    if cached is not None:
+        print(f"   (cached {model_key} response)")
+        return cached
+    
+    if HTTPX_AVAILABLE:
+        response = await _call_openrouter_httpx(prompt, model_key, timeout, images)
+    else:
+        response = await asyncio.to_thread(_call_openrouter_uncached, prompt, model_key, timeout, images)
+    _llm_cache_put(key, model_key, response)
+    return response
+
+
+async def _call_openrouter_httpx(prompt: str, model_key: str, timeout: int = 60, images: Optional[List[str]] = None) -> Optional[Dict]:
+    """Send one request to OpenRouter over the shared httpx client."""
+    request = _build_openrouter_request(prompt, model_key, images)
+    if request is None:
+        return None
+    
+    try:
+        client = await get_client()
+        async with client.stream("POST", OPENROUTER_URL, headers=request["headers"],
+                                 content=request["body"], timeout=timeout) as response:
+            if response.status_code != 200:
+                await response.aread()
+                print(f"API error {response.status_code} from {model_key}: {response.text[:100]}")
+                return None
+            
+            stream = StreamedJson()
+            # Over HTTP/2 closing just resets the one stream, so cutting is free
+            early_cut = model_key in EARLY_CUT_MODELS or response.http_version == "HTTP/2"
+            async for line in response.aiter_lines():
+                if stream.feed(line) and early_cut:
+                    break
+            return _stream_result(stream, model_key)
         
-    except requests.exceptions.Timeout:
+    except httpx.TimeoutException:
         print(f"Timeout calling {model_key}")
         return None
     except Exception as e:
@@ -294,15 +633,88 @@ def call_openrouter(prompt: str, model_key: str, timeout: int = 60, images: Opti
         return None
 
 
-def get_consensus_signal(indicators: Dict, market_info: Dict, sentiment: Optional[Dict] = None, include_charts: bool = True) -> Dict:
+def _gather_full_context(indicators: Dict, market_info: Dict, sentiment: Optional[Dict]) -> Optional[Dict]:
+    """Build the full Opus context, or None if the builder is missing or fails."""
+    if not CONTEXT_BUILDER_AVAILABLE:
+        return None
+    try:
+        return build_full_context(indicators, market_info, sentiment)
+    except Exception as e:
+        print(f"   ⚠️ Context builder error: {e}")
+        return None
+
+
+def _gather_chart_images() -> List[tuple]:
+    """Render the trading charts as (timeframe, base64 PNG) pairs; empty on failure."""
+    try:
+        charts = generate_trading_charts()
+        chart_images = []
+        for timeframe in ["15m", "1h", "4h"]:
+            if timeframe in charts:
+                img_b64 = chart_to_base64(charts[timeframe], webp=True)
+                if img_b64:
+                    chart_images.append((timeframe, img_b64))
+        return chart_images
+    except Exception as e:
+        print(f"   ⚠️ Chart generation error: {e}")
+        return []
+
+
+def _now_iso() -> str:
+    """Current UTC time as an ISO-8601 string (whole seconds), formatted once per second."""
+    global _iso_cache
+    now = time.time_ns() // 1_000_000_000
+    if now != _iso_cache[0]:
+        _iso_cache = (now, time.strftime("%Y-%m-%dT%H:%M:%S+00:00", time.gmtime(now)))
+    return _iso_cache[1]
+
+
+def _should_speculate(indicators: Dict, market_info: Dict) -> bool:
+    """
+    Guess locally whether Sonnet will approve (mirrors its REJECT rules), and
+    whether the hourly speculation budget allows acting on that guess.
+    """
+    try:
+        rsi = float(indicators.get('rsi_14'))
+        momentum = float(indicators.get('momentum_60s'))
+        minutes_left = float(market_info.get('time_until_end_min', 10))
+    except (TypeError, ValueError):
+        return False
+    if 45 <= rsi <= 55 or abs(momentum) <= 0.02 or not 4 <= minutes_left <= 13:
+        return False
+    
+    now = time.monotonic()
+    while _speculation_times and now - _speculation_times[0] > 3600:
+        _speculation_times.popleft()
+    if len(_speculation_times) >= SPECULATION_BUDGET_PER_HOUR:
+        return False
+    _speculation_times.append(now)
+    return True
+
+
+def _discard_outcome(future: asyncio.Future):
+    """Mark an abandoned future's outcome as retrieved so asyncio doesn't log it."""
+    if not future.cancelled():
+        future.exception()
+
+
+def _start_context_and_charts(indicators: Dict, market_info: Dict, sentiment: Optional[Dict], want_charts: bool) -> asyncio.Future:
+    """Start building the Opus context and charts side by side in worker threads."""
+    return asyncio.gather(
+        asyncio.to_thread(_gather_full_context, indicators, market_info, sentiment),
+        asyncio.to_thread(_gather_chart_images) if want_charts else asyncio.sleep(0, []),
+    )
+
+
+async def get_consensus_signal_async(indicators: Dict, market_info: Dict, sentiment: Optional[Dict] = None, include_charts: bool = True) -> Dict:
     """
     Get trading signal: Sonnet pre-filter → Opus final decision with FULL CONTEXT + CHARTS.
     
     This function:
     1. Runs Sonnet as a cheap pre-filter
     2. If worthwhile, builds comprehensive context (multi-timeframe, order book, sentiment)
-    3. Generates visual charts for pattern recognition
-    4. Sends everything to Opus for chain-of-thought analysis with vision
+       and generates visual charts for pattern recognition - concurrently
+    3. Sends everything to Opus for chain-of-thought analysis with vision
     
     Args:
         indicators: Current technical indicators
@@ -311,7 +723,7 @@ def get_consensus_signal(indicators: Dict, market_info: Dict, sentiment: Optiona
         include_charts: Whether to generate and send charts to Opus (adds ~$0.02-0.03)
     """
     result = {
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "timestamp": _now_iso(),
         "signal": "HOLD",
         "confidence": "LOW",
         "position_size_pct": 0.0,
@@ -328,10 +740,24 @@ def get_consensus_signal(indicators: Dict, market_info: Dict, sentiment: Optiona
         "error": None
     }
     
+    # When the indicators look like a likely approval, start the Opus context
+    # and charts now so they build while Sonnet is still thinking
+    want_charts = include_charts and CHART_GENERATOR_AVAILABLE
+    speculative = None
+    if _should_speculate(indicators, market_info):
+        speculative = _start_context_and_charts(indicators, market_info, sentiment, want_charts)
+    
     # Step 1: Sonnet pre-filter (cheap check first)
     print("🔍 Sonnet 3.5 pre-filtering...")
     prefilter_prompt = build_prefilter_prompt(indicators, market_info)
-    prefilter = call_openrouter(prefilter_prompt, "sonnet", timeout=30)
+    prefilter = await call_openrouter_async(prefilter_prompt, "sonnet", timeout=30)
+    
+    # Rejected or failed: drop the speculative work (running threads finish
+    # in the background and their results are discarded; generate_trading_charts
+    # holds a lock, so a later build waits for them rather than racing)
+    if speculative is not None and not (prefilter and prefilter.get("worth_analyzing", False)):
+        speculative.cancel()
+        speculative.add_done_callback(_discard_outcome)
     
     if not prefilter:
         result["error"] = "Pre-filter failed"
@@ -353,45 +779,41 @@ def get_consensus_signal(indicators: Dict, market_info: Dict, sentiment: Optiona
     
     result["prefilter_passed"] = True
     
-    # Step 2: Build FULL CONTEXT for Opus (this is where we invest in getting it right)
-    full_context = None
+    # Steps 2 + 3: FULL CONTEXT for Opus and charts for visual analysis are
+    # independent (mostly network-bound), so build them side by side
     if CONTEXT_BUILDER_AVAILABLE:
         print("📊 Building comprehensive context...")
-        try:
-            full_context = build_full_context(indicators, market_info, sentiment)
-            result["full_context_used"] = True
-            
-            # Log what context we gathered
-            summary = full_context.get("summary", {})
-            print(f"   • BTC 4h trend: {summary.get('trend_4h', 'N/A')}")
-            print(f"   • BTC 24h trend: {summary.get('trend_24h', 'N/A')}")
-            print(f"   • Fear/Greed: {summary.get('fear_greed', 'N/A')}")
-            print(f"   • Market lean: {summary.get('market_lean', 'N/A')}")
-        except Exception as e:
-            print(f"   ⚠️ Context builder error: {e}")
     else:
         print("   ⚠️ Context builder not available - using basic context")
+    if want_charts:
+        print("📈 Generating charts for visual analysis...")
+    
+    if speculative is None:
+        speculative = _start_context_and_charts(indicators, market_info, sentiment, want_charts)
+    full_context, charts = await speculative
+    
+    if full_context is not None:
+        result["full_context_used"] = True
+        
+        # Log what context we gathered
+        summary = full_context.get("summary", {})
+        print(f"   • BTC 4h trend: {summary.get('trend_4h', 'N/A')}")
+        print(f"   • BTC 24h trend: {summary.get('trend_24h', 'N/A')}")
+        print(f"   • Fear/Greed: {summary.get('fear_greed', 'N/A')}")
+        print(f"   • Market lean: {summary.get('market_lean', 'N/A')}")
     
-    # Step 3: Generate charts for visual analysis (optional, adds cost)
     chart_images = []
-    if include_charts and CHART_GENERATOR_AVAILABLE:
-        print("📈 Generating charts for visual analysis...")
-        try:
-            charts = generate_trading_charts()
-            for timeframe in ["15m", "1h", "4h"]:
-                if timeframe in charts:
-                    img_b64 = chart_to_base64(charts[timeframe])
-                    if img_b64:
-                        chart_images.append(img_b64)
-                        print(f"   ✓ {timeframe} chart ready")
-            
-            if chart_images:
-                result["charts_used"] = True
-                print(f"   📊 {len(chart_images)} charts will be analyzed")
-        except Exception as e:
-            print(f"   ⚠️ Chart generation error: {e}")
+    for timeframe, img_b64 in charts:
+        chart_images.append(img_b64)
+        print(f"   ✓ {timeframe} chart ready")
+    if chart_images:
+        result["charts_used"] = True
+        print(f"   📊 {len(chart_images)} charts will be analyzed")
     
     # Step 4: Opus final decision with full context + charts
+    # (Deliberately not launched alongside Sonnet: the prompt carries Sonnet's
+    # direction hint, and the pooled connection is already warm from that call -
+    # Sonnet's stream is read to the end so the connection goes back to the pool.)
     print("🧠 Opus 4.5 analyzing with full context" + (" + charts..." if chart_images else "..."))
     opus_prompt = build_opus_prompt(
         indicators, 
@@ -402,7 +824,7 @@ def get_consensus_signal(indicators: Dict, market_info: Dict, sentiment: Optiona
     
     # Give Opus more time for thorough analysis (especially with images)
     timeout = 180 if chart_images else 120
-    opus = call_openrouter(opus_prompt, "opus", timeout=timeout, images=chart_images if chart_images else None)
+    opus = await call_openrouter_async(opus_prompt, "opus", timeout=timeout, images=chart_images if chart_images else None)
     
     if not opus:
         result["error"] = "Opus failed to respond"
@@ -412,8 +834,12 @@ def get_consensus_signal(indicators: Dict, market_info: Dict, sentiment: Optiona
     result["opus_response"] = opus
     
     # Extract Opus decision (now includes more fields)
-    result["signal"] = opus.get("signal", "HOLD")
-    result["confidence"] = opus.get("confidence", "LOW")
+    # Sanity-check the enum fields on the parsed object - a malformed value
+    # (e.g. the template's "BUY | SELL | HOLD" echoed back) must never trade
+    signal = str(opus.get("signal", "HOLD")).strip().upper()
+    confidence = str(opus.get("confidence", "LOW")).strip().upper()
+    result["signal"] = signal if signal in VALID_SIGNALS else "HOLD"
+    result["confidence"] = confidence if confidence in VALID_CONFIDENCE else "LOW"
     result["reasoning"] = opus.get("reasoning", "No reasoning provided")
     result["key_factors"] = opus.get("key_factors", [])
     result["concerns"] = opus.get("concerns", [])
@@ -437,67 +863,155 @@ def get_consensus_signal(indicators: Dict, market_info: Dict, sentiment: Optiona
     return result
 
 
-def format_consensus_message(result: Dict, market_info: Dict = None, indicators: Dict = None, balance: float = 100.0) -> str:
-    """Format for Telegram notification with comprehensive analysis."""
-    prefilter = result.get("prefilter_response") or {}
-    opus = result.get("opus_response") or {}
+async def signals_for_markets(market_specs: List[Dict], include_charts: bool = True) -> List[Dict]:
+    """
+    Run the consensus pipeline for several markets concurrently.
     
-    # Extract market and price info
-    market_title = market_info.get('title', 'BTC 15-min') if market_info else 'BTC 15-min'
-    time_remaining = market_info.get('time_until_end_min', 'N/A') if market_info else 'N/A'
-    btc_price = indicators.get('current_price', 0) if indicators else 0
-    up_price = market_info.get('up_price', 0.5) if market_info else 0.5
-    down_price = market_info.get('down_price', 0.5) if market_info else 0.5
+    A semaphore caps how many pipelines are in flight, so adding markets costs
+    roughly one pipeline's latency (bounded by OpenRouter rate limits) rather
+    than one per market. All calls share the pooled httpx client.
     
-    # Format time remaining
-    time_str = f"{time_remaining:.1f} min" if isinstance(time_remaining, (int, float)) else str(time_remaining)
+    Args:
+        market_specs: Dicts with 'indicators', 'market_info' and optional 'sentiment'
+        include_charts: Whether to attach charts to Opus calls
     
-    # Header with context
-    header = f"""⏰ *{market_title}*
+    Returns:
+        Consensus results in the same order as market_specs
+    """
+    sem = asyncio.Semaphore(MARKET_FANOUT_CONCURRENCY)
+    
+    async def _one(spec: Dict) -> Dict:
+        async with sem:
+            return await get_consensus_signal_async(
+                spec["indicators"], spec["market_info"], spec.get("sentiment"), include_charts
+            )
+    
+    return await asyncio.gather(*[_one(spec) for spec in market_specs])
+
+
+def _run_sync(coro):
+    """
+    Run a coroutine to completion on the module's private event loop.
+    
+    The loop is kept between calls (rather than asyncio.run's fresh loop each
+    time) so pooled connections are reused.
+    """
+    global _sync_loop
+    with _sync_lock:
+        if _sync_loop is None:
+            _sync_loop = asyncio.new_event_loop()
+        return _sync_loop.run_until_complete(coro)
+
+
+def get_consensus_signal(indicators: Dict, market_info: Dict, sentiment: Optional[Dict] = None, include_charts: bool = True) -> Dict:
+    """Synchronous wrapper around get_consensus_signal_async for existing callers."""
+    return _run_sync(get_consensus_signal_async(indicators, market_info, sentiment, include_charts))
+
+
+def get_consensus_signals(market_specs: List[Dict], include_charts: bool = True) -> List[Dict]:
+    """Synchronous wrapper around signals_for_markets."""
+    return _run_sync(signals_for_markets(market_specs, include_charts))
+
+
+def _close_connections():
+    """Close the sync loop's httpx client and the requests session at exit."""
+    global _sync_loop
+    if _sync_loop is not None:
+        _sync_loop.run_until_complete(close_client())
+        _sync_loop.close()
+        _sync_loop = None
+    _SESSION.close()
+
+
+atexit.register(_close_connections)
+
+
+# Telegram message pieces for format_consensus_message (filled via format_map)
+_CONSENSUS_HEADER = """⏰ *{market_title}*
 💵 BTC: ${btc_price:,.0f} | ⏳ {time_str} left
-📈 UP: {up_price*100:.0f}% | 📉 DOWN: {down_price*100:.0f}%
+📈 UP: {up_pct:.0f}% | 📉 DOWN: {down_pct:.0f}%
 💰 Balance: ${balance:.2f}
 """
-    
-    if result.get("cost_saved"):
-        return header + f"""
+
+_CONSENSUS_REJECTED = """
 ⚪ *HOLD - Pre-filter Rejected*
 
 🔍 *Sonnet 3.5*: Not worth analyzing
-📝 {prefilter.get('reason', 'No clear signal')}
+📝 {reason}
 
 💰 Saved ~$0.03 by skipping Opus"""
-    
-    if result.get("signal") in ["BUY", "SELL"]:
-        emoji = "🟢" if result["signal"] == "BUY" else "🔴"
-        direction = "UP" if result["signal"] == "BUY" else "DOWN"
-        position_dollars = result['position_size_pct'] * balance
-        
-        # Build key factors string
-        factors = result.get('key_factors', [])
-        factors_str = '• ' + '\n• '.join(factors) if factors else 'N/A'
-        
-        # Build concerns string
-        concerns = result.get('concerns', [])
-        concerns_str = '• ' + '\n• '.join(concerns) if concerns else 'None noted'
-        
-        msg = header + f"""
-{emoji} *{result['signal']}* ({result['confidence']}) - Bet {direction}
 
-📊 *Position*: {result['position_size_pct']*100:.1f}% (~${position_dollars:.2f})
+_CONSENSUS_TRADE = """
+{emoji} *{signal}* ({confidence}) - Bet {direction}
 
-🔍 *Sonnet Pre-filter*: ✅ {prefilter.get('likely_direction', 'N/A')}
+📊 *Position*: {position_pct:.1f}% (~${position_dollars:.2f})
+
+🔍 *Sonnet Pre-filter*: ✅ {likely_direction}
 
 🧠 *Opus 4.5 Analysis*:
-{result.get('reasoning', 'N/A')}
+{reasoning}
 
 🎯 *Key Factors*:
-{factors_str}
+{factors}
 
 ⚠️ *Concerns*:
-{concerns_str}
+{concerns}
+
+💡 *Edge*: {edge}"""
+
+_CONSENSUS_HOLD = """
+⚪ *HOLD* - No Trade
 
-💡 *Edge*: {result.get('edge_explanation', 'N/A')[:150]}"""
+🔍 *Sonnet*: {likely_direction}
+🧠 *Opus*: {signal} ({confidence})
+
+📝 *Analysis*:
+{reasoning}
+
+💡 *Why no trade*: {edge}"""
+
+
+def format_consensus_message(result: Dict, market_info: Dict = None, indicators: Dict = None, balance: float = 100.0) -> str:
+    """Format for Telegram notification with comprehensive analysis."""
+    prefilter = result.get("prefilter_response") or {}
+    market_info = market_info or {}
+    indicators = indicators or {}
+    
+    # Format time remaining
+    time_remaining = market_info.get('time_until_end_min', 'N/A')
+    time_str = f"{time_remaining:.1f} min" if isinstance(time_remaining, (int, float)) else str(time_remaining)
+    
+    # Header with context
+    header = _CONSENSUS_HEADER.format_map({
+        "market_title": market_info.get('title', 'BTC 15-min'),
+        "btc_price": indicators.get('current_price', 0),
+        "time_str": time_str,
+        "up_pct": market_info.get('up_price', 0.5) * 100,
+        "down_pct": market_info.get('down_price', 0.5) * 100,
+        "balance": balance,
+    })
+    
+    if result.get("cost_saved"):
+        return header + _CONSENSUS_REJECTED.format_map({
+            "reason": prefilter.get('reason', 'No clear signal'),
+        })
+    
+    if result.get("signal") in SIGNAL_EMOJI:
+        factors = result.get('key_factors', [])
+        concerns = result.get('concerns', [])
+        msg = header + _CONSENSUS_TRADE.format_map({
+            "emoji": SIGNAL_EMOJI[result["signal"]],
+            "signal": result['signal'],
+            "confidence": result['confidence'],
+            "direction": SIGNAL_DIRECTION[result["signal"]],
+            "position_pct": result['position_size_pct'] * 100,
+            "position_dollars": result['position_size_pct'] * balance,
+            "likely_direction": prefilter.get('likely_direction', 'N/A'),
+            "reasoning": result.get('reasoning', 'N/A'),
+            "factors": '• ' + '\n• '.join(factors) if factors else 'N/A',
+            "concerns": '• ' + '\n• '.join(concerns) if concerns else 'None noted',
+            "edge": result.get('edge_explanation', 'N/A')[:150],
+        })
         
         context_items = []
         if result.get("full_context_used"):
@@ -510,17 +1024,13 @@ def format_consensus_message(result: Dict, market_info: Dict = None, indicators:
         
         return msg
     
-    else:
-        return header + f"""
-⚪ *HOLD* - No Trade
-
-🔍 *Sonnet*: {prefilter.get('likely_direction', 'N/A')}
-🧠 *Opus*: {result.get('signal', 'HOLD')} ({result.get('confidence', 'LOW')})
-
-📝 *Analysis*:
-{result.get('reasoning', 'No clear opportunity')}
-
-💡 *Why no trade*: {result.get('edge_explanation', 'Insufficient edge or high uncertainty')}"""
+    return header + _CONSENSUS_HOLD.format_map({
+        "likely_direction": prefilter.get('likely_direction', 'N/A'),
+        "signal": result.get('signal', 'HOLD'),
+        "confidence": result.get('confidence', 'LOW'),
+        "reasoning": result.get('reasoning', 'No clear opportunity'),
+        "edge": result.get('edge_explanation', 'Insufficient edge or high uncertainty'),
+    })
 
 
 # Test
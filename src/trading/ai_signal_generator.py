@@ -17,15 +17,39 @@ For trading, we recommend Sonnet 3.5 - smart enough, 5x cheaper than Opus.
 
 import os
 import json
+import re
+import sys
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime, timezone
-from typing import Dict, Optional
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
 from decouple import config
+try:
+    from src.utils.fast_json import json_loads
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+    from src.utils.fast_json import json_loads
 
 # Try to load API keys
 ANTHROPIC_API_KEY = config("ANTHROPIC_API_KEY", default=None)
 OPENROUTER_API_KEY = config("OPENROUTER_API_KEY", default=None)
 
+ANTHROPIC_API = "https://api.anthropic.com"
+OPENROUTER_API = "https://openrouter.ai"
+
+# Shared session - keeps TLS connections to both providers alive across signals.
+# Retry only covers idempotent methods by default, so a POST that reached the
+# model is never re-sent (and re-billed)
+_SESSION = requests.Session()
+for _api in (ANTHROPIC_API, OPENROUTER_API):
+    _SESSION.mount(_api, HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+    ))
+
 # Model options (in order of preference for trading)
 MODELS = {
     "opus": "claude-3-5-opus-20240620",      # Most capable, expensive
@@ -36,34 +60,23 @@ MODELS = {
 # Default to Sonnet for cost efficiency
 DEFAULT_MODEL = "sonnet"
 
+# Max snapshots evaluated in one request by get_ai_signals_batch - beyond this
+# answer quality and latency start to slip
+AI_BATCH_MAX = 8
+# Response token budget per single verdict
+MAX_TOKENS_PER_SIGNAL = 500
 
-def get_trading_prompt(indicators: Dict, market_info: Dict, recent_signals: list = None) -> str:
-    """
-    Build the prompt for Claude to analyze and make a trading decision.
-    """
-    recent_signals_text = ""
-    if recent_signals:
-        recent_signals_text = f"""
-Recent signals (last 5):
-{json.dumps(recent_signals[-5:], indent=2)}
-"""
+# A ```json fenced block in a model reply, and a decoder that can parse a value
+# starting mid-string (see _parse_json_response)
+_JSON_FENCE = re.compile(r"```(?:json)?\s*([\[{].*?[\]}])\s*```", re.DOTALL)
+_JSON_DECODER = json.JSONDecoder()
 
-    return f"""You are a BTC trading analyst for 15-minute prediction markets on Polymarket.
 
-## Current Market Data
-- **Price**: ${indicators.get('current_price', 0):,.2f}
-- **RSI (14)**: {indicators.get('rsi_14', 'N/A')}
-- **VWAP Deviation**: {indicators.get('vwap_deviation_pct', 'N/A')}%
-- **60s Momentum**: {indicators.get('momentum_60s', 'N/A')}%
-- **Trend**: {indicators.get('trend', 'N/A')}
-- **Data Points**: {indicators.get('data_points', 0)}
+# Static part of the trading prompt - identical on every call, so it is sent as
+# the system prompt and only the market data changes per request
+TRADING_SYSTEM_PROMPT = """You are a BTC trading analyst for 15-minute prediction markets on Polymarket.
 
-## Market Info
-- **Market**: {market_info.get('title', 'BTC 15-min Up/Down')}
-- **Time Remaining**: {market_info.get('time_until_end_min', 'N/A')} minutes
-- **Current UP Price**: {market_info.get('up_price', 'N/A')} ({float(market_info.get('up_price', 0.5))*100:.0f}% implied)
-- **Current DOWN Price**: {market_info.get('down_price', 'N/A')} ({float(market_info.get('down_price', 0.5))*100:.0f}% implied)
-{recent_signals_text}
+You will be given current market data and market info.
 
 ## Your Task
 Analyze the data and decide: Should we bet UP, DOWN, or HOLD?
@@ -78,12 +91,12 @@ Consider:
 ## Response Format
 Respond with ONLY a JSON object:
 ```json
-{{
+{
   "signal": "BUY" | "SELL" | "HOLD",
   "confidence": "HIGH" | "MEDIUM" | "LOW",
   "reasoning": "Brief explanation (1-2 sentences)",
   "position_size_pct": 0.0 to 0.10
-}}
+}
 ```
 
 Rules:
@@ -94,17 +107,184 @@ Rules:
 - If uncertain, HOLD. Capital preservation > profit.
 """
 
+SYSTEM_BLOCKS = [{"type": "text", "text": TRADING_SYSTEM_PROMPT}]
+
+
+def get_trading_prompt(indicators: Dict, market_info: Dict, recent_signals: list = None) -> Tuple[List[Dict], str]:
+    """
+    Build the prompt for Claude to analyze and make a trading decision.
+    
+    Returns:
+        (system_blocks, user_text) - the static instructions and the
+        per-call market data
+    """
+    recent_signals_text = ""
+    if recent_signals:
+        recent_signals_text = f"""
+Recent signals (last 5):
+{json.dumps(recent_signals[-5:], indent=2)}
+"""
+
+    user_text = f"""## Current Market Data
+- **Price**: ${indicators.get('current_price', 0):,.2f}
+- **RSI (14)**: {indicators.get('rsi_14', 'N/A')}
+- **VWAP Deviation**: {indicators.get('vwap_deviation_pct', 'N/A')}%
+- **60s Momentum**: {indicators.get('momentum_60s', 'N/A')}%
+- **Trend**: {indicators.get('trend', 'N/A')}
+- **Data Points**: {indicators.get('data_points', 0)}
+
+## Market Info
+- **Market**: {market_info.get('title', 'BTC 15-min Up/Down')}
+- **Time Remaining**: {market_info.get('time_until_end_min', 'N/A')} minutes
+- **Current UP Price**: {market_info.get('up_price', 'N/A')} ({float(market_info.get('up_price', 0.5))*100:.0f}% implied)
+- **Current DOWN Price**: {market_info.get('down_price', 'N/A')} ({float(market_info.get('down_price', 0.5))*100:.0f}% implied)
+{recent_signals_text}"""
+
+    return SYSTEM_BLOCKS, user_text
+
+
+def _is_verdict(parsed, array: bool) -> bool:
+    """True if parsed JSON has the expected shape: an object, or a list of objects."""
+    if array:
+        return isinstance(parsed, list) and all(isinstance(item, dict) for item in parsed)
+    return isinstance(parsed, dict)
+
+
+def _parse_json_response(content: str, array: bool = False,
+                         first_only: bool = False) -> Optional[Union[Dict, List]]:
+    """
+    Pull the JSON object (or array, for batched requests) out of a model reply.
+    
+    A ```json fenced block is tried first; otherwise the first position that
+    decodes as a value of the expected shape wins. raw_decode stops at the
+    value's end, so prose before or after it - including stray braces -
+    doesn't matter.
+    
+    Args:
+        content: Raw model text, possibly with prose or a code fence around the JSON
+        array: Expect a JSON array (of objects) instead of an object
+        first_only: Only try the first opening bracket. For partial streamed
+            text, where a later bracket may sit inside an unfinished string
+            (e.g. "RSI [14]") and decode as a bogus value
+    
+    Returns:
+        Parsed JSON, or None if none could be found
+    """
+    fenced = _JSON_FENCE.search(content)
+    if fenced:
+        try:
+            parsed = json_loads(fenced.group(1))
+            if _is_verdict(parsed, array):
+                return parsed
+        except json.JSONDecodeError:  # orjson raises a subclass
+            pass
+    
+    opener = "[" if array else "{"
+    start = content.find(opener)
+    while start >= 0:
+        try:
+            parsed = _JSON_DECODER.raw_decode(content, start)[0]
+            if _is_verdict(parsed, array):
+                return parsed
+        except json.JSONDecodeError:
+            pass
+        if first_only:
+            break
+        start = content.find(opener, start + 1)
+    return None
+
+
+def _anthropic_delta(event: Dict) -> str:
+    """Text carried by one Anthropic Messages stream event."""
+    if event.get("type") == "content_block_delta":
+        return event.get("delta", {}).get("text") or ""
+    return ""
+
+
+def _openrouter_delta(event: Dict) -> str:
+    """Text carried by one OpenRouter (OpenAI-style) stream chunk."""
+    choices = event.get("choices") or [{}]
+    return choices[0].get("delta", {}).get("content") or ""
+
+
+class StreamedJson:
+    """
+    Accumulates a streamed (SSE) completion one line at a time and notices as
+    soon as it holds a complete JSON value, so callers can stop reading -
+    closing the response cancels the rest of the generation.
+    
+    Shared with ai_consensus_signal, whose sync and async transports each feed
+    it their own lines.
+    """
+    
+    def __init__(self, delta_text=_openrouter_delta, array: bool = False):
+        """
+        Args:
+            delta_text: Extracts the text from one decoded SSE event
+            array: Expect a JSON array instead of an object
+        """
+        self.delta_text = delta_text
+        self.array = array
+        self.content = ""
+        self.verdict = None
+        self._closer = "]" if array else "}"
+    
+    def feed(self, line: str) -> bool:
+        """Consume one SSE line; True once a complete verdict has been decoded."""
+        if self.verdict is not None:
+            return True  # the caller is draining the rest of the stream
+        if not line.startswith("data:"):
+            return False  # "event:" names, blank separators and keep-alives
+        payload = line[5:].strip()
+        if payload == "[DONE]":
+            return False
+        piece = self.delta_text(json_loads(payload))
+        self.content += piece
+        # A value can only have just completed if its closing bracket arrived
+        if self._closer in piece:
+            self.verdict = _parse_json_response(self.content, self.array, first_only=True)
+        return self.verdict is not None
+    
+    def result(self) -> Optional[Union[Dict, List]]:
+        """The verdict, falling back to a full search over everything received."""
+        if self.verdict is not None:
+            return self.verdict
+        return _parse_json_response(self.content, self.array)
+
+
+def _read_streamed_json(response: requests.Response, delta_text, array: bool = False) -> Optional[Union[Dict, List]]:
+    """
+    Read a streamed completion until it holds a complete JSON value, so
+    reasoning the model appends after the JSON is never generated or billed.
+    
+    Args:
+        response: Streaming response from _SESSION.post(..., stream=True)
+        delta_text: Extracts the text from one decoded SSE event
+        array: Expect a JSON array instead of an object
+    
+    Returns:
+        Parsed JSON, or None if the stream ended without any
+    """
+    # SSE is UTF-8, but the content type rarely says so
+    response.encoding = "utf-8"
+    stream = StreamedJson(delta_text, array)
+    for line in response.iter_lines(decode_unicode=True):
+        if stream.feed(line):
+            break
+    return stream.result()
+
 
-def call_anthropic_api(prompt: str, model: str = DEFAULT_MODEL) -> Optional[Dict]:
-    """Call Anthropic API directly."""
+def call_anthropic_api(system_blocks: List[Dict], user_text: str, model: str = DEFAULT_MODEL,
+                       max_tokens: int = MAX_TOKENS_PER_SIGNAL, array: bool = False) -> Optional[Union[Dict, List]]:
+    """Call Anthropic API directly, with the static instructions as the system prompt."""
     if not ANTHROPIC_API_KEY:
         return None
     
     model_id = MODELS.get(model, MODELS[DEFAULT_MODEL])
     
     try:
-        response = requests.post(
-            "https://api.anthropic.com/v1/messages",
+        with _SESSION.post(
+            f"{ANTHROPIC_API}/v1/messages",
             headers={
                 "x-api-key": ANTHROPIC_API_KEY,
                 "anthropic-version": "2023-06-01",
@@ -112,25 +292,16 @@ def call_anthropic_api(prompt: str, model: str = DEFAULT_MODEL) -> Optional[Dict
             },
             json={
                 "model": model_id,
-                "max_tokens": 500,
-                "messages": [{"role": "user", "content": prompt}]
+                "max_tokens": max_tokens,
+                "system": system_blocks,
+                "messages": [{"role": "user", "content": user_text}],
+                "stream": True
             },
-            timeout=30
-        )
-        
-        if response.status_code == 200:
-            data = response.json()
-            content = data.get("content", [{}])[0].get("text", "")
-            
-            # Parse JSON from response
-            try:
-                # Find JSON in response
-                start = content.find("{")
-                end = content.rfind("}") + 1
-                if start >= 0 and end > start:
-                    return json.loads(content[start:end])
-            except json.JSONDecodeError:
-                pass
+            timeout=30,
+            stream=True
+        ) as response:
+            if response.status_code == 200:
+                return _read_streamed_json(response, _anthropic_delta, array)
         
         return None
         
@@ -139,7 +310,8 @@ def call_anthropic_api(prompt: str, model: str = DEFAULT_MODEL) -> Optional[Dict
         return None
 
 
-def call_openrouter_api(prompt: str, model: str = DEFAULT_MODEL) -> Optional[Dict]:
+def call_openrouter_api(system_blocks: List[Dict], user_text: str, model: str = DEFAULT_MODEL,
+                        max_tokens: int = MAX_TOKENS_PER_SIGNAL, array: bool = False) -> Optional[Union[Dict, List]]:
     """Call OpenRouter API (often cheaper)."""
     if not OPENROUTER_API_KEY:
         return None
@@ -154,32 +326,26 @@ def call_openrouter_api(prompt: str, model: str = DEFAULT_MODEL) -> Optional[Dic
     model_id = openrouter_models.get(model, openrouter_models[DEFAULT_MODEL])
     
     try:
-        response = requests.post(
-            "https://openrouter.ai/api/v1/chat/completions",
+        with _SESSION.post(
+            f"{OPENROUTER_API}/api/v1/chat/completions",
             headers={
                 "Authorization": f"Bearer {OPENROUTER_API_KEY}",
                 "Content-Type": "application/json"
             },
             json={
                 "model": model_id,
-                "messages": [{"role": "user", "content": prompt}],
-                "max_tokens": 500
+                "messages": [
+                    {"role": "system", "content": system_blocks},
+                    {"role": "user", "content": user_text},
+                ],
+                "max_tokens": max_tokens,
+                "stream": True
             },
-            timeout=30
-        )
-        
-        if response.status_code == 200:
-            data = response.json()
-            content = data.get("choices", [{}])[0].get("message", {}).get("content", "")
-            
-            # Parse JSON from response
-            try:
-                start = content.find("{")
-                end = content.rfind("}") + 1
-                if start >= 0 and end > start:
-                    return json.loads(content[start:end])
-            except json.JSONDecodeError:
-                pass
+            timeout=30,
+            stream=True
+        ) as response:
+            if response.status_code == 200:
+                return _read_streamed_json(response, _openrouter_delta, array)
         
         return None
         
@@ -206,23 +372,34 @@ def get_ai_signal(indicators: Dict, market_info: Dict,
         Signal dict with signal, confidence, reasoning, position_size_pct
     """
     # Build prompt
-    prompt = get_trading_prompt(indicators, market_info, recent_signals)
+    system_blocks, user_text = get_trading_prompt(indicators, market_info, recent_signals)
     
-    # Try to get AI response
+    result = _call_provider(system_blocks, user_text, model, provider)
+    return _finalize_signal(result, model)
+
+
+def _call_provider(system_blocks: List[Dict], user_text: str, model: str, provider: str,
+                   max_tokens: int = MAX_TOKENS_PER_SIGNAL, array: bool = False) -> Optional[Union[Dict, List]]:
+    """Send a prompt to the chosen provider ("auto" tries OpenRouter, then Anthropic)."""
     result = None
     
     if provider == "auto":
         # Try OpenRouter first (often cheaper), then Anthropic
-        result = call_openrouter_api(prompt, model)
+        result = call_openrouter_api(system_blocks, user_text, model, max_tokens, array)
         if not result:
-            result = call_anthropic_api(prompt, model)
+            result = call_anthropic_api(system_blocks, user_text, model, max_tokens, array)
     elif provider == "openrouter":
-        result = call_openrouter_api(prompt, model)
+        result = call_openrouter_api(system_blocks, user_text, model, max_tokens, array)
     elif provider == "anthropic":
-        result = call_anthropic_api(prompt, model)
+        result = call_anthropic_api(system_blocks, user_text, model, max_tokens, array)
     
+    return result
+
+
+def _finalize_signal(result: Optional[Dict], model: str) -> Dict:
+    """Add metadata to a parsed verdict, or fall back to HOLD if there isn't one."""
     # If AI call failed, return HOLD
-    if not result:
+    if not isinstance(result, dict):
         return {
             "signal": "HOLD",
             "confidence": "LOW",
@@ -239,6 +416,53 @@ def get_ai_signal(indicators: Dict, market_info: Dict,
     return result
 
 
+def get_ai_signals_batch(snapshots: List[Tuple[Dict, Dict]],
+                         model: str = DEFAULT_MODEL,
+                         provider: str = "auto") -> List[Dict]:
+    """
+    Get trading signals for several market snapshots with one request per
+    AI_BATCH_MAX snapshots.
+    
+    The snapshots share one system prompt and one round trip, so the fixed
+    per-call overhead is paid once per batch instead of once per market.
+    A single snapshot goes through get_ai_signal unchanged.
+    
+    Args:
+        snapshots: (indicators, market_info) pairs, e.g. one per market
+        model: "opus", "sonnet", or "haiku"
+        provider: "anthropic", "openrouter", or "auto"
+    
+    Returns:
+        One signal dict per snapshot, in order (HOLD for any the model missed)
+    """
+    if len(snapshots) <= 1:
+        return [get_ai_signal(ind, info, model=model, provider=provider) for ind, info in snapshots]
+    
+    signals = []
+    for i in range(0, len(snapshots), AI_BATCH_MAX):
+        batch = snapshots[i:i + AI_BATCH_MAX]
+        
+        sections = []
+        for n, (indicators, market_info) in enumerate(batch, 1):
+            system_blocks, user_text = get_trading_prompt(indicators, market_info)
+            sections.append(f"# Snapshot {n}\n{user_text}")
+        user_text = (
+            f"Evaluate each of the following {len(batch)} market snapshots independently.\n\n"
+            + "\n".join(sections)
+            + f"\nRespond with ONLY a JSON array of {len(batch)} objects, one per snapshot "
+            "in the same order, each in the response format above."
+        )
+        
+        results = _call_provider(system_blocks, user_text, model, provider,
+                                 MAX_TOKENS_PER_SIGNAL * len(batch), array=True)
+        if not isinstance(results, list):
+            results = []
+        signals.extend(_finalize_signal(results[n] if n < len(results) else None, model)
+                       for n in range(len(batch)))
+    
+    return signals
+
+
 def estimate_cost(model: str = DEFAULT_MODEL) -> str:
     """Estimate cost per signal."""
     # Approximate tokens per call: ~800 input, ~100 output
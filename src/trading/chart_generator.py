@@ -15,8 +15,17 @@ Charts generated:
 """
 
 import io
+import multiprocessing
+import os
+import sys
+import threading
+import time
 import base64
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
 from typing import Dict, List, Optional, Tuple
 from pathlib import Path
@@ -25,8 +34,20 @@ import matplotlib
 matplotlib.use('Agg')  # Non-interactive backend
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
-from matplotlib.patches import Rectangle
+from matplotlib.collections import LineCollection, PolyCollection
 import numpy as np
+try:
+    from src.utils.fast_json import json_loads
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+    from src.utils.fast_json import json_loads
+
+# Pillow (normally installed alongside matplotlib) lets us ship WebP to the AI
+try:
+    from PIL import Image
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
 
 # Chart styling - dark theme for clarity
 CHART_STYLE = {
@@ -42,11 +63,71 @@ CHART_STYLE = {
     'rsi_color': '#ff69b4',     # Pink for RSI
 }
 
+CRYPTOCOMPARE_API = "https://min-api.cryptocompare.com"
+
+# Shared session - the per-timeframe fetches reuse one TLS connection pool.
+# 429s fail fast instead of being re-sent after an uncapped Retry-After sleep
+_SESSION = requests.Session()
+_SESSION.mount(CRYPTOCOMPARE_API, HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[500, 502, 503, 504],
+                      respect_retry_after_header=False)
+))
+
+# Seconds fetched candles are reused per timeframe - longer candles change
+# less often (the forming candle's close is the only thing that moves)
+OHLCV_CACHE_TTL = {"15m": 60, "1h": 300, "4h": 900}
+# (timeframe, limit) -> (fetched_at monotonic, candles)
+_ohlcv_cache: Dict[Tuple[str, int], Tuple[float, List[Dict]]] = {}
+
+# Max base64-encoded charts kept in memory by chart_to_base64
+CHART_CACHE_SIZE = 16
+
+# 12x8in at 100 dpi is already larger than the vision model's downsampled
+# input. No bbox_inches='tight' either: it renders the figure twice to measure
+# it, and tight_layout() in draw_candlestick_chart already trims the margins
+CHART_DPI = 100
+
+# Lossy WebP is several times smaller than the PNG and the model downsamples
+# images anyway, so nothing it can read is lost
+CHART_WEBP_QUALITY = 75
+
+# Worker processes for rendering - one per chart timeframe
+CHART_RENDER_WORKERS = 3
+_chart_pool: Optional[ProcessPoolExecutor] = None
+
+# Threads for the per-timeframe candle fetches (I/O-bound), kept between calls
+_fetch_pool: Optional[ThreadPoolExecutor] = None
+
+# Serialises generate_trading_charts - an abandoned speculative build (see
+# ai_consensus_signal) can still be running in its worker thread when the
+# next one starts, and both would touch the pools, caches and pyplot state
+_charts_lock = threading.Lock()
+
+# Chart path -> candle key of the image currently on disk, so unchanged data
+# isn't re-rendered (see _candles_key)
+_rendered_charts: Dict[str, Tuple] = {}
+
+# (figsize, show_rsi, show_volume) -> (fig, ax_price, ax_rsi, ax_vol), reused by
+# draw_candlestick_chart so each render only clears and redraws the axes
+_figures: Dict[Tuple, Tuple] = {}
+
+# Chart path -> (mtime_ns, PNG bytes) of the last image written, so
+# chart_to_base64 can encode from memory instead of reading the file back
+_chart_png: Dict[str, Tuple[int, bytes]] = {}
+
+# (chart path, mtime_ns, webp) -> base64 string, least recently used first
+_base64_cache: "OrderedDict[Tuple[str, int, bool], str]" = OrderedDict()
+
 
 def fetch_ohlcv_data(timeframe: str = "15m", limit: int = 100) -> List[Dict]:
     """
     Fetch OHLCV (Open, High, Low, Close, Volume) data from CryptoCompare.
     
+    Results are reused for OHLCV_CACHE_TTL[timeframe] seconds; failed
+    (empty) fetches are not cached.
+    
     Args:
         timeframe: "15m", "1h", or "4h"
         limit: Number of candles to fetch
@@ -54,6 +135,19 @@ def fetch_ohlcv_data(timeframe: str = "15m", limit: int = 100) -> List[Dict]:
     Returns:
         List of candle dicts with timestamp, open, high, low, close, volume
     """
+    key = (timeframe, limit)
+    cached = _ohlcv_cache.get(key)
+    if cached and time.monotonic() - cached[0] < OHLCV_CACHE_TTL.get(timeframe, 60):
+        return cached[1]
+    
+    candles = _fetch_ohlcv_uncached(timeframe, limit)
+    if candles:
+        _ohlcv_cache[key] = (time.monotonic(), candles)
+    return candles
+
+
+def _fetch_ohlcv_uncached(timeframe: str, limit: int) -> List[Dict]:
+    """Fetch candles from the CryptoCompare API (see fetch_ohlcv_data)."""
     # Map timeframe to API endpoint
     endpoint_map = {
         "15m": ("histominute", 15),  # 15-minute aggregation
@@ -66,7 +160,7 @@ def fetch_ohlcv_data(timeframe: str = "15m", limit: int = 100) -> List[Dict]:
     try:
         # CryptoCompare API
         if endpoint == "histominute":
-            url = "https://min-api.cryptocompare.com/data/v2/histominute"
+            url = f"{CRYPTOCOMPARE_API}/data/v2/histominute"
             params = {
                 "fsym": "BTC",
                 "tsym": "USD",
@@ -74,7 +168,7 @@ def fetch_ohlcv_data(timeframe: str = "15m", limit: int = 100) -> List[Dict]:
                 "aggregate": aggregate
             }
         else:
-            url = "https://min-api.cryptocompare.com/data/v2/histohour"
+            url = f"{CRYPTOCOMPARE_API}/data/v2/histohour"
             params = {
                 "fsym": "BTC",
                 "tsym": "USD",
@@ -82,9 +176,9 @@ def fetch_ohlcv_data(timeframe: str = "15m", limit: int = 100) -> List[Dict]:
                 "aggregate": aggregate
             }
         
-        response = requests.get(url, params=params, timeout=15)
+        response = _SESSION.get(url, params=params, timeout=15)
         response.raise_for_status()
-        data = response.json()
+        data = json_loads(response.content)
         
         if data.get("Response") == "Success" and data.get("Data", {}).get("Data"):
             candles = []
@@ -123,80 +217,103 @@ def fetch_ohlcv_data(timeframe: str = "15m", limit: int = 100) -> List[Dict]:
     return []
 
 
-def calculate_vwap(candles: List[Dict]) -> List[float]:
-    """Calculate VWAP for the candle series."""
-    vwap_values = []
-    cumulative_tp_vol = 0
-    cumulative_vol = 0
-    
-    for candle in candles:
-        typical_price = (candle["high"] + candle["low"] + candle["close"]) / 3
-        volume = candle["volume"]
-        
-        cumulative_tp_vol += typical_price * volume
-        cumulative_vol += volume
-        
-        if cumulative_vol > 0:
-            vwap_values.append(cumulative_tp_vol / cumulative_vol)
-        else:
-            vwap_values.append(typical_price)
-    
-    return vwap_values
+def calculate_vwap(highs: np.ndarray, lows: np.ndarray, closes: np.ndarray,
+                   volumes: np.ndarray) -> np.ndarray:
+    """Calculate the running VWAP for the candle series."""
+    typical = (highs + lows + closes) / 3
+    cumulative_vol = np.cumsum(volumes)
+    cumulative_tp_vol = np.cumsum(typical * volumes)
+    
+    # No volume yet - fall back to the typical price
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(cumulative_vol > 0, cumulative_tp_vol / cumulative_vol, typical)
 
 
-def calculate_rsi(candles: List[Dict], period: int = 14) -> List[Optional[float]]:
-    """Calculate RSI for the candle series."""
-    rsi_values = [None] * period
-    
-    if len(candles) < period + 1:
-        return [None] * len(candles)
+def _wilder_series(values: np.ndarray, period: int) -> np.ndarray:
+    """
+    Wilder-smoothed averages for values[period-1:], seeded with the first SMA.
     
-    # Calculate price changes
-    changes = []
-    for i in range(1, len(candles)):
-        changes.append(candles[i]["close"] - candles[i-1]["close"])
+    avg_k = (avg_{k-1} * (period - 1) + x_k) / period, unrolled into
+    decay**k * (seed + cumsum(x_j * decay**-j) / period) so it runs as array
+    ops. decay**-j stays finite for several thousand steps - far more candles
+    than a chart holds.
+    """
+    decay = (period - 1) / period
+    rest = values[period:]
+    steps = np.arange(1, rest.size + 1)
+    seed = values[:period].mean()
+    smoothed = decay ** steps * (seed + np.cumsum(rest * decay ** -steps) / period)
+    return np.concatenate(([seed], smoothed))
+
+
+def calculate_rsi(closes: np.ndarray, period: int = 14) -> np.ndarray:
+    """Calculate RSI for the candle series (NaN until `period` changes are available)."""
+    rsi = np.full(closes.size, np.nan)
+    if closes.size < period + 1:
+        return rsi
+    
+    changes = np.diff(closes)
+    avg_gain = _wilder_series(np.maximum(changes, 0), period)
+    avg_loss = _wilder_series(np.maximum(-changes, 0), period)
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rsi[period:] = np.where(avg_loss == 0, 100.0, 100 - 100 / (1 + avg_gain / avg_loss))
+    return rsi
+
+
+def calculate_sma(closes: np.ndarray, period: int = 20) -> np.ndarray:
+    """Calculate Simple Moving Average (NaN until `period` closes are available)."""
+    sma = np.full(closes.size, np.nan)
+    if closes.size >= period:
+        sma[period - 1:] = np.convolve(closes, np.ones(period) / period, mode='valid')
+    return sma
+
+
+def _get_figure(figsize: Tuple[int, int], show_rsi: bool, show_volume: bool) -> Tuple:
+    """
+    Get a cleared figure and axes for a chart layout, building it on first use.
     
-    # Calculate initial average gain/loss
-    gains = [max(0, c) for c in changes[:period]]
-    losses = [abs(min(0, c)) for c in changes[:period]]
+    Building the subplot grid and twin volume axis is a large share of the
+    per-chart cost for short candle lists; clearing the axes is much cheaper.
     
-    avg_gain = sum(gains) / period
-    avg_loss = sum(losses) / period
+    Returns:
+        (fig, ax_price, ax_rsi, ax_vol) - ax_rsi / ax_vol are None when not shown
+    """
+    key = (tuple(figsize), show_rsi, show_volume)
+    cached = _figures.get(key)
+    if cached is not None and plt.fignum_exists(cached[0].number):
+        fig, ax_price, ax_rsi, ax_vol = cached
+        for ax in (ax_price, ax_rsi, ax_vol):
+            if ax is not None:
+                ax.clear()
+        # clear() restores default tick placement, undo that for the shared
+        # x-axis and the right-hand volume axis
+        if ax_rsi is not None:
+            ax_price.tick_params(axis='x', labelbottom=False)
+        if ax_vol is not None:
+            ax_vol.yaxis.tick_right()
+            ax_vol.yaxis.set_label_position('right')
+        return cached
     
-    # First RSI
-    if avg_loss == 0:
-        rsi_values.append(100)
+    # Create figure with subplots
+    if show_rsi:
+        fig, (ax_price, ax_rsi) = plt.subplots(
+            2, 1, figsize=figsize,
+            gridspec_kw={'height_ratios': [3, 1]},
+            sharex=True
+        )
     else:
-        rs = avg_gain / avg_loss
-        rsi_values.append(100 - (100 / (1 + rs)))
-    
-    # Subsequent RSI values using smoothed method
-    for i in range(period, len(changes)):
-        gain = max(0, changes[i])
-        loss = abs(min(0, changes[i]))
-        
-        avg_gain = (avg_gain * (period - 1) + gain) / period
-        avg_loss = (avg_loss * (period - 1) + loss) / period
-        
-        if avg_loss == 0:
-            rsi_values.append(100)
-        else:
-            rs = avg_gain / avg_loss
-            rsi_values.append(100 - (100 / (1 + rs)))
+        fig, ax_price = plt.subplots(figsize=figsize)
+        ax_rsi = None
+    ax_vol = ax_price.twinx() if show_volume else None
     
-    return rsi_values
+    _figures[key] = (fig, ax_price, ax_rsi, ax_vol)
+    return _figures[key]
 
 
-def calculate_sma(candles: List[Dict], period: int = 20) -> List[Optional[float]]:
-    """Calculate Simple Moving Average."""
-    sma_values = [None] * (period - 1)
-    
-    for i in range(period - 1, len(candles)):
-        window = candles[i - period + 1:i + 1]
-        avg = sum(c["close"] for c in window) / period
-        sma_values.append(avg)
-    
-    return sma_values
+def _is_template_figure(fig: plt.Figure) -> bool:
+    """True if fig is one of the reusable figures from _get_figure."""
+    return any(entry[0] is fig for entry in _figures.values())
 
 
 def draw_candlestick_chart(
@@ -223,7 +340,8 @@ def draw_candlestick_chart(
         figsize: Figure size
     
     Returns:
-        matplotlib Figure object
+        matplotlib Figure object (reused between calls with the same layout -
+        don't close it, see _is_template_figure)
     """
     if not candles:
         fig, ax = plt.subplots(figsize=figsize)
@@ -232,16 +350,7 @@ def draw_candlestick_chart(
     
     style = CHART_STYLE
     
-    # Create figure with subplots
-    if show_rsi:
-        fig, (ax_price, ax_rsi) = plt.subplots(
-            2, 1, figsize=figsize,
-            gridspec_kw={'height_ratios': [3, 1]},
-            sharex=True
-        )
-    else:
-        fig, ax_price = plt.subplots(figsize=figsize)
-        ax_rsi = None
+    fig, ax_price, ax_rsi, ax_vol = _get_figure(figsize, show_rsi, show_volume)
     
     fig.patch.set_facecolor(style['bg_color'])
     ax_price.set_facecolor(style['bg_color'])
@@ -250,11 +359,11 @@ def draw_candlestick_chart(
     
     # Extract data
     timestamps = [c["timestamp"] for c in candles]
-    opens = [c["open"] for c in candles]
-    highs = [c["high"] for c in candles]
-    lows = [c["low"] for c in candles]
-    closes = [c["close"] for c in candles]
-    volumes = [c["volume"] for c in candles]
+    opens = np.array([c["open"] for c in candles], dtype=np.float64)
+    highs = np.array([c["high"] for c in candles], dtype=np.float64)
+    lows = np.array([c["low"] for c in candles], dtype=np.float64)
+    closes = np.array([c["close"] for c in candles], dtype=np.float64)
+    volumes = np.array([c["volume"] for c in candles], dtype=np.float64)
     
     # Calculate candle width based on timeframe
     if len(timestamps) > 1:
@@ -262,55 +371,51 @@ def draw_candlestick_chart(
     else:
         width = 0.01
     
-    # Draw candlesticks
-    for i, candle in enumerate(candles):
-        color = style['up_color'] if candle["close"] >= candle["open"] else style['down_color']
-        
-        # Candle body
-        body_bottom = min(candle["open"], candle["close"])
-        body_height = abs(candle["close"] - candle["open"])
-        
-        rect = Rectangle(
-            (mdates.date2num(candle["timestamp"]) - width/2, body_bottom),
-            width, body_height,
-            facecolor=color,
-            edgecolor=color,
-            linewidth=0.5
-        )
-        ax_price.add_patch(rect)
-        
-        # Wicks
-        ax_price.plot(
-            [candle["timestamp"], candle["timestamp"]],
-            [candle["low"], candle["high"]],
-            color=color,
-            linewidth=1
-        )
+    # Draw candlesticks - one collection each for bodies and wicks rather
+    # than an artist per candle
+    x = mdates.date2num(timestamps)
+    rising = closes >= opens
+    colors = np.where(rising, style['up_color'], style['down_color'])
+    
+    # Candle bodies: one rectangle (4 corners) per candle
+    left, right = x - width/2, x + width/2
+    body_bottom = np.minimum(opens, closes)
+    body_top = np.maximum(opens, closes)
+    bodies = np.stack([
+        np.column_stack([left, body_bottom]),
+        np.column_stack([left, body_top]),
+        np.column_stack([right, body_top]),
+        np.column_stack([right, body_bottom]),
+    ], axis=1)
+    ax_price.add_collection(PolyCollection(
+        bodies, facecolors=colors, edgecolors=colors, linewidths=0.5, zorder=1
+    ))
+    
+    # Wicks: one low-high segment per candle
+    wicks = np.stack([np.column_stack([x, lows]), np.column_stack([x, highs])], axis=1)
+    ax_price.add_collection(LineCollection(wicks, colors=colors, linewidths=1, zorder=2))
+    ax_price.autoscale_view()
     
     # Draw VWAP
     if show_vwap:
-        vwap = calculate_vwap(candles)
+        vwap = calculate_vwap(highs, lows, closes, volumes)
         ax_price.plot(timestamps, vwap, color=style['vwap_color'], 
                      linewidth=1.5, label='VWAP', linestyle='--')
     
     # Draw SMA
     if show_sma:
-        sma = calculate_sma(candles, 20)
-        valid_sma = [(t, v) for t, v in zip(timestamps, sma) if v is not None]
-        if valid_sma:
-            sma_times, sma_vals = zip(*valid_sma)
-            ax_price.plot(sma_times, sma_vals, color=style['ma_color'],
+        sma = calculate_sma(closes, 20)
+        if not np.isnan(sma).all():
+            # NaN warm-up points are simply not drawn
+            ax_price.plot(timestamps, sma, color=style['ma_color'],
                          linewidth=1.5, label='SMA(20)')
     
     # Draw volume bars on secondary axis
     if show_volume:
-        ax_vol = ax_price.twinx()
         ax_vol.set_facecolor('none')
         
-        for i, candle in enumerate(candles):
-            color = style['volume_up'] if candle["close"] >= candle["open"] else style['volume_down']
-            ax_vol.bar(candle["timestamp"], candle["volume"], width=width,
-                      color=color, alpha=0.5)
+        ax_vol.bar(x, volumes, width=width, alpha=0.5,
+                   color=np.where(rising, style['volume_up'], style['volume_down']))
         
         ax_vol.set_ylim(0, max(volumes) * 4)  # Volume takes 25% of chart
         ax_vol.set_ylabel('Volume', color=style['text_color'], fontsize=10)
@@ -319,11 +424,11 @@ def draw_candlestick_chart(
     
     # Draw RSI
     if show_rsi and ax_rsi:
-        rsi = calculate_rsi(candles)
-        valid_rsi = [(t, v) for t, v in zip(timestamps, rsi) if v is not None]
-        if valid_rsi:
-            rsi_times, rsi_vals = zip(*valid_rsi)
-            ax_rsi.plot(rsi_times, rsi_vals, color=style['rsi_color'], linewidth=1.5)
+        rsi = calculate_rsi(closes)
+        valid = ~np.isnan(rsi)
+        if valid.any():
+            rsi_times = [t for t, ok in zip(timestamps, valid) if ok]
+            ax_rsi.plot(rsi_times, rsi[valid], color=style['rsi_color'], linewidth=1.5)
             ax_rsi.axhline(70, color='#ff4757', linestyle='--', alpha=0.5, linewidth=1)
             ax_rsi.axhline(30, color='#00d26a', linestyle='--', alpha=0.5, linewidth=1)
             ax_rsi.axhline(50, color=style['grid_color'], linestyle='-', alpha=0.3, linewidth=1)
@@ -343,6 +448,10 @@ def draw_candlestick_chart(
     ax_price.legend(loc='upper left', facecolor=style['bg_color'], 
                    edgecolor=style['grid_color'], labelcolor=style['text_color'])
     
+    # Pin the x-range to this series - a reused figure otherwise keeps the
+    # shared x-limits of a longer earlier render (RSI and volume axes share it)
+    ax_price.set_xlim(x[0] - width, x[-1] + width)
+    
     # Format x-axis
     if ax_rsi:
         ax_rsi.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M' if timeframe == "15m" else '%m/%d %H:%M'))
@@ -377,17 +486,86 @@ def draw_candlestick_chart(
         va='top'
     )
     
-    plt.tight_layout()
+    fig.tight_layout()
     return fig
 
 
+def _candles_key(candles: List[Dict]) -> Tuple:
+    """
+    Identify a candle series for chart caching.
+    
+    Earlier candles are closed, so the first timestamp plus the whole of the
+    latest (still forming) candle is enough to tell whether the chart changed.
+    """
+    first, last = candles[0], candles[-1]
+    return (len(candles), first["timestamp"], last["timestamp"], last["open"],
+            last["high"], last["low"], last["close"], last["volume"])
+
+
+def _init_chart_worker():
+    """Warm a render process: load the Agg backend and font cache up front."""
+    matplotlib.use('Agg')
+    plt.close(plt.figure())
+
+
+def _get_chart_pool() -> ProcessPoolExecutor:
+    """Get the render process pool, starting it on first use."""
+    global _chart_pool
+    if _chart_pool is None:
+        # Spawn, not fork: by now this process runs fetch threads, HTTP
+        # sessions and the logger thread, and a forked child can inherit
+        # their locks mid-acquire and deadlock
+        _chart_pool = ProcessPoolExecutor(max_workers=CHART_RENDER_WORKERS,
+                                          mp_context=multiprocessing.get_context("spawn"),
+                                          initializer=_init_chart_worker)
+    return _chart_pool
+
+
+def _get_fetch_pool() -> ThreadPoolExecutor:
+    """Get the candle fetch thread pool, starting it on first use."""
+    global _fetch_pool
+    if _fetch_pool is None:
+        _fetch_pool = ThreadPoolExecutor(max_workers=CHART_RENDER_WORKERS,
+                                         thread_name_prefix="chart-fetch")
+    return _fetch_pool
+
+
+def _render_chart(candles: List[Dict], title: str, timeframe: str) -> bytes:
+    """Draw one chart and return it as PNG bytes (runs in a worker process)."""
+    fig = draw_candlestick_chart(candles, title, timeframe)
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png', dpi=CHART_DPI, facecolor=CHART_STYLE['bg_color'])
+    if not _is_template_figure(fig):
+        plt.close(fig)
+    return buf.getvalue()
+
+
+def _save_chart(filepath: str, png: bytes):
+    """Write a rendered chart to disk and keep its bytes for chart_to_base64."""
+    path = Path(filepath)
+    path.write_bytes(png)
+    _chart_png[filepath] = (path.stat().st_mtime_ns, png)
+
+
 def generate_trading_charts(output_dir: str = "data/charts") -> Dict[str, str]:
     """
     Generate all trading charts and save to files.
     
+    Candle data is fetched concurrently over the shared keep-alive session, so
+    the fetch costs about one round trip rather than three, and the charts
+    that changed are rendered in parallel worker processes (matplotlib is
+    CPU-bound).
+    
     Returns:
         Dict mapping timeframe to file path
     """
+    with _charts_lock:
+        return _generate_trading_charts(output_dir)
+
+
+def _generate_trading_charts(output_dir: str) -> Dict[str, str]:
+    """generate_trading_charts without the lock."""
+    global _chart_pool
     Path(output_dir).mkdir(parents=True, exist_ok=True)
     
     charts = {}
@@ -399,32 +577,89 @@ def generate_trading_charts(output_dir: str = "data/charts") -> Dict[str, str]:
         ("4h", 18, "BTC/USD - 4 Hour Candles (Last 3 Days)"),
     ]
     
-    for timeframe, limit, title in configs:
-        print(f"Generating {timeframe} chart...")
-        candles = fetch_ohlcv_data(timeframe, limit)
+    print("Generating charts...")
+    all_candles = list(_get_fetch_pool().map(lambda c: fetch_ohlcv_data(c[0], c[1]), configs))
+    
+    to_render = []  # (timeframe, filepath, key, args for _render_chart)
+    for (timeframe, limit, title), candles in zip(configs, all_candles):
+        if not candles:
+            print(f"  ✗ No data for {timeframe}")
+            continue
         
-        if candles:
-            fig = draw_candlestick_chart(candles, title, timeframe)
-            
-            # Save to file
-            filepath = f"{output_dir}/btc_{timeframe}.png"
-            fig.savefig(filepath, dpi=150, bbox_inches='tight',
-                       facecolor=CHART_STYLE['bg_color'])
-            plt.close(fig)
-            
+        filepath = f"{output_dir}/btc_{timeframe}.png"
+        
+        # Same candles as the image already on disk - skip the redraw
+        key = _candles_key(candles)
+        if _rendered_charts.get(filepath) == key and os.path.exists(filepath):
             charts[timeframe] = filepath
-            print(f"  ✓ Saved to {filepath}")
-        else:
-            print(f"  ✗ No data for {timeframe}")
+            print(f"  ✓ {timeframe} unchanged, reusing {filepath}")
+            continue
+        
+        to_render.append((timeframe, filepath, key, (candles, title, timeframe)))
+    
+    if to_render:
+        try:
+            pool = _get_chart_pool()
+            futures = [pool.submit(_render_chart, *args) for _, _, _, args in to_render]
+            images = [future.result(timeout=30) for future in futures]
+        except Exception as e:
+            # Broken/unavailable pool - render in this process instead, and
+            # let the next call start a fresh pool
+            print(f"  ⚠️ Parallel rendering failed ({e}), rendering inline")
+            if _chart_pool is not None:
+                _chart_pool.shutdown(wait=False, cancel_futures=True)
+                _chart_pool = None
+            images = [_render_chart(*args) for _, _, _, args in to_render]
+        
+        for (timeframe, filepath, key, _), png in zip(to_render, images):
+            _save_chart(filepath, png)
+            _rendered_charts[filepath] = key
+            charts[timeframe] = filepath
+            print(f"  ✓ Saved {timeframe} to {filepath}")
     
     return charts
 
 
-def chart_to_base64(filepath: str) -> Optional[str]:
-    """Convert chart image to base64 for API transmission."""
+def _to_webp(png_bytes: bytes, quality: int = CHART_WEBP_QUALITY) -> bytes:
+    """Re-encode PNG bytes as lossy WebP."""
+    out = io.BytesIO()
+    Image.open(io.BytesIO(png_bytes)).save(out, format="WEBP", quality=quality, method=4)
+    return out.getvalue()
+
+
+def chart_to_base64(filepath: str, webp: bool = False) -> Optional[str]:
+    """
+    Convert chart image to base64 for API transmission (cached until the file changes).
+    
+    Args:
+        filepath: PNG chart path
+        webp: Encode as WebP (much smaller upload) when Pillow is available;
+            callers opting in must check the media type (base64 WebP starts "UklGR")
+    """
     try:
-        with open(filepath, "rb") as f:
-            return base64.b64encode(f.read()).decode("utf-8")
+        webp = webp and PIL_AVAILABLE
+        mtime_ns = os.stat(filepath).st_mtime_ns
+        key = (filepath, mtime_ns, webp)
+        cached = _base64_cache.get(key)
+        if cached is not None:
+            _base64_cache.move_to_end(key)
+            return cached
+        
+        # Freshly rendered charts are still in memory - no need to read them back
+        in_memory = _chart_png.get(filepath)
+        if in_memory is not None and in_memory[0] == mtime_ns:
+            data = in_memory[1]
+        else:
+            with open(filepath, "rb") as f:
+                data = f.read()
+        if webp:
+            data = _to_webp(data)
+        encoded = base64.b64encode(data).decode("utf-8")
+        
+        _base64_cache[key] = encoded
+        if len(_base64_cache) > CHART_CACHE_SIZE:
+            _base64_cache.popitem(last=False)
+        return encoded
     except Exception as e:
         print(f"Error encoding chart: {e}")
         return None
@@ -8,42 +8,120 @@ Implements:
 - Moving averages for trend confirmation
 """
 
-import pandas as pd
+import csv
+import io
+import math
+import os
+import sys
+import time
+from collections import deque
+
 import numpy as np
-from datetime import datetime, timedelta, timezone
-from typing import Optional, Tuple, Dict, List
+from datetime import datetime, timezone
+from typing import Optional, Tuple, Dict, List, Union
+
+# Numba is optional - when available, the loop-based kernels below are JIT-compiled
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Indicator inputs may be plain lists or numpy arrays
+PriceSeries = Union[List[float], np.ndarray]
+
+# Logger sampling interval (seconds) - used to size the in-memory row window
+SAMPLE_INTERVAL_SECONDS = 5
+# Extra rows kept beyond the window to absorb timestamp jitter
+WINDOW_PAD_ROWS = 12
+# Generous upper bound on CSV row size, used to skip old history on first load
+MAX_ROW_BYTES = 256
+
+TZ_UTC = timezone.utc
+
+# fromisoformat accepts a trailing "Z" from Python 3.11 on
+_FROMISO_HANDLES_Z = sys.version_info >= (3, 11)
+
+
+def _wilder_smooth(values: np.ndarray, period: int) -> float:
+    """
+    Apply Wilder's smoothing to a series and return the final average.
+    
+    Seeds with the SMA of the first `period` values, then applies
+    avg = (avg * (period - 1) + x) / period for each remaining value.
+    The recurrence is unrolled into a single weighted sum so it stays vectorized.
+    """
+    seed = values[:period].mean()
+    rest = values[period:]
+    if rest.size == 0:
+        return float(seed)
+    
+    decay = (period - 1) / period
+    weights = decay ** np.arange(rest.size - 1, -1, -1)
+    return float(seed * decay ** rest.size + (rest * weights).sum() / period)
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True)
+    def _rsi_averages_nb(arr, period):
+        """Wilder-smoothed average gain/loss over a contiguous float64 price array."""
+        avg_gain = 0.0
+        avg_loss = 0.0
+        for i in range(1, period + 1):
+            change = arr[i] - arr[i - 1]
+            if change > 0:
+                avg_gain += change
+            else:
+                avg_loss -= change
+        avg_gain /= period
+        avg_loss /= period
+        
+        for i in range(period + 1, arr.shape[0]):
+            change = arr[i] - arr[i - 1]
+            gain = change if change > 0 else 0.0
+            loss = -change if change < 0 else 0.0
+            avg_gain = (avg_gain * (period - 1) + gain) / period
+            avg_loss = (avg_loss * (period - 1) + loss) / period
+        return avg_gain, avg_loss
+    
+    @njit(cache=True, fastmath=True)
+    def _ema_nb(arr, period):
+        """EMA seeded with the SMA of the first `period` values."""
+        k = 2.0 / (period + 1)
+        ema = arr[:period].mean()
+        for i in range(period, arr.shape[0]):
+            ema = arr[i] * k + ema * (1.0 - k)
+        return ema
 
 
-def calculate_rsi(prices: List[float], period: int = 14) -> Optional[float]:
+def calculate_rsi(prices: PriceSeries, period: int = 14) -> Optional[float]:
     """
-    Calculate RSI (Relative Strength Index).
+    Calculate RSI (Relative Strength Index) using Wilder's smoothing.
     
     RSI = 100 - (100 / (1 + RS))
-    RS = Average Gain / Average Loss over period
+    RS = Average Gain / Average Loss (Wilder-smoothed over period)
     
     Args:
-        prices: List of prices (oldest to newest)
+        prices: Prices (oldest to newest) as a list or numpy array
         period: RSI period (default 14)
     
     Returns:
         RSI value (0-100) or None if insufficient data
     """
-    if len(prices) < period + 1:
+    arr = np.ascontiguousarray(prices, dtype=np.float64)
+    if arr.size < period + 1:
         return None
     
-    # Calculate price changes
-    changes = [prices[i] - prices[i-1] for i in range(1, len(prices))]
-    
-    # Separate gains and losses
-    gains = [max(0, c) for c in changes]
-    losses = [abs(min(0, c)) for c in changes]
-    
-    # Use only the last 'period' changes for calculation
-    recent_gains = gains[-(period):]
-    recent_losses = losses[-(period):]
-    
-    avg_gain = sum(recent_gains) / period
-    avg_loss = sum(recent_losses) / period
+    if NUMBA_AVAILABLE:
+        avg_gain, avg_loss = _rsi_averages_nb(arr, period)
+    else:
+        # Separate gains and losses from price changes
+        changes = np.diff(arr)
+        gains = np.clip(changes, 0, None)
+        losses = np.clip(-changes, 0, None)
+        
+        avg_gain = _wilder_smooth(gains, period)
+        avg_loss = _wilder_smooth(losses, period)
     
     if avg_loss == 0:
         return 100.0  # No losses = max RSI
@@ -54,34 +132,35 @@ def calculate_rsi(prices: List[float], period: int = 14) -> Optional[float]:
     return round(rsi, 2)
 
 
-def calculate_vwap(prices: List[float], volumes: List[float]) -> Optional[float]:
+def calculate_vwap(prices: PriceSeries, volumes: PriceSeries) -> Optional[float]:
     """
     Calculate VWAP (Volume Weighted Average Price).
     
     VWAP = Σ(Price × Volume) / Σ(Volume)
     
     Args:
-        prices: List of prices
-        volumes: List of corresponding volumes
+        prices: Prices as a list or numpy array
+        volumes: Corresponding volumes as a list or numpy array
     
     Returns:
         VWAP value or None if insufficient data
     """
-    if not prices or not volumes or len(prices) != len(volumes):
+    price_arr = np.asarray(prices, dtype=np.float64)
+    volume_arr = np.asarray(volumes, dtype=np.float64)
+    if price_arr.size == 0 or price_arr.shape != volume_arr.shape:
         return None
     
-    total_volume = sum(volumes)
+    total_volume = volume_arr.sum()
     if total_volume == 0:
         # Fallback to simple average if no volume data
-        return sum(prices) / len(prices)
+        return float(price_arr.mean())
     
-    price_volume_sum = sum(p * v for p, v in zip(prices, volumes))
-    vwap = price_volume_sum / total_volume
+    vwap = np.dot(price_arr, volume_arr) / total_volume
     
-    return round(vwap, 2)
+    return round(float(vwap), 2)
 
 
-def calculate_momentum(prices: List[float], lookback_seconds: int = 60, 
+def calculate_momentum(prices: PriceSeries, lookback_seconds: int = 60, 
                        interval_seconds: int = 5) -> Optional[float]:
     """
     Calculate price momentum over a time window.
@@ -89,7 +168,7 @@ def calculate_momentum(prices: List[float], lookback_seconds: int = 60,
     Momentum = (Current Price - Price N seconds ago) / Price N seconds ago * 100
     
     Args:
-        prices: List of prices (oldest to newest)
+        prices: Prices (oldest to newest) as a list or numpy array
         lookback_seconds: How far back to look (default 60s)
         interval_seconds: Time between price samples (default 5s)
     
@@ -108,15 +187,15 @@ def calculate_momentum(prices: List[float], lookback_seconds: int = 60,
         return None
     
     momentum = ((current_price - past_price) / past_price) * 100
-    return round(momentum, 4)
+    return round(float(momentum), 4)
 
 
-def calculate_sma(prices: List[float], period: int) -> Optional[float]:
+def calculate_sma(prices: PriceSeries, period: int) -> Optional[float]:
     """
     Calculate Simple Moving Average.
     
     Args:
-        prices: List of prices
+        prices: Prices as a list or numpy array
         period: Number of periods to average
     
     Returns:
@@ -125,10 +204,10 @@ def calculate_sma(prices: List[float], period: int) -> Optional[float]:
     if len(prices) < period:
         return None
     
-    return round(sum(prices[-period:]) / period, 2)
+    return round(float(np.mean(prices[-period:])), 2)
 
 
-def calculate_ema(prices: List[float], period: int) -> Optional[float]:
+def calculate_ema(prices: PriceSeries, period: int) -> Optional[float]:
     """
     Calculate Exponential Moving Average.
     
@@ -136,7 +215,7 @@ def calculate_ema(prices: List[float], period: int) -> Optional[float]:
     where k = 2 / (period + 1)
     
     Args:
-        prices: List of prices
+        prices: Prices as a list or numpy array
         period: EMA period
     
     Returns:
@@ -145,6 +224,9 @@ def calculate_ema(prices: List[float], period: int) -> Optional[float]:
     if len(prices) < period:
         return None
     
+    if NUMBA_AVAILABLE:
+        return round(float(_ema_nb(np.ascontiguousarray(prices, dtype=np.float64), period)), 2)
+    
     k = 2 / (period + 1)
     
     # Start with SMA for first EMA value
@@ -175,22 +257,42 @@ def calculate_vwap_deviation(current_price: float, vwap: float) -> float:
     return round(deviation, 4)
 
 
-def calculate_trend(prices: List[float], short_period: int = 5, 
+def calculate_trend(prices: PriceSeries, short_period: int = 5, 
                     long_period: int = 20) -> str:
     """
     Determine trend direction using moving average crossover.
     
     Args:
-        prices: List of prices
+        prices: Prices as a list or numpy array
         short_period: Short MA period
         long_period: Long MA period
     
     Returns:
         'UP', 'DOWN', or 'NEUTRAL'
     """
-    short_ma = calculate_sma(prices, short_period)
-    long_ma = calculate_sma(prices, long_period)
+    smas = _smas(prices, (short_period, long_period))
     
+    return _trend_from_smas(smas[short_period], smas[long_period])
+
+
+def _smas(prices: PriceSeries, periods: Tuple[int, ...]) -> Dict[int, Optional[float]]:
+    """
+    Calculate several SMAs in one pass over the shared tail.
+    
+    A single cumulative sum from the newest price backwards gives every
+    trailing-window sum, so each SMA is one lookup. Values are rounded like
+    calculate_sma; periods longer than the data map to None.
+    """
+    tail = np.asarray(prices[-max(periods):], dtype=np.float64)
+    trailing_sums = np.cumsum(tail[::-1])
+    return {
+        period: round(float(trailing_sums[period - 1] / period), 2) if tail.size >= period else None
+        for period in periods
+    }
+
+
+def _trend_from_smas(short_ma: Optional[float], long_ma: Optional[float]) -> str:
+    """Classify MA crossover as 'UP', 'DOWN', or 'NEUTRAL' (±0.05% band)."""
     if short_ma is None or long_ma is None:
         return 'NEUTRAL'
     
@@ -204,36 +306,272 @@ def calculate_trend(prices: List[float], short_period: int = 5,
         return 'NEUTRAL'
 
 
+def _parse_timestamp(timestamp_str: str) -> float:
+    """Parse a logger ISO timestamp (UTC, 'Z' suffix) to Unix seconds."""
+    if not _FROMISO_HANDLES_Z:
+        timestamp_str = timestamp_str.replace('Z', '+00:00')
+    parsed = datetime.fromisoformat(timestamp_str)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=TZ_UTC)
+    return parsed.timestamp()
+
+
 class IndicatorCalculator:
     """
     Wrapper class to calculate all indicators from price data.
     Designed to work with the CSV format from logger.py
+    
+    Indicators are maintained incrementally: each new price is pushed into
+    window-sized deques and O(1) running state (sums for SMA/VWAP, Wilder
+    averages for RSI, recursive EMA), so get_all_indicators is just getters.
     """
     
-    def __init__(self, csv_path: str = "data/btc_prices.csv"):
+    RSI_PERIOD = 14
+    EMA_PERIOD = 12
+    SMA_PERIODS = (5, 20)
+    MOMENTUM_LOOKBACK_SECONDS = 60
+    
+    def __init__(self, csv_path: str = "data/btc_prices.csv", minutes: int = 15):
         self.csv_path = csv_path
-        self.df = None
+        self.minutes = minutes
         self.last_load = None
+        # Incremental read state: byte offset of the next unread row and header columns
+        self._offset = 0
+        self._columns = None
+        self._reset()
+    
+    @staticmethod
+    def _window_rows(minutes: int) -> int:
+        """Number of rows needed to cover `minutes` of logger samples."""
+        return math.ceil(minutes * 60 / SAMPLE_INTERVAL_SECONDS) + WINDOW_PAD_ROWS
+    
+    def _reset(self):
+        """Clear the price window and all running indicator state."""
+        self.prices = deque()
+        self.volumes = deque()
+        self.timestamps = deque()
+        self._window_price_sum = 0.0
+        self._vwap_pv = 0.0
+        self._vwap_v = 0.0
+        self._sma_sums = {period: 0.0 for period in self.SMA_PERIODS}
+        self._ema = None
+        self._ema_seed_count = 0
+        self._ema_seed_sum = 0.0
+        self._avg_gain = None
+        self._avg_loss = None
+        self._rsi_seed_count = 0
+        self._rsi_seed_gain = 0.0
+        self._rsi_seed_loss = 0.0
+        self._last_price = None
+        self._pushes_since_resync = 0
+    
+    def push(self, price: float, volume: float, timestamp: float):
+        """
+        Add one price sample and update all running indicator state in O(1).
+        
+        The indicators count samples (RSI/SMA/EMA periods, momentum lookback),
+        so they assume one every SAMPLE_INTERVAL_SECONDS. The logger backs off
+        while the price is flat; the skipped slots are filled by holding the
+        previous sample, keeping the window on a uniform grid.
+        
+        Args:
+            price: BTC price
+            volume: 24h volume reported with the price
+            timestamp: Unix timestamp (seconds) of the sample
+        """
+        if self.timestamps:
+            last_ts = self.timestamps[-1]
+            gap = timestamp - last_ts
+            # A logger gap longer than the window makes all existing state stale
+            if gap > self.minutes * 60:
+                self._reset()
+            else:
+                held_price, held_volume = self.prices[-1], self.volumes[-1]
+                for i in range(1, round(gap / SAMPLE_INTERVAL_SECONDS)):
+                    self._push_sample(held_price, held_volume, last_ts + i * SAMPLE_INTERVAL_SECONDS)
+        
+        self._push_sample(price, volume, timestamp)
+    
+    def _push_sample(self, price: float, volume: float, timestamp: float):
+        """Append one grid sample and update the running state (see push)."""
+        self.prices.append(price)
+        self.volumes.append(volume)
+        self.timestamps.append(timestamp)
+        self._window_price_sum += price
+        self._vwap_pv += price * volume
+        self._vwap_v += volume
+        
+        for period in self._sma_sums:
+            self._sma_sums[period] += price
+            if len(self.prices) > period:
+                self._sma_sums[period] -= self.prices[-period - 1]
+        
+        # EMA: seed with SMA of the first EMA_PERIOD prices, then recurse
+        if self._ema is None:
+            self._ema_seed_count += 1
+            self._ema_seed_sum += price
+            if self._ema_seed_count == self.EMA_PERIOD:
+                self._ema = self._ema_seed_sum / self.EMA_PERIOD
+        else:
+            k = 2 / (self.EMA_PERIOD + 1)
+            self._ema = price * k + self._ema * (1 - k)
+        
+        # RSI: seed with SMA of the first RSI_PERIOD changes, then Wilder's smoothing
+        if self._last_price is not None:
+            change = price - self._last_price
+            gain = max(change, 0.0)
+            loss = max(-change, 0.0)
+            if self._avg_gain is None:
+                self._rsi_seed_count += 1
+                self._rsi_seed_gain += gain
+                self._rsi_seed_loss += loss
+                if self._rsi_seed_count == self.RSI_PERIOD:
+                    self._avg_gain = self._rsi_seed_gain / self.RSI_PERIOD
+                    self._avg_loss = self._rsi_seed_loss / self.RSI_PERIOD
+            else:
+                period = self.RSI_PERIOD
+                self._avg_gain = (self._avg_gain * (period - 1) + gain) / period
+                self._avg_loss = (self._avg_loss * (period - 1) + loss) / period
+        self._last_price = price
+        
+        if len(self.prices) > self._window_rows(self.minutes):
+            self._evict_oldest()
+        
+        # Periodically rebuild running sums to stop floating-point drift
+        self._pushes_since_resync += 1
+        if self._pushes_since_resync >= self._window_rows(self.minutes):
+            self._resync_sums()
+    
+    def _evict_oldest(self):
+        """Drop the oldest sample from the window and its running-sum contributions."""
+        n = len(self.prices)
+        price = self.prices.popleft()
+        volume = self.volumes.popleft()
+        self.timestamps.popleft()
+        self._window_price_sum -= price
+        self._vwap_pv -= price * volume
+        self._vwap_v -= volume
+        for period in self._sma_sums:
+            # The evicted price is only part of an SMA sum if the window was that short
+            if n <= period:
+                self._sma_sums[period] -= price
+    
+    def _resync_sums(self):
+        """Recompute running sums exactly from the window contents."""
+        n = len(self.prices)
+        prices = np.fromiter(self.prices, dtype=np.float64, count=n)
+        volumes = np.fromiter(self.volumes, dtype=np.float64, count=n)
+        self._window_price_sum = float(prices.sum())
+        self._vwap_pv = float(np.dot(prices, volumes))
+        self._vwap_v = float(volumes.sum())
+        for period in self._sma_sums:
+            self._sma_sums[period] = float(prices[-period:].sum())
+        self._pushes_since_resync = 0
+    
+    def _read_new_rows(self) -> List[Dict[str, str]]:
+        """
+        Parse rows written since the last call.
+        
+        Only bytes past the remembered offset are read and parsed. A trailing
+        partial line (logger mid-write) is left for the next call. If the file
+        shrank (e.g. header repair rewrote it) all state is rebuilt.
+        """
+        skip_partial = False
+        with open(self.csv_path, 'rb') as f:
+            f.seek(0, os.SEEK_END)
+            size = f.tell()
+            
+            if self._columns is None or size < self._offset:
+                # First read (or file rewritten): parse header, then jump
+                # close to the end instead of parsing the full history
+                f.seek(0)
+                self._columns = f.readline().decode().strip().split(',')
+                self._reset()
+                data_start = f.tell()
+                window_bytes = self._window_rows(self.minutes) * MAX_ROW_BYTES
+                self._offset = max(data_start, size - window_bytes)
+                skip_partial = self._offset > data_start
+            
+            f.seek(self._offset)
+            chunk = f.read(size - self._offset)
+        
+        if skip_partial:
+            # Landed mid-row - drop everything up to the first newline
+            first_newline = chunk.find(b'\n') + 1
+            chunk = chunk[first_newline:]
+            self._offset += first_newline
+        
+        end = chunk.rfind(b'\n') + 1
+        if end == 0:
+            return []
+        
+        self._offset += end
+        return list(csv.DictReader(io.StringIO(chunk[:end].decode()), fieldnames=self._columns))
     
     def load_data(self, minutes: int = 15) -> bool:
-        """Load recent price data from CSV."""
+        """Load recent price data from CSV (reads only rows appended since last call)."""
         try:
-            self.df = pd.read_csv(self.csv_path)
-            self.df['timestamp'] = pd.to_datetime(self.df['timestamp'])
+            if minutes != self.minutes:
+                # Different window requested - re-seed from the file tail
+                self.minutes = minutes
+                self._columns = None
+            
+            for row in self._read_new_rows():
+                try:
+                    price = float(row['price'])
+                    ts = _parse_timestamp(row['timestamp'])
+                except (TypeError, ValueError):
+                    continue  # Failed fetches are logged as ERROR rows - skip them
+                try:
+                    volume = float(row['volume_24h'])
+                except (TypeError, ValueError):
+                    volume = 0.0
+                self.push(price, volume, ts)
             
-            # Filter to recent data only (timezone-aware)
-            cutoff = datetime.now(timezone.utc) - timedelta(minutes=minutes)
-            self.df = self.df[self.df['timestamp'] > cutoff]
+            # Drop samples that fell out of the time window (Unix seconds, UTC)
+            cutoff = time.time() - minutes * 60
+            while self.timestamps and self.timestamps[0] <= cutoff:
+                self._evict_oldest()
             
-            self.last_load = datetime.utcnow()
-            return len(self.df) > 0
+            self.last_load = datetime.now(TZ_UTC)
+            return len(self.prices) > 0
         except Exception as e:
             print(f"Error loading data: {e}")
             return False
     
+    def _sma(self, period: int) -> Optional[float]:
+        if len(self.prices) < period:
+            return None
+        return round(self._sma_sums[period] / period, 2)
+    
+    def _rsi(self) -> Optional[float]:
+        if self._avg_gain is None:
+            return None
+        if self._avg_loss == 0:
+            return 100.0  # No losses = max RSI
+        rs = self._avg_gain / self._avg_loss
+        return round(100 - (100 / (1 + rs)), 2)
+    
+    def _vwap(self) -> Optional[float]:
+        if not self.prices:
+            return None
+        if self._vwap_v == 0:
+            # Fallback to simple average if no volume data
+            return self._window_price_sum / len(self.prices)
+        return round(self._vwap_pv / self._vwap_v, 2)
+    
+    def _momentum(self) -> Optional[float]:
+        samples_needed = self.MOMENTUM_LOOKBACK_SECONDS // SAMPLE_INTERVAL_SECONDS
+        if len(self.prices) < samples_needed + 1:
+            return None
+        past_price = self.prices[-(samples_needed + 1)]
+        if past_price == 0:
+            return None
+        return round(((self.prices[-1] - past_price) / past_price) * 100, 4)
+    
     def get_all_indicators(self) -> Dict:
         """
-        Calculate all indicators from loaded data.
+        Return all indicators from the running state.
         
         Returns dict with:
         - current_price
@@ -244,31 +582,34 @@ class IndicatorCalculator:
         - trend
         - data_points
         """
-        if self.df is None or len(self.df) == 0:
+        if not self.prices:
             return {"error": "No data loaded"}
         
-        prices = self.df['price'].tolist()
-        volumes = self.df['volume_24h'].tolist()
-        
-        current_price = prices[-1] if prices else None
+        current_price = self.prices[-1]
+        vwap = self._vwap()
+        sma_short, sma_long = (self._sma(period) for period in self.SMA_PERIODS)
         
         return {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": datetime.now(TZ_UTC).strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
             "current_price": current_price,
-            "rsi_14": calculate_rsi(prices, 14),
-            "vwap_15m": calculate_vwap(prices, volumes),
+            "rsi_14": self._rsi(),
+            "vwap_15m": vwap,
             "vwap_deviation_pct": calculate_vwap_deviation(
-                current_price, 
-                calculate_vwap(prices, volumes)
-            ) if current_price else None,
-            "momentum_60s": calculate_momentum(prices, 60, 5),
-            "trend": calculate_trend(prices),
-            "sma_20": calculate_sma(prices, 20),
-            "ema_12": calculate_ema(prices, 12),
-            "data_points": len(prices)
+                current_price,
+                vwap
+            ) if current_price and vwap is not None else None,
+            "momentum_60s": self._momentum(),
+            "trend": _trend_from_smas(sma_short, sma_long),
+            "sma_20": sma_long,
+            "ema_12": round(self._ema, 2) if self._ema is not None else None,
+            "data_points": len(self.prices)
         }
 
 
+# Calculators are kept per (csv_path, minutes) so repeated calls only read new rows
+_calculators: Dict[Tuple[str, int], IndicatorCalculator] = {}
+
+
 def get_current_indicators(csv_path: str = "data/btc_prices.csv", minutes: int = 15) -> Dict:
     """
     Convenience function to get current indicators.
@@ -282,7 +623,10 @@ def get_current_indicators(csv_path: str = "data/btc_prices.csv", minutes: int =
         signals = get_current_indicators(minutes=30)  # For 30-min mode
         print(signals['rsi_14'], signals['vwap_deviation_pct'])
     """
-    calc = IndicatorCalculator(csv_path)
+    key = (csv_path, minutes)
+    calc = _calculators.get(key)
+    if calc is None:
+        calc = _calculators[key] = IndicatorCalculator(csv_path, minutes)
     if calc.load_data(minutes=minutes):
         return calc.get_all_indicators()
     return {"error": "Failed to load price data"}
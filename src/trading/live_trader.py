@@ -94,6 +94,11 @@ class TradingConfig:
     BTC_15M_CONDITION_ID = None  # Set dynamically or manually
 
 
+# Trade notification lookups (executed trades are always BUY or SELL)
+TRADE_EMOJI = {"BUY": "🟢", "SELL": "🔴"}
+TRADE_DIRECTION = {"BUY": "UP", "SELL": "DOWN"}
+
+
 # =============================================================================
 # TELEGRAM NOTIFICATIONS
 # =============================================================================
@@ -607,18 +612,13 @@ class LiveTradingBot:
     
     def _get_current_interval(self) -> datetime:
         """Get the start of the current interval"""
-        now = datetime.now(timezone.utc)
-        interval = self.interval_minutes
-        return now.replace(
-            minute=(now.minute // interval) * interval,
-            second=0,
-            microsecond=0
-        )
+        ts = int(time.time())
+        return datetime.fromtimestamp(ts - ts % (self.interval_minutes * 60), timezone.utc)
     
     def _format_trade_notification(self, signal: Dict, order_result: Dict, size: float) -> str:
         """Format trade notification for Telegram"""
-        emoji = "🟢" if signal["signal"] == "BUY" else "🔴"
-        direction = "UP" if signal["signal"] == "BUY" else "DOWN"
+        emoji = TRADE_EMOJI.get(signal["signal"], "🔴")
+        direction = TRADE_DIRECTION.get(signal["signal"], "DOWN")
         
         ind = signal.get("indicators", {})
         status = self.risk_manager.get_status()
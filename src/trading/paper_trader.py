@@ -4,80 +4,143 @@ paper_trader.py - Paper trading loop for signal validation
 Runs every 15 minutes, generates signals, and tracks hypothetical performance.
 """
 
-import time
-import json
+import asyncio
 import csv
+import time
+from collections import Counter
 from datetime import datetime, timezone, timedelta
+from typing import Optional
 from signal_generator import run_signal_check, format_signal_message
+from csv_log import get_writer
 
 # Configuration
 SIGNAL_INTERVAL_SECONDS = 60  # Check every 60 seconds
+INTERVAL_SECONDS = 15 * 60
 LOG_FILE = "data/paper_trades.csv"
+LOG_FIELDS = (
+    "interval_start", "signal_time", "signal", "confidence", 
+    "position_size_pct", "price", "rsi", "vwap_dev", "momentum",
+    "entry_window_open", "outcome", "pnl"
+)
+
+
+def get_current_interval(ts: Optional[float] = None) -> datetime:
+    """Get the start time of the 15-minute interval containing ts (default: now)."""
+    ts = int(time.time() if ts is None else ts)
+    return datetime.fromtimestamp(ts - ts % INTERVAL_SECONDS, timezone.utc)
 
 
 def get_next_interval_time() -> datetime:
     """Get the start time of the next 15-minute interval."""
-    now = datetime.now(timezone.utc)
-    minutes_to_next = 15 - (now.minute % 15)
-    if minutes_to_next == 15:
-        minutes_to_next = 0
-    next_interval = now.replace(second=0, microsecond=0) + timedelta(minutes=minutes_to_next)
-    return next_interval
+    # Round the current minute up to the next boundary (a boundary minute
+    # counts as the next interval, as before)
+    minute = int(time.time()) // 60 * 60
+    return datetime.fromtimestamp(-(-minute // INTERVAL_SECONDS) * INTERVAL_SECONDS, timezone.utc)
 
 
 def log_paper_trade(signal: dict, interval_start: str):
     """Log a paper trade to CSV."""
-    fieldnames = [
-        "interval_start", "signal_time", "signal", "confidence", 
-        "position_size_pct", "price", "rsi", "vwap_dev", "momentum",
-        "entry_window_open", "outcome", "pnl"
-    ]
+    ind = signal.get("indicators") or {}
+    entry = signal.get("entry_window") or {}
     
-    ind = signal.get("indicators", {})
-    entry = signal.get("entry_window", {})
+    # Same order as LOG_FIELDS
+    row = (
+        interval_start,
+        signal.get("timestamp"),
+        signal.get("signal"),
+        signal.get("confidence"),
+        signal.get("position_size", 0) * 100,
+        ind.get("price"),
+        ind.get("rsi"),
+        ind.get("vwap_deviation_pct"),
+        ind.get("momentum_60s"),
+        entry.get("open"),
+        "",  # outcome - to be filled when interval resolves
+        ""   # pnl - to be filled when interval resolves
+    )
     
-    row = {
-        "interval_start": interval_start,
-        "signal_time": signal.get("timestamp"),
-        "signal": signal.get("signal"),
-        "confidence": signal.get("confidence"),
-        "position_size_pct": signal.get("position_size", 0) * 100,
-        "price": ind.get("price"),
-        "rsi": ind.get("rsi"),
-        "vwap_dev": ind.get("vwap_deviation_pct"),
-        "momentum": ind.get("momentum_60s"),
-        "entry_window_open": entry.get("open"),
-        "outcome": "",  # To be filled when interval resolves
-        "pnl": ""       # To be filled when interval resolves
-    }
+    get_writer(LOG_FILE, LOG_FIELDS).write(row)
+
+
+def get_paper_trading_stats(log_file: str = LOG_FILE) -> dict:
+    """
+    Summarize the paper trade log in a single csv.reader pass.
+    
+    Args:
+        log_file: Path to the paper trade CSV
+    
+    Returns:
+        Dict of signal counts, total position size and first/last signal
+        times, or an empty dict if there is nothing logged yet
+    """
+    get_writer(log_file, LOG_FIELDS).flush()
     
     try:
-        with open(LOG_FILE, 'r') as f:
-            pass
-        write_header = False
+        with open(log_file, newline="") as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if header is None:
+                return {}
+            time_col = header.index("signal_time")
+            signal_col = header.index("signal")
+            confidence_col = header.index("confidence")
+            size_col = header.index("position_size_pct")
+            
+            signals = Counter()
+            high_confidence = 0
+            total_position_pct = 0.0
+            first_signal = last_signal = None
+            for row in reader:
+                if not row:
+                    continue
+                signals[row[signal_col]] += 1
+                high_confidence += row[confidence_col] == "HIGH"
+                try:
+                    total_position_pct += float(row[size_col])
+                except ValueError:
+                    pass
+                if first_signal is None:
+                    first_signal = row[time_col]
+                last_signal = row[time_col]
     except FileNotFoundError:
-        write_header = True
+        return {}
     
-    with open(LOG_FILE, 'a', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        if write_header:
-            writer.writeheader()
-        writer.writerow(row)
+    if first_signal is None:
+        return {}
+    
+    return {
+        "total_signals": sum(signals.values()),
+        "buy_signals": signals["BUY"],
+        "sell_signals": signals["SELL"],
+        "hold_signals": signals["HOLD"],
+        "high_confidence": high_confidence,
+        "total_position_pct": total_position_pct,
+        "first_signal": first_signal,
+        "last_signal": last_signal,
+    }
 
 
-def run_paper_trading_loop(duration_hours: float = 24, notify_callback=None):
+async def run_paper_trading_loop(duration_hours: float = 24, notify_callback=None,
+                                 verbose: bool = True):
     """
     Run paper trading for specified duration.
     
+    Signal checks run in a worker thread so the event loop stays free for
+    other I/O while the CSV is read and indicators are computed.
+    
     Args:
         duration_hours: How long to run
-        notify_callback: Optional function to call with signal messages
+        notify_callback: Optional function (or coroutine function, e.g.
+            TelegramNotifier.send_async) to call with signal messages
+        verbose: Print progress; when False no messages are formatted unless
+            notify_callback needs one
     """
-    print(f"\n{'='*60}")
-    print(f"🚀 PAPER TRADING STARTED")
-    print(f"Duration: {duration_hours} hours")
-    print(f"Logging to: {LOG_FILE}")
-    print(f"{'='*60}\n")
+    if verbose:
+        print(f"\n{'='*60}")
+        print(f"🚀 PAPER TRADING STARTED")
+        print(f"Duration: {duration_hours} hours")
+        print(f"Logging to: {LOG_FILE}")
+        print(f"{'='*60}\n")
     
     start_time = datetime.now(timezone.utc)
     end_time = start_time + timedelta(hours=duration_hours)
@@ -87,44 +150,51 @@ def run_paper_trading_loop(duration_hours: float = 24, notify_callback=None):
     
     while datetime.now(timezone.utc) < end_time:
         now = datetime.now(timezone.utc)
-        current_interval = now.replace(minute=(now.minute // 15) * 15, second=0, microsecond=0)
+        current_interval = get_current_interval(now.timestamp())
         current_minute_in_interval = now.minute % 15
         
         # Generate signal once per interval, during optimal window (minutes 2-10)
         if current_interval != last_signal_interval and 2 <= current_minute_in_interval <= 10:
-            print(f"\n[{now.strftime('%H:%M:%S')}] Generating signal for interval {current_interval.strftime('%H:%M')}")
-            
-            signal = run_signal_check()
+            signal = await asyncio.to_thread(run_signal_check)
             signals_generated += 1
             
-            # Format and print
-            msg = format_signal_message(signal)
-            print(msg)
-            
-            # Log paper trade
-            log_paper_trade(signal, current_interval.isoformat())
+            last_signal_interval = current_interval
             
-            # Notify if callback provided
-            if notify_callback and signal.get("signal") != "HOLD":
-                notify_callback(msg)
+            notify = notify_callback is not None and signal.get("signal") != "HOLD"
+            msg = format_signal_message(signal) if verbose or notify else None
             
-            last_signal_interval = current_interval
+            # Log the paper trade and send the notification concurrently -
+            # the disk write and the HTTP round trip are independent
+            io_tasks = [asyncio.to_thread(log_paper_trade, signal, current_interval.isoformat())]
+            if notify:
+                if asyncio.iscoroutinefunction(notify_callback):
+                    io_tasks.append(notify_callback(msg))
+                else:
+                    io_tasks.append(asyncio.to_thread(notify_callback, msg))
+            await asyncio.gather(*io_tasks)
             
-            # Status
-            elapsed = (now - start_time).total_seconds() / 3600
-            remaining = (end_time - now).total_seconds() / 3600
-            print(f"\n📊 Status: {signals_generated} signals | {elapsed:.1f}h elapsed | {remaining:.1f}h remaining")
+            if verbose:
+                elapsed = (now - start_time).total_seconds() / 3600
+                remaining = (end_time - now).total_seconds() / 3600
+                print(f"\n[{now.strftime('%H:%M:%S')}] Signal for interval {current_interval.strftime('%H:%M')}")
+                print(msg)
+                print(f"\n📊 Status: {signals_generated} signals | {elapsed:.1f}h elapsed | {remaining:.1f}h remaining")
         
         # Sleep before next check
-        time.sleep(SIGNAL_INTERVAL_SECONDS)
+        await asyncio.sleep(SIGNAL_INTERVAL_SECONDS)
     
-    print(f"\n{'='*60}")
-    print(f"✅ PAPER TRADING COMPLETE")
-    print(f"Total signals: {signals_generated}")
-    print(f"Log file: {LOG_FILE}")
-    print(f"{'='*60}")
+    if verbose:
+        print(f"\n{'='*60}")
+        print(f"✅ PAPER TRADING COMPLETE")
+        print(f"Total signals: {signals_generated}")
+        stats = get_paper_trading_stats()
+        if stats:
+            print(f"Logged: {stats['buy_signals']} BUY | {stats['sell_signals']} SELL | "
+                  f"{stats['hold_signals']} HOLD | {stats['high_confidence']} HIGH confidence")
+        print(f"Log file: {LOG_FILE}")
+        print(f"{'='*60}")
 
 
 if __name__ == "__main__":
     # Run for 1 hour as a test (change to 24 for overnight)
-    run_paper_trading_loop(duration_hours=1)
+    asyncio.run(run_paper_trading_loop(duration_hours=1))
@@ -25,6 +25,12 @@ SENTIMENT_WEIGHTS = {
     "on_chain": 0.1
 }
 
+SENTIMENT_EMOJI = {
+    "BULLISH": "🟢",
+    "BEARISH": "🔴",
+    "NEUTRAL": "⚪"
+}
+
 FEAR_GREED_THRESHOLDS = {
     "extreme_fear": 25,
     "fear": 45,
@@ -361,13 +367,7 @@ def format_sentiment_message(sentiment: Dict) -> str:
     score = agg.get("aggregate_score", 0.0)
     direction = agg.get("direction", "NEUTRAL")
     
-    emoji_map = {
-        "BULLISH": "🟢",
-        "BEARISH": "🔴",
-        "NEUTRAL": "⚪"
-    }
-    
-    emoji = emoji_map.get(direction, "❓")
+    emoji = SENTIMENT_EMOJI.get(direction, "❓")
     
     components = agg.get("components", {})
     fg = sentiment.get("fear_greed", {})
@@ -10,16 +10,17 @@ Generates BUY (Up), SELL (Down), or HOLD signals based on:
 Supports both 15-minute and 30-minute trading intervals.
 """
 
-import json
-import csv
-from datetime import datetime, timezone, timedelta
+import atexit
+from datetime import datetime, timezone
 from typing import Dict, Optional, Tuple
 
 # Try relative import first, then absolute
 try:
     from .indicators import get_current_indicators
+    from .csv_log import get_writer
 except ImportError:
     from indicators import get_current_indicators
+    from csv_log import get_writer
 
 # Configuration
 VWAP_THRESHOLD = 0.15  # % deviation required
@@ -37,32 +38,74 @@ MAX_ENTRY_MINUTE_15M = 10  # Don't enter after minute 10
 MIN_ENTRY_MINUTE_30M = 3  # Don't enter before minute 3
 MAX_ENTRY_MINUTE_30M = 20  # Don't enter after minute 20
 
+# Pending HOLD run per signal log: filepath -> [key, first row, count]
+_hold_spans: Dict[str, list] = {}
 
-def get_current_interval_minute(interval_minutes: int = 15) -> int:
+# Last is_entry_window_open result: (minute, interval_minutes, is_open, message)
+_last_window = (-1, 0, False, "")
+
+# Telegram signal message
+_SIGNAL_EMOJI = {
+    "BUY": "🟢",
+    "SELL": "🔴",
+    "HOLD": "⚪"
+}
+
+_SIGNAL_MESSAGE_TEMPLATE = """{emoji} **{signal}** | {confidence} confidence | {interval}-min mode
+
+📊 **Indicators:**
+• Price: ${price:,.2f}
+• RSI: {rsi:.1f}
+• VWAP: {vwap_dev:+.2f}%
+• Momentum: {momentum:+.3f}%
+
+💡 **Reasons:**
+{reasons}
+
+⏰ {timestamp} UTC"""
+
+# Signal log columns
+SIGNAL_LOG_FIELDS = (
+    "timestamp", "signal", "confidence", "position_size",
+    "price", "rsi", "vwap_deviation_pct", "momentum_60s",
+    "data_points", "entry_window_open", "interval_minutes", "reasons"
+)
+
+
+def get_current_interval_minute(interval_minutes: int = 15, now: Optional[datetime] = None) -> int:
     """
     Get the current minute within the specified interval.
     
     Args:
         interval_minutes: 15 or 30 for 15-min or 30-min intervals
+        now: Clock reading to use (default: read the clock)
     
     Returns:
         Current minute within the interval (0 to interval_minutes-1)
     """
-    now = datetime.now(timezone.utc)
+    if now is None:
+        now = datetime.now(timezone.utc)
     return now.minute % interval_minutes
 
 
-def is_entry_window_open(interval_minutes: int = 15) -> Tuple[bool, str]:
+def is_entry_window_open(interval_minutes: int = 15, now: Optional[datetime] = None) -> Tuple[bool, str]:
     """
     Check if we're in the valid entry window.
     
     Args:
         interval_minutes: 15 or 30 for 15-min or 30-min intervals
+        now: Clock reading to use (default: read the clock)
     
     Returns:
         Tuple of (is_open: bool, message: str)
     """
-    minute = get_current_interval_minute(interval_minutes)
+    global _last_window
+    
+    minute = get_current_interval_minute(interval_minutes, now)
+    
+    # Same minute as the last call - the answer can't have changed
+    if _last_window[0] == minute and _last_window[1] == interval_minutes:
+        return _last_window[2], _last_window[3]
     
     if interval_minutes == 15:
         min_entry = MIN_ENTRY_MINUTE_15M
@@ -76,11 +119,14 @@ def is_entry_window_open(interval_minutes: int = 15) -> Tuple[bool, str]:
         return False, f"Invalid interval: {interval_minutes} (must be 15 or 30)"
     
     if minute < min_entry:
-        return False, f"Too early (minute {minute}/{interval_minutes}, wait for minute {min_entry})"
+        is_open, msg = False, f"Too early (minute {minute}/{interval_minutes}, wait for minute {min_entry})"
     elif minute > max_entry:
-        return False, f"Too late (minute {minute}/{interval_minutes}, cutoff was minute {max_entry})"
+        is_open, msg = False, f"Too late (minute {minute}/{interval_minutes}, cutoff was minute {max_entry})"
     else:
-        return True, f"Entry window open ({interval_name}, minute {minute}/{interval_minutes})"
+        is_open, msg = True, f"Entry window open ({interval_name}, minute {minute}/{interval_minutes})"
+    
+    _last_window = (minute, interval_minutes, is_open, msg)
+    return is_open, msg
 
 
 def calculate_confidence(signals_aligned: int, total_signals: int = 3) -> str:
@@ -114,14 +160,22 @@ def get_position_size(confidence: str, base_size: float = 0.10) -> float:
 
 
 def generate_signal(indicators: Dict, smart_money_direction: Optional[str] = None, 
-                   interval_minutes: int = 15) -> Dict:
+                   interval_minutes: int = 15, now: Optional[datetime] = None, *,
+                   _vwap=VWAP_THRESHOLD, _rsi_buy=RSI_BUY_RANGE, _rsi_sell=RSI_SELL_RANGE,
+                   _mom=MOMENTUM_THRESHOLD, _min_data_15m=MIN_DATA_POINTS_15M,
+                   _min_data_30m=MIN_DATA_POINTS_30M) -> Dict:
     """
     Generate trading signal from indicators.
     
+    The underscore keyword arguments bind the module thresholds at definition
+    time so the body reads them as locals; callers shouldn't pass them.
+    
     Args:
         indicators: Dict from get_current_indicators()
         smart_money_direction: Optional 'UP', 'DOWN', or None
         interval_minutes: 15 or 30 for 15-min or 30-min trading intervals
+        now: Clock reading for the timestamp and entry window (default: read
+            the clock once here)
     
     Returns:
         Dict with signal details
@@ -129,8 +183,11 @@ def generate_signal(indicators: Dict, smart_money_direction: Optional[str] = Non
     if interval_minutes not in [15, 30]:
         raise ValueError(f"interval_minutes must be 15 or 30, got {interval_minutes}")
     
+    if now is None:
+        now = datetime.now(timezone.utc)
+    
     result = {
-        "timestamp": datetime.now(timezone.utc).isoformat() + "Z",
+        "timestamp": now.isoformat() + "Z",
         "signal": "HOLD",
         "confidence": "LOW",
         "position_size": 0.0,
@@ -140,27 +197,28 @@ def generate_signal(indicators: Dict, smart_money_direction: Optional[str] = Non
         "error": None,
         "interval_minutes": interval_minutes
     }
+    reasons = result["reasons"]
     
     # Check for errors
     if "error" in indicators:
         result["error"] = indicators["error"]
-        result["reasons"].append(f"Data error: {indicators['error']}")
+        reasons.append(f"Data error: {indicators['error']}")
         return result
     
     # Check data quality
     data_points = indicators.get("data_points", 0)
-    min_required = MIN_DATA_POINTS_15M if interval_minutes == 15 else MIN_DATA_POINTS_30M
+    min_required = _min_data_15m if interval_minutes == 15 else _min_data_30m
     if data_points < min_required:
         result["error"] = f"Insufficient data ({data_points} < {min_required} for {interval_minutes}-min mode)"
-        result["reasons"].append(result["error"])
+        reasons.append(result["error"])
         return result
     
     # Check entry window
-    window_open, window_msg = is_entry_window_open(interval_minutes)
+    window_open, window_msg = is_entry_window_open(interval_minutes, now)
     result["entry_window"] = {"open": window_open, "message": window_msg}
     
     if not window_open:
-        result["reasons"].append(window_msg)
+        reasons.append(window_msg)
         # Don't return early - still calculate signal for paper trading
     
     # Extract indicators
@@ -183,47 +241,47 @@ def generate_signal(indicators: Dict, smart_money_direction: Optional[str] = Non
     
     # Signal 1: VWAP deviation
     if vwap_dev is not None:
-        if vwap_dev > VWAP_THRESHOLD:
+        if vwap_dev > _vwap:
             buy_signals += 1
-            result["reasons"].append(f"Price above VWAP (+{vwap_dev:.2f}%)")
-        elif vwap_dev < -VWAP_THRESHOLD:
+            reasons.append(f"Price above VWAP (+{vwap_dev:.2f}%)")
+        elif vwap_dev < -_vwap:
             sell_signals += 1
-            result["reasons"].append(f"Price below VWAP ({vwap_dev:.2f}%)")
+            reasons.append(f"Price below VWAP ({vwap_dev:.2f}%)")
         else:
-            result["reasons"].append(f"VWAP neutral ({vwap_dev:.2f}%)")
+            reasons.append(f"VWAP neutral ({vwap_dev:.2f}%)")
     
     # Signal 2: RSI
     if rsi is not None:
-        if RSI_BUY_RANGE[0] <= rsi <= RSI_BUY_RANGE[1]:
+        if _rsi_buy[0] <= rsi <= _rsi_buy[1]:
             buy_signals += 1
-            result["reasons"].append(f"RSI bullish ({rsi:.1f})")
-        elif RSI_SELL_RANGE[0] <= rsi <= RSI_SELL_RANGE[1]:
+            reasons.append(f"RSI bullish ({rsi:.1f})")
+        elif _rsi_sell[0] <= rsi <= _rsi_sell[1]:
             sell_signals += 1
-            result["reasons"].append(f"RSI bearish ({rsi:.1f})")
-        elif rsi > RSI_BUY_RANGE[1]:
-            result["reasons"].append(f"RSI overbought ({rsi:.1f}) - caution")
-        elif rsi < RSI_SELL_RANGE[0]:
-            result["reasons"].append(f"RSI oversold ({rsi:.1f}) - caution")
+            reasons.append(f"RSI bearish ({rsi:.1f})")
+        elif rsi > _rsi_buy[1]:
+            reasons.append(f"RSI overbought ({rsi:.1f}) - caution")
+        elif rsi < _rsi_sell[0]:
+            reasons.append(f"RSI oversold ({rsi:.1f}) - caution")
     
     # Signal 3: Momentum
     if momentum is not None:
-        if momentum > MOMENTUM_THRESHOLD:
+        if momentum > _mom:
             buy_signals += 1
-            result["reasons"].append(f"Momentum positive (+{momentum:.3f}%)")
-        elif momentum < -MOMENTUM_THRESHOLD:
+            reasons.append(f"Momentum positive (+{momentum:.3f}%)")
+        elif momentum < -_mom:
             sell_signals += 1
-            result["reasons"].append(f"Momentum negative ({momentum:.3f}%)")
+            reasons.append(f"Momentum negative ({momentum:.3f}%)")
         else:
-            result["reasons"].append(f"Momentum flat ({momentum:.3f}%)")
+            reasons.append(f"Momentum flat ({momentum:.3f}%)")
     
     # Signal 4: Smart money (if available)
     if smart_money_direction:
         if smart_money_direction == 'UP':
             buy_signals += 1
-            result["reasons"].append("Smart money: UP")
+            reasons.append("Smart money: UP")
         elif smart_money_direction == 'DOWN':
             sell_signals += 1
-            result["reasons"].append("Smart money: DOWN")
+            reasons.append("Smart money: DOWN")
     
     # Determine final signal
     total_signals = 3  # VWAP, RSI, Momentum (smart money is bonus)
@@ -240,94 +298,102 @@ def generate_signal(indicators: Dict, smart_money_direction: Optional[str] = Non
         result["signal"] = "HOLD"
         result["confidence"] = "LOW"
         result["position_size"] = 0.0
-        result["reasons"].append(f"Mixed signals: {buy_signals} buy, {sell_signals} sell")
+        reasons.append(f"Mixed signals: {buy_signals} buy, {sell_signals} sell")
     
     # Override if entry window closed
     if not window_open and result["signal"] != "HOLD":
         result["signal"] = "HOLD"
         result["position_size"] = 0.0
-        result["reasons"].append("Signal generated but entry window closed")
+        reasons.append("Signal generated but entry window closed")
     
     return result
 
 
 def format_signal_message(signal: Dict) -> str:
     """Format signal for Telegram notification."""
-    timestamp = signal.get("timestamp", "")[:19].replace("T", " ")
-    interval = signal.get("interval_minutes", 15)
-    
-    emoji_map = {
-        "BUY": "🟢",
-        "SELL": "🔴", 
-        "HOLD": "⚪"
-    }
+    ind = signal.get("indicators", {})
     
-    emoji = emoji_map.get(signal["signal"], "❓")
+    msg = _SIGNAL_MESSAGE_TEMPLATE.format_map({
+        "emoji": _SIGNAL_EMOJI.get(signal["signal"], "❓"),
+        "signal": signal["signal"],
+        "confidence": signal["confidence"],
+        "interval": signal.get("interval_minutes", 15),
+        "price": ind.get("price", 0),
+        "rsi": ind.get("rsi", 0),
+        "vwap_dev": ind.get("vwap_deviation_pct", 0),
+        "momentum": ind.get("momentum_60s", 0),
+        "reasons": "\n".join("• " + r for r in signal.get("reasons", [])),
+        "timestamp": signal.get("timestamp", "")[:19].replace("T", " "),
+    })
     
-    ind = signal.get("indicators", {})
-    price = ind.get("price", 0)
-    rsi = ind.get("rsi", 0)
-    vwap_dev = ind.get("vwap_deviation_pct", 0)
-    momentum = ind.get("momentum_60s", 0)
+    if signal.get("error"):
+        msg += f"\n⚠️ Error: {signal['error']}"
     
-    msg = f"""{emoji} **{signal['signal']}** | {signal['confidence']} confidence | {interval}-min mode
+    return msg
 
-📊 **Indicators:**
-• Price: ${price:,.2f}
-• RSI: {rsi:.1f}
-• VWAP: {vwap_dev:+.2f}%
-• Momentum: {momentum:+.3f}%
 
-💡 **Reasons:**
-{chr(10).join('• ' + r for r in signal.get('reasons', []))}
+def _flush_hold_span(filepath: str):
+    """Write the pending HOLD row for a log file, tagged with its repeat count."""
+    span = _hold_spans.pop(filepath, None)
+    if span is None:
+        return
+    _, row, count = span
+    if count > 1:
+        row = row[:-1] + (f"{row[-1]}; HOLD x{count}",)
+    get_writer(filepath, SIGNAL_LOG_FIELDS).write(row)
 
-⏰ {timestamp} UTC"""
 
-    if signal.get("error"):
-        msg += f"\n⚠️ Error: {signal['error']}"
-    
-    return msg
+def _flush_all_hold_spans():
+    """Write every pending HOLD row (used at exit)."""
+    for filepath in list(_hold_spans):
+        _flush_hold_span(filepath)
+
+
+# Registered after csv_log's close_all, so runs before it at exit
+atexit.register(_flush_all_hold_spans)
 
 
 def log_signal(signal: Dict, filepath: str = "data/signals.csv"):
-    """Append signal to CSV log."""
-    fieldnames = [
-        "timestamp", "signal", "confidence", "position_size",
-        "price", "rsi", "vwap_deviation_pct", "momentum_60s",
-        "data_points", "entry_window_open", "interval_minutes", "reasons"
-    ]
-    
-    ind = signal.get("indicators", {})
-    entry = signal.get("entry_window", {})
-    
-    row = {
-        "timestamp": signal.get("timestamp"),
-        "signal": signal.get("signal"),
-        "confidence": signal.get("confidence"),
-        "position_size": signal.get("position_size"),
-        "price": ind.get("price"),
-        "rsi": ind.get("rsi"),
-        "vwap_deviation_pct": ind.get("vwap_deviation_pct"),
-        "momentum_60s": ind.get("momentum_60s"),
-        "data_points": ind.get("data_points"),
-        "entry_window_open": entry.get("open"),
-        "interval_minutes": signal.get("interval_minutes", 15),
-        "reasons": "; ".join(signal.get("reasons", []))
-    }
-    
-    # Check if file exists and write header if needed
-    try:
-        with open(filepath, 'r') as f:
-            pass
-        write_header = False
-    except FileNotFoundError:
-        write_header = True
+    """
+    Append signal to CSV log.
     
-    with open(filepath, 'a', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        if write_header:
-            writer.writeheader()
-        writer.writerow(row)
+    Consecutive HOLDs with the same confidence in the same interval are
+    collapsed into one row (the first), written when the run ends with
+    "; HOLD xN" appended to its reasons.
+    """
+    ind = signal.get("indicators") or {}
+    entry = signal.get("entry_window") or {}
+    
+    # Same order as SIGNAL_LOG_FIELDS
+    row = (
+        signal.get("timestamp"),
+        signal.get("signal"),
+        signal.get("confidence"),
+        signal.get("position_size"),
+        ind.get("price"),
+        ind.get("rsi"),
+        ind.get("vwap_deviation_pct"),
+        ind.get("momentum_60s"),
+        ind.get("data_points"),
+        entry.get("open"),
+        signal.get("interval_minutes", 15),
+        "; ".join(signal.get("reasons", []))
+    )
+    
+    if signal.get("signal") == "HOLD":
+        ts = signal.get("timestamp") or ""
+        interval = signal.get("interval_minutes", 15)
+        key = (signal.get("confidence"), interval, ts[:13], int(ts[14:16] or 0) // interval)
+        span = _hold_spans.get(filepath)
+        if span is not None and span[0] == key:
+            span[2] += 1
+            return
+        _flush_hold_span(filepath)
+        _hold_spans[filepath] = [key, row, 1]
+        return
+    
+    _flush_hold_span(filepath)
+    get_writer(filepath, SIGNAL_LOG_FIELDS).write(row)
 
 
 def run_signal_check(csv_path: str = "data/btc_prices.csv", log_path: str = "data/signals.csv",
@@ -349,8 +415,9 @@ def run_signal_check(csv_path: str = "data/btc_prices.csv", log_path: str = "dat
     # Get indicators (load data for the appropriate window)
     indicators = get_current_indicators(csv_path, minutes=interval_minutes)
     
-    # Generate signal
-    signal = generate_signal(indicators, interval_minutes=interval_minutes)
+    # Generate signal (one clock reading for the whole check)
+    now = datetime.now(timezone.utc)
+    signal = generate_signal(indicators, interval_minutes=interval_minutes, now=now)
     
     # Log it
     log_signal(signal, log_path)
@@ -360,6 +427,7 @@ def run_signal_check(csv_path: str = "data/btc_prices.csv", log_path: str = "dat
 
 # Test
 if __name__ == "__main__":
+    import json
     import sys
     
     # Check for interval argument
@@ -0,0 +1,19 @@
+"""
+fast_json.py - JSON encode/decode shared by the API clients
+
+orjson is several times faster than stdlib json and is used when installed.
+Both accept bytes, and both raise a json.JSONDecodeError subclass on bad
+input. json_dumps always returns bytes.
+"""
+
+import json
+
+try:
+    from orjson import loads as json_loads, dumps as json_dumps
+    ORJSON_AVAILABLE = True
+except ImportError:
+    from json import loads as json_loads
+    ORJSON_AVAILABLE = False
+    
+    def json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
@@ -0,0 +1,33 @@
+"""
+ttl_cache.py - Time-based memoization for API fetchers
+"""
+
+import copy
+import functools
+import time
+
+
+def ttl_cache(ttl: float):
+    """
+    Reuse a function's last non-empty result per argument set for `ttl` seconds.
+    
+    Empty or None results (failed fetches) are never cached. Callers get a
+    shallow copy, so mutating a returned dict or list doesn't touch the cache.
+    """
+    def decorator(func):
+        cache = {}  # (args, kwargs) -> (expires_at, result)
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+            hit = cache.get(key)
+            if hit is not None and now < hit[0]:
+                return copy.copy(hit[1])
+            result = func(*args, **kwargs)
+            if result:
+                cache[key] = (now + ttl, result)
+                return copy.copy(result)
+            return result
+        return wrapper
+    return decorator
@@ -14,7 +14,7 @@ import sys
 import subprocess
 import asyncio
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timezone
 import csv
 from decouple import config
 from telegram import Bot, Update
@@ -25,6 +25,12 @@ BOT_PID_FILE = PROJECT_ROOT / "bot.pid"
 LOG_DIR = PROJECT_ROOT / "logs"
 TRADES_FILE = PROJECT_ROOT / "data" / "live_trades.csv"
 
+def _parse_utc_iso(s):
+    """Parse an ISO timestamp, treating a trailing "Z" as UTC without rewriting the string."""
+    if s.endswith('Z'):
+        return datetime.fromisoformat(s[:-1]).replace(tzinfo=timezone.utc)
+    return datetime.fromisoformat(s)
+
 def check_process():
     """Check if bot process is running and calculate session uptime"""
     if not BOT_PID_FILE.exists():
@@ -168,7 +174,7 @@ def format_status_message():
                 timestamp = trade.get('timestamp', 'N/A')
                 if timestamp != 'N/A':
                     try:
-                        dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+                        dt = _parse_utc_iso(timestamp)
                         time_str = dt.strftime('%H:%M:%S UTC')
                     except:
                         time_str = timestamp[:19]
@@ -248,7 +254,7 @@ async def trades_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
             timestamp = trade.get('timestamp', 'N/A')
             if timestamp != 'N/A':
                 try:
-                    dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+                    dt = _parse_utc_iso(timestamp)
                     time_str = dt.strftime('%Y-%m-%d %H:%M:%S UTC')
                 except:
                     time_str = timestamp[:19]
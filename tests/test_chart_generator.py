@@ -0,0 +1,46 @@
+"""Tests for chart_generator's reusable figures."""
+
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("matplotlib")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src" / "trading"))
+
+import chart_generator  # noqa: E402
+
+
+def _candles(count: int):
+    """Synthetic 15-minute candles with a gentle uptrend."""
+    start = datetime(2024, 1, 1, 0, 0)
+    candles = []
+    for i in range(count):
+        price = 40000 + i * 10
+        candles.append({
+            "timestamp": start + timedelta(minutes=15 * i),
+            "open": price,
+            "high": price + 30,
+            "low": price - 30,
+            "close": price + 5,
+            "volume": 1000 + i,
+        })
+    return candles
+
+
+def _x_limits(fig):
+    return [limit for ax in fig.axes for limit in ax.get_xlim()]
+
+
+def test_reused_figure_matches_fresh_render():
+    chart_generator._figures.clear()
+    fresh = chart_generator.draw_candlestick_chart(_candles(10), "BTC", "15m")
+    expected = _x_limits(fresh)
+
+    # A longer render first leaves wider limits on the shared axes
+    chart_generator.draw_candlestick_chart(_candles(32), "BTC", "15m")
+    reused = chart_generator.draw_candlestick_chart(_candles(10), "BTC", "15m")
+
+    assert reused is fresh
+    assert _x_limits(reused) == pytest.approx(expected)